@@ -4,20 +4,41 @@ Enhanced with premium asset integration and superior performance
 Created by: Vzoel Fox's
 """
 
-from .client import VzoelClient, VzoelClientInstance
-from .loader import VzoelAssistant, PremiumPluginLoader, load_all_plugins
+import importlib
 from utils.assets import emoji, bold, italic
 
 # Premium core initialization message
 print(f"{emoji('utama')} {bold('Premium Core Module')} - {italic('Enhanced Framework Loaded')}")
 
+# Komponen di-import saat pertama diakses (PEP 562), jadi `import core.app`
+# tidak ikut membangun VzoelClient default atau loader lama
+_LAZY_EXPORTS = {
+    "VzoelClient": ".client",
+    "VzoelClientInstance": ".client",
+    "VzoelAssistant": ".loader",
+    "PremiumPluginLoader": ".loader",
+    "load_all_plugins": ".loader",
+    "VzoelApp": ".app",
+    "get_app": ".app",
+}
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 # Export all premium components
 __all__ = [
     "VzoelClient",
     "VzoelClientInstance", 
     "VzoelAssistant",
     "PremiumPluginLoader",
-    "load_all_plugins"
+    "load_all_plugins",
+    "VzoelApp",
+    "get_app"
 ]
 
 # Version and metadata
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+VZOEL ASSISTANT v2 - Application Container
+Config, assets dan client dibuat SEKALI per proses lalu di-inject ke plugins
+Created by: VZLfxs @Lutpan
+
+Dulu helper_client.py melakukan `from main import VzoelAssistant`; kalau bot
+dijalankan via `python main.py`, main.py dieksekusi dua kali (sebagai __main__
+dan sebagai `main`) sehingga config, assets dan suppress_peer_errors dobel.
+Sekarang semua shared state tinggal di module ini; plugin mengaksesnya lewat
+`client.app` atau `get_app()`.
+"""
+
+# =================================================================
+# 1. SYSTEM OPTIMIZATION & CORE IMPORTS
+# =================================================================
+import asyncio
+import logging
+import os
+import sys
+from typing import Dict, Any, Mapping, Optional
+from dotenv import load_dotenv
+
+# Install uvloop for maximum performance (with fallback)
+try:
+    import uvloop
+    uvloop.install()
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    # Don't log warning during import, will log later
+
+# Core Pyrogram imports
+from pyrogram import Client
+from pyrogram.enums import ParseMode
+
+from utils.assets import vzoel_assets
+from utils.error_handler import safe_send_message, suppress_peer_errors
+from utils.startup_profiler import startup_profiler
+from helper_config import ConfigService, ConfigSnapshot, get_config_service
+
+# Lazy plugin loading: plugin command-only di-import saat command pertama dipakai
+LAZY_PLUGINS = os.getenv("LAZY_PLUGINS", "true").lower() in ("1", "true", "yes", "on")
+
+# Global (module, atribut) yang punya aiohttp session sendiri, ditutup saat client stop
+SHARED_HTTP_SESSIONS = (
+    ("helpers.bot_api", "bot_api"),
+    ("plugins.plugin_updater", "plugin_updater"),
+)
+
+# =================================================================
+# 2. SESSION IMPORT HELPER
+# =================================================================
+def load_session_from_file():
+    """Load session string from vzoel_session.txt"""
+    try:
+        if os.path.exists('vzoel_session.txt'):
+            with open('vzoel_session.txt', 'r') as f:
+                session_string = f.read().strip()
+                if session_string:
+                    print("✅ Session string loaded from vzoel_session.txt")
+                    return session_string
+    except Exception as e:
+        print(f"❌ Error loading session file: {e}")
+    return None
+
+# =================================================================
+# 3. CONFIGURATION MANAGEMENT
+# =================================================================
+class VzoelConfig:
+    """Enhanced configuration manager with premium features"""
+    
+    def __init__(self, service: Optional[ConfigService] = None):
+        # Load environment variables first
+        load_dotenv()
+        # Shared config service: parse sekali, reload otomatis saat mtime berubah
+        self.service = service or get_config_service()
+        # Don't validate config here - let it be flexible
+    
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """Current immutable config snapshot"""
+        return self.service.snapshot
+    
+    @property
+    def _config(self) -> Mapping[str, Any]:
+        """Raw config.json (read-only, selalu snapshot terbaru)"""
+        return self.service.snapshot.data
+    
+    def _validate_config(self):
+        """Validate essential configuration - flexible validation"""
+        # Just log warnings, don't raise errors
+        pass
+    
+    @property
+    def api_id(self) -> int:
+        return self._config.get("telegram_api", {}).get("api_id", 29919905)
+    
+    @property
+    def api_hash(self) -> str:
+        return self._config.get("telegram_api", {}).get("api_hash", "717957f0e3ae20a7db004d08b66bfd30")
+    
+    @property
+    def bot_token(self) -> str:
+        return self._config.get("bot_credentials", {}).get("bot_token", "")
+    
+    @property
+    def session_name(self) -> str:
+        return self._config.get("bot_credentials", {}).get("session_name", "vzoel_session")
+    
+    @property
+    def session_string(self) -> Optional[str]:
+        """Get session string from multiple sources"""
+        # Sudah di-resolve saat snapshot dibangun (file -> env -> config),
+        # tidak baca vzoel_session.txt lagi di setiap akses
+        return self.service.snapshot.session_string
+    
+    @property
+    def user_session_string(self) -> Optional[str]:
+        """Get user session string from config or env"""
+        # Try environment first
+        env_session = os.getenv("USER_SESSION_STRING") 
+        if env_session:
+            return env_session
+        # Fall back to config
+        return self._config.get("bot_credentials", {}).get("user_session_string")
+    
+    @property
+    def phone_number(self) -> Optional[str]:
+        """Get phone number from config or env"""
+        # Try environment first
+        env_phone = os.getenv("PHONE_NUMBER")
+        if env_phone:
+            return env_phone
+        # Fall back to config
+        return self._config.get("bot_credentials", {}).get("phone_number")
+    
+    @property
+    def founder_id(self) -> int:
+        return self._config.get("owner_info", {}).get("founder_id", 0)
+    
+    @property
+    def project_info(self) -> Dict[str, Any]:
+        return self._config.get("project_info", {})
+    
+    @property
+    def branding_info(self) -> Dict[str, Any]:
+        return self._config.get("branding_info", {})
+
+# =================================================================
+# 4. ENHANCED CLIENT WITH AUTO SESSION
+# =================================================================
+class VzoelAssistant(Client):
+    """Enhanced Pyrogram client with auto session generation"""
+    
+    def __init__(self, session_string=None, api_id=None, api_hash=None, app=None):
+        # Application container (config + assets dibuat sekali per proses)
+        self.app = app or get_app()
+        config = self.app.config
+
+        # Use provided session or config
+        self.session_string = session_string or config.session_string
+        self.api_id = api_id or config.api_id
+        self.api_hash = api_hash or config.api_hash
+        
+        # Plugin manifest: module eager di-load Pyrogram, sisanya lewat stub lazy
+        self.lazy_loader = None
+        self._lazy_modules = {}
+        plugins_config = {"root": "plugins"}
+        if LAZY_PLUGINS:
+            plugins_config, self._lazy_modules = self._plan_plugins()
+
+        # Determine client initialization parameters
+        client_params = {
+            "name": config.session_name,
+            "api_id": self.api_id,
+            "api_hash": self.api_hash,
+            "plugins": plugins_config,
+            "parse_mode": ParseMode.MARKDOWN
+        }
+        
+        # PURE USERBOT - session string only
+        if not self.session_string:
+            raise ValueError("No session string available - this is a USERBOT, not a BOT")
+        
+        client_params["session_string"] = self.session_string
+        print(f"✅ USERBOT: Using session string authentication for user account")
+        
+        super().__init__(**client_params)
+        
+        # Premium features
+        self.assets = self.app.assets
+        self.config_data = config
+        self.start_time = None
+        
+        # Setup logging dengan premium styling
+        self._setup_logging()
+    
+    def _plan_plugins(self):
+        """Split plugins into eager (loaded now) and lazy (command stubs) from the manifest"""
+        from core.loader.loader_manifest import load_manifest, split_modules
+
+        try:
+            eager_modules, lazy_modules = split_modules(load_manifest("plugins"))
+        except Exception as e:
+            logging.warning(f"Plugin manifest unavailable, loading all plugins: {e}")
+            return {"root": "plugins"}, {}
+
+        if not eager_modules:
+            # include kosong = Pyrogram load semua, jadi matikan loader bawaan
+            return {"root": "plugins", "enabled": False}, lazy_modules
+        return {"root": "plugins", "include": eager_modules}, lazy_modules
+
+    def _setup_logging(self):
+        """Setup enhanced logging with premium styling"""
+        # Create custom filter to reduce peer ID error noise
+        class PeerErrorFilter(logging.Filter):
+            def filter(self, record):
+                message = record.getMessage()
+                # Suppress specific peer ID errors that aren't critical
+                if "Task exception was never retrieved" in message and "Peer id invalid" in message:
+                    return False
+                if "ID not found" in message and "KeyError" in message:
+                    return False
+                return True
+        
+        # Setup logging with filter
+        logging.basicConfig(
+            level=logging.INFO,
+            format=f'%(asctime)s - ✨ %(name)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.StreamHandler(),
+                logging.FileHandler('vzoel_assistant.log')
+            ]
+        )
+        
+        # Add filter to reduce noise
+        peer_filter = PeerErrorFilter()
+        for handler in logging.getLogger().handlers:
+            handler.addFilter(peer_filter)
+    
+    async def start(self):
+        """Enhanced start method with premium welcome"""
+        self.start_time = asyncio.get_event_loop().time()
+        
+        profiler = self.app.profiler
+        with profiler.phase("client.start (connect + eager plugins)"):
+            await super().start()
+
+        # Install lazy command stubs (import plugin asli saat dipakai)
+        if self._lazy_modules:
+            with profiler.phase("lazy plugin stubs"):
+                from core.loader.loader_lazy import LazyPluginLoader
+                self.lazy_loader = LazyPluginLoader(self, self._lazy_modules, root="plugins")
+                self.lazy_loader.install()
+        
+        # Premium startup message
+        me = self.me or await self.get_me()
+        startup_msg = self._get_startup_message(me)
+        
+        print(startup_msg)
+        logging.info("Vzoel Userbot started successfully for user account")
+        
+        # Send startup notification if log group configured
+        try:
+            log_group_id = self.config_data._config.get("logging", {}).get("log_group_id")
+            if log_group_id:
+                # Try to send to log group using safe send
+                await safe_send_message(self, log_group_id, startup_msg)
+        except Exception as e:
+            logging.warning(f"Could not send startup notification: {e}")
+    
+    async def stop(self, *args, **kwargs):
+        """Stop client + tutup resource bersama (session HTTP Bot API, plugin updater)"""
+        # Hanya kalau module-nya pernah dipakai; jangan import aiohttp cuma untuk close
+        for module_name, attribute in SHARED_HTTP_SESSIONS:
+            module = sys.modules.get(module_name)
+            if module is None:
+                continue
+            try:
+                await getattr(module, attribute).close()
+            except Exception as e:
+                logging.warning(f"Could not close {module_name}.{attribute} session: {e}")
+        return await super().stop(*args, **kwargs)
+    
+    def _get_startup_message(self, me) -> str:
+        """Generate premium startup message"""
+        signature = self.assets.vzoel_signature()
+        project_info = self.config_data.project_info
+        branding_info = self.config_data.branding_info
+        
+        startup_lines = [
+            f"{signature}",
+            "",
+            f"👤 **User Account:**",
+            f"  • Name: **{me.first_name}**",
+            f"  • Username: @{me.username}",
+            f"  • ID: `{me.id}`",
+            f"  • Type: **USERBOT** (Personal Account Automation)",
+            "",
+            f"⚡ **Userbot Information:**",
+            f"  • Assistant: **{project_info.get('project_name', 'VZOEL ASSISTANT')}**",
+            f"  • Version: `{project_info.get('version', '1.0.0')}`",
+            f"  • Mode: _{project_info.get('description', 'Personal Account Assistant')}_",
+            "",
+            f"🔥 **Automation Status:**",
+            f"  • Performance: **{'uvloop Optimized' if UVLOOP_AVAILABLE else 'Standard Event Loop'}**",
+            f"  • Features: **Premium Collection Active**",
+            f"  • Commands: **Ready for Personal Use**",
+            "",
+            f"🚀 **Personal Assistant Ready!**",
+            "",
+            f"_{branding_info.get('footer_text', 'Created by VZLfxs @Lutpan')}_"
+        ]
+        
+        return "\n".join(startup_lines)
+    
+    def get_uptime(self) -> str:
+        """Get formatted uptime with premium styling"""
+        if not self.start_time:
+            return "**Not available**"
+        
+        uptime_seconds = int(asyncio.get_event_loop().time() - self.start_time)
+        hours, remainder = divmod(uptime_seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        
+        if hours > 0:
+            return f"**{hours}**h **{minutes}**m **{seconds}**s"
+        elif minutes > 0:
+            return f"**{minutes}**m **{seconds}**s"
+        else:
+            return f"**{seconds}**s"
+
+
+# =================================================================
+# 5. APPLICATION CONTAINER
+# =================================================================
+class VzoelApp:
+    """
+    Application container - satu instance per proses:
+    - config: VzoelConfig (parse config.json sekali)
+    - assets: VzoelAssets (load font/emoji JSON sekali)
+    - client: VzoelAssistant aktif (di-set oleh create_client)
+    - profiler: StartupProfiler untuk --startup-report
+    """
+
+    def __init__(self):
+        with startup_profiler.phase("app container (config + assets)"):
+            # Load environment variables first
+            load_dotenv()
+            self.config = VzoelConfig()
+            self.assets = vzoel_assets
+
+            # Setup global error handling (sekali saja)
+            suppress_peer_errors()
+
+        self.client: Optional["VzoelAssistant"] = None
+        self.profiler = startup_profiler
+
+    def create_client(self, session_string=None, api_id=None, api_hash=None) -> "VzoelAssistant":
+        """Create the userbot client bound to this container"""
+        with self.profiler.phase("client init (manifest + Client)"):
+            self.client = VzoelAssistant(session_string, api_id, api_hash, app=self)
+        return self.client
+
+
+_app: Optional[VzoelApp] = None
+
+
+def get_app() -> VzoelApp:
+    """Return the process-wide application container (dibuat saat pertama dipanggil)"""
+    global _app
+    if _app is None:
+        _app = VzoelApp()
+    return _app
@@ -7,10 +7,11 @@ Created by: Vzoel Fox's
 import os
 import json
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
 from pyrogram import Client
 from pyrogram.enums import ParseMode
 from utils.assets import VzoelAssets, vzoel_msg, bold, italic, emoji
+from helper_config import get_config_service
 
 class VzoelClient(Client):
     """
@@ -59,17 +60,14 @@ class VzoelClient(Client):
         # Log initialization success
         self._log_initialization()
     
-    def _load_config(self) -> Dict[str, Any]:
-        """Load configuration dari vzoel/config.json dengan fallback"""
-        try:
-            config_path = os.path.join("vzoel", "config.json")
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                logging.info(f"{emoji('centang')} Configuration loaded from vzoel/config.json")
-                return config
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            logging.warning(f"{emoji('loading')} Config file error: {e}, using environment variables")
-            return {}
+    def _load_config(self) -> Mapping[str, Any]:
+        """Load configuration dari shared ConfigService (snapshot read-only)"""
+        snapshot = get_config_service().snapshot
+        if snapshot.loaded:
+            logging.info(f"{emoji('centang')} Configuration loaded from vzoel/config.json")
+        else:
+            logging.warning(f"{emoji('loading')} Config file not found, using environment variables")
+        return snapshot.data
     
     def _get_api_id(self) -> int:
         """Get API ID dari config atau environment dengan premium error handling"""
@@ -265,11 +263,17 @@ class VzoelClient(Client):
             }
         }
 
-# Create default instance untuk backward compatibility
-# Tapi sekarang dengan premium features
-try:
-    VzoelClientInstance = VzoelClient()
-    logging.info(f"{emoji('centang')} Default VzoelClient instance created successfully")
-except Exception as e:
-    logging.error(f"{emoji('merah')} Failed to create default VzoelClient instance: {e}")
-    VzoelClientInstance = None
\ No newline at end of file
+# Default instance untuk backward compatibility - dibuat saat pertama diakses
+# (PEP 562), bukan saat import, supaya import core.client tidak membangun Client
+def __getattr__(name):
+    global VzoelClientInstance
+    if name != "VzoelClientInstance":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        VzoelClientInstance = VzoelClient()
+        logging.info(f"{emoji('centang')} Default VzoelClient instance created successfully")
+    except Exception as e:
+        logging.error(f"{emoji('merah')} Failed to create default VzoelClient instance: {e}")
+        VzoelClientInstance = None
+    return VzoelClientInstance
\ No newline at end of file
@@ -4,11 +4,36 @@ Enhanced with premium emoji and font system for superior logging experience
 Created by: Vzoel Fox's
 """
 
-from .loader_assistant import VzoelAssistant
-from .loader_plugins import PremiumPluginLoader, load_all_plugins
+import importlib
 from utils.assets import emoji, bold, italic
 
 # Premium initialization message
 print(f"{emoji('petir')} {bold('Premium Core Loader')} - {italic('Ruang Mesin Siap Digunakan')}")
 
-__all__ = ["VzoelAssistant", "PremiumPluginLoader", "load_all_plugins"]
\ No newline at end of file
+# Submodule di-import saat pertama diakses (PEP 562): loader_manifest /
+# loader_lazy dipakai saat startup tanpa ikut import core.client
+_LAZY_EXPORTS = {
+    "VzoelAssistant": ".loader_assistant",
+    "PremiumPluginLoader": ".loader_plugins",
+    "load_all_plugins": ".loader_plugins",
+    "load_manifest": ".loader_manifest",
+    "build_manifest": ".loader_manifest",
+    "split_modules": ".loader_manifest",
+    "LazyPluginLoader": ".loader_lazy",
+    "reload_plugin_module": ".loader_registry",
+    "swap_handlers": ".loader_registry",
+}
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+__all__ = [
+    "VzoelAssistant", "PremiumPluginLoader", "load_all_plugins",
+    "LazyPluginLoader", "load_manifest", "build_manifest", "split_modules",
+    "reload_plugin_module", "swap_handlers"
+]
\ No newline at end of file
@@ -37,7 +37,7 @@ class VzoelAssistant:
             self.bot = VzoelClient()
         
         # Initialize premium plugin loader
-        self.plugin_loader = PremiumPluginLoader(self.assets)
+        self.plugin_loader = PremiumPluginLoader(self.assets, client=self.bot)
         
         # Setup enhanced logging
         self._setup_premium_logging()
@@ -0,0 +1,147 @@
+"""
+Premium Lazy Plugin Loader - Import Plugin Saat Command Pertama Dipakai
+Register stub ringan per module dari manifest, import module asli on-demand
+Created by: Vzoel Fox's
+"""
+
+import asyncio
+import importlib
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from pyrogram import Client, filters
+from pyrogram.handlers.handler import Handler
+from pyrogram.handlers import MessageHandler
+from pyrogram.types import Message
+
+from helper_cmd_handler import COMMAND_PREFIXES
+from .loader_registry import collect_handlers
+
+logger = logging.getLogger(__name__)
+
+# Stub jalan sebelum group 0 plugin; tiap module punya group sendiri
+# supaya stub satu module tidak "menelan" update module lain
+LAZY_GROUP_BASE = -1000
+
+# filters.command() default prefix "/" - selalu ikut dicek
+STUB_PREFIXES = tuple(sorted(set(COMMAND_PREFIXES) | {"/"}, key=len, reverse=True))
+
+
+def _extract_command(text: str) -> Optional[str]:
+    """Ambil nama command dari text (aman untuk prefix tanpa command)"""
+    for prefix in STUB_PREFIXES:
+        if prefix and text.startswith(prefix):
+            body = text[len(prefix):].split(maxsplit=1)
+            if not body:
+                return None
+            return body[0].split("@", 1)[0].lower()
+    return None
+
+
+class _LazyModule:
+    """State satu module lazy (belum di-import / sudah di-import)"""
+
+    __slots__ = ("name", "commands", "group", "lock", "module", "handlers", "stub")
+
+    def __init__(self, name: str, commands: List[str], group: int):
+        self.name = name
+        self.commands = frozenset(commands)
+        self.group = group
+        self.lock = asyncio.Lock()
+        self.module = None
+        self.handlers: List[Tuple[Handler, int]] = []
+        self.stub: Optional[MessageHandler] = None
+
+
+class LazyPluginLoader:
+    """
+    Lazy Plugin Loader:
+    - Satu stub MessageHandler per module, filter cuma cek set command (O(1))
+    - Import module asli di bawah lock per module saat command pertama masuk
+    - Handler asli di-add ke dispatcher, stub di-remove
+    - Update pemicu langsung diteruskan ke handler asli (tidak hilang)
+    """
+
+    def __init__(self, client: Client, lazy_modules: Dict[str, List[str]], root: str = "plugins"):
+        self.client = client
+        self.root = root
+        self.modules: Dict[str, _LazyModule] = {}
+
+        for index, (name, commands) in enumerate(sorted(lazy_modules.items())):
+            self.modules[name] = _LazyModule(name, commands, LAZY_GROUP_BASE + index)
+
+    def install(self) -> int:
+        """Register semua stub ke dispatcher, return jumlah stub"""
+        for lazy in self.modules.values():
+            lazy.stub = MessageHandler(self._make_callback(lazy), self._make_filter(lazy))
+            self.client.add_handler(lazy.stub, lazy.group)
+        logger.info(f"Lazy plugins: {len(self.modules)} module menunggu command pertama")
+        return len(self.modules)
+
+    @property
+    def loaded_modules(self) -> List[str]:
+        return [name for name, lazy in self.modules.items() if lazy.module is not None]
+
+    @property
+    def pending_modules(self) -> List[str]:
+        return [name for name, lazy in self.modules.items() if lazy.module is None]
+
+    def _make_filter(self, lazy: _LazyModule):
+        commands = lazy.commands
+
+        async def check(_, __, message: Message) -> bool:
+            text = message.text or message.caption
+            if not text:
+                return False
+            return _extract_command(text) in commands
+
+        return filters.create(check, f"LazyStub_{lazy.name}")
+
+    def _make_callback(self, lazy: _LazyModule):
+        async def callback(client: Client, message: Message):
+            await self._ensure_loaded(lazy)
+            if not self._handlers_registered(lazy):
+                # Handler asli baru aktif setelah update ini selesai (dispatcher
+                # lock), jadi update pemicu di-dispatch langsung di sini
+                await self._dispatch(lazy, client, message)
+
+        return callback
+
+    async def _ensure_loaded(self, lazy: _LazyModule) -> None:
+        if lazy.module is not None:
+            return
+        async with lazy.lock:
+            if lazy.module is not None:
+                return
+            module_path = f"{self.root}.{lazy.name}"
+            module = importlib.import_module(module_path)
+
+            handlers = collect_handlers(module)
+
+            for handler, group in handlers:
+                self.client.add_handler(handler, group)
+            self.client.remove_handler(lazy.stub, lazy.group)
+
+            lazy.handlers = handlers
+            lazy.module = module
+            logger.info(f"Lazy plugin '{lazy.name}' dimuat ({len(handlers)} handler)")
+
+    def _handlers_registered(self, lazy: _LazyModule) -> bool:
+        groups = self.client.dispatcher.groups
+        return bool(lazy.handlers) and all(
+            handler in groups.get(group, ()) for handler, group in lazy.handlers
+        )
+
+    async def _dispatch(self, lazy: _LazyModule, client: Client, message: Message) -> None:
+        """Jalankan handler asli dengan semantik dispatcher (satu handler per group)"""
+        by_group: Dict[int, List[Handler]] = {}
+        for handler, group in lazy.handlers:
+            by_group.setdefault(group, []).append(handler)
+
+        for group in sorted(by_group):
+            for handler in by_group[group]:
+                if not isinstance(handler, MessageHandler):
+                    continue
+                if await handler.check(client, message):
+                    await handler.callback(client, message)
+                    break
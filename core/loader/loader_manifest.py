@@ -0,0 +1,322 @@
+"""
+Premium Plugin Manifest - Static Command Index untuk Lazy Loading
+Scan source plugin via AST (tanpa import) dan tulis manifest command -> module
+Manifest yang sama dipakai help system (deskripsi + usage per command)
+Created by: Vzoel Fox's
+"""
+
+import ast
+import json
+import os
+import time
+import logging
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+from utils.atomic_io import atomic_write_json
+
+MANIFEST_VERSION = 2
+DEFAULT_PLUGINS_DIR = "plugins"
+DEFAULT_MANIFEST_PATH = os.path.join("vzoel", "plugins_manifest.json")
+
+# Decorator command helpers yang dikenali (filters.command / vzoel_command)
+COMMAND_FILTER_NAMES = {"command", "vzoel_command"}
+
+# Nama variabel router yang dipakai plugin: `command = get_command(message)`
+ROUTER_VARIABLE_NAMES = {"command", "cmd"}
+
+logger = logging.getLogger(__name__)
+
+
+def _string_values(node: ast.AST) -> List[str]:
+    """Ambil literal string dari Constant / List / Tuple / Set"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return [node.value]
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        values = []
+        for element in node.elts:
+            values.extend(_string_values(element))
+        return values
+    return []
+
+
+def _decorator_kind(decorator: ast.AST) -> Optional[Tuple[str, ast.Call]]:
+    """Return (handler_kind, call) untuk decorator `X.on_<kind>(...)`"""
+    if not isinstance(decorator, ast.Call):
+        return None
+    func = decorator.func
+    if isinstance(func, ast.Attribute) and func.attr.startswith("on_"):
+        return func.attr[3:], decorator
+    return None
+
+
+def _filter_commands(node: ast.AST) -> Set[str]:
+    """Kumpulkan command dari ekspresi filter (filters.command("x") & ...)"""
+    commands = set()
+    for child in ast.walk(node):
+        if not isinstance(child, ast.Call) or not child.args:
+            continue
+        func = child.func
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+        if name in COMMAND_FILTER_NAMES:
+            commands.update(value.lower() for value in _string_values(child.args[0]) if value)
+    return commands
+
+
+def _router_commands(function: ast.AST) -> Set[str]:
+    """Kumpulkan command dari router `if command == "x"` / `command in (...)`"""
+    commands = set()
+    for child in ast.walk(function):
+        if not isinstance(child, ast.Compare) or len(child.ops) != 1:
+            continue
+        left, op, right = child.left, child.ops[0], child.comparators[0]
+        if isinstance(right, ast.Name) and right.id in ROUTER_VARIABLE_NAMES:
+            left, right = right, left
+        if not (isinstance(left, ast.Name) and left.id in ROUTER_VARIABLE_NAMES):
+            continue
+        if isinstance(op, (ast.Eq, ast.In)):
+            commands.update(value.lower() for value in _string_values(right) if value)
+    return commands
+
+
+def _docstring_help(function: Optional[ast.AST], command: str) -> Dict[str, str]:
+    """Deskripsi (baris pertama docstring) dan `Usage:` dari docstring handler"""
+    description, usage = "No description available", f".{command} [arguments]"
+    docstring = ast.get_docstring(function) if function is not None else None
+    if docstring:
+        lines = [line.strip() for line in docstring.splitlines() if line.strip()]
+        usage_lines = [line for line in lines if line.lower().startswith("usage:")]
+        described = [line for line in lines if line not in usage_lines]
+        if described:
+            description = described[0]
+        if usage_lines:
+            usage = usage_lines[0][len("usage:"):].strip() or usage
+    return {"description": description, "usage": usage}
+
+
+def _called_function(body: List[ast.stmt], functions: Dict[str, ast.AST]) -> Optional[ast.AST]:
+    """Function module pertama yang dipanggil di body cabang router"""
+    for statement in body:
+        for child in ast.walk(statement):
+            if isinstance(child, ast.Call) and isinstance(child.func, ast.Name) and child.func.id in functions:
+                return functions[child.func.id]
+    return None
+
+
+def _router_help(function: ast.AST, functions: Dict[str, ast.AST]) -> List[Dict[str, str]]:
+    """Help per command dari cabang `if command == "x": await x_handler(...)`"""
+    entries = []
+    for child in ast.walk(function):
+        if not isinstance(child, ast.If):
+            continue
+        target = _called_function(child.body, functions)
+        for command in sorted(_router_commands(child.test)):
+            entries.append({
+                "command": command,
+                "function": getattr(target, "name", function.name),
+                **_docstring_help(target, command),
+            })
+    return entries
+
+
+def _plugin_version(source: str) -> str:
+    """Version dari baris `version` di 20 baris pertama, default 1.0.0"""
+    for line in source.splitlines()[:20]:
+        if "version" in line.lower() and ("=" in line or ":" in line):
+            for index, char in enumerate(line):
+                if char.isdigit():
+                    return line[index:].split()[0]
+    return "1.0.0"
+
+
+def scan_plugin_source(source: str, filename: str = "<plugin>") -> Dict[str, Any]:
+    """
+    Scan satu file plugin tanpa import
+
+    Returns:
+        Dict berisi commands, jumlah handler per kind, flag eager dan alasannya,
+        plus metadata help (deskripsi module, help per command, premium, version)
+    """
+    tree = ast.parse(source, filename=filename)
+    commands: Set[str] = set()
+    handlers: Dict[str, int] = {}
+    eager_reasons: List[str] = []
+    command_help: Dict[str, Dict[str, str]] = {}
+    functions = {
+        node.name: node for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for decorator in node.decorator_list:
+            found = _decorator_kind(decorator)
+            if not found:
+                continue
+            kind, call = found
+            handlers[kind] = handlers.get(kind, 0) + 1
+
+            if kind != "message":
+                # Callback / member update tidak punya command - harus eager
+                eager_reasons.append(f"on_{kind}")
+                continue
+
+            filter_node = call.args[0] if call.args else None
+            if filter_node is None:
+                for keyword in call.keywords:
+                    if keyword.arg == "filters":
+                        filter_node = keyword.value
+            if filter_node is None:
+                eager_reasons.append("on_message tanpa filter")
+                continue
+
+            filter_commands = _filter_commands(filter_node)
+            found_commands = filter_commands or _router_commands(node)
+            if not found_commands:
+                eager_reasons.append("on_message tanpa command")
+                continue
+            commands.update(found_commands)
+
+            if filter_commands:
+                for command in sorted(filter_commands):
+                    command_help.setdefault(command, {"command": command, "function": node.name,
+                                                      **_docstring_help(node, command)})
+            else:
+                for entry in _router_help(node, functions):
+                    command_help.setdefault(entry["command"], entry)
+
+    docstring = ast.get_docstring(tree) or ""
+    description = " ".join(line.strip() for line in docstring.splitlines()[:9] if line.strip())
+
+    return {
+        "commands": sorted(commands),
+        "handlers": handlers,
+        "eager": bool(eager_reasons) or not handlers,
+        "reason": ", ".join(sorted(set(eager_reasons))) if eager_reasons else ("" if handlers else "tanpa handler"),
+        "description": description or "No description available",
+        "help": [command_help[command] for command in sorted(command_help)],
+        "premium": "premium" in source.lower() or "vzoel_assets" in source,
+        "plugin_version": _plugin_version(source),
+    }
+
+
+def _plugin_files(plugins_dir: str) -> List[str]:
+    """Daftar file plugin (tanpa __init__.py), urut nama"""
+    if not os.path.isdir(plugins_dir):
+        return []
+    return sorted(
+        name for name in os.listdir(plugins_dir)
+        if name.endswith(".py") and name != "__init__.py"
+    )
+
+
+def build_manifest(plugins_dir: str = DEFAULT_PLUGINS_DIR,
+                   previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Build manifest dari source plugin
+
+    Entry yang mtime/size-nya sama dengan manifest sebelumnya dipakai ulang
+    tanpa parse ulang. Manifest versi lain dibuang (field entry bisa beda).
+    """
+    if previous and previous.get("version") != MANIFEST_VERSION:
+        previous = None
+    previous_modules = (previous or {}).get("modules", {})
+    modules: Dict[str, Any] = {}
+
+    for filename in _plugin_files(plugins_dir):
+        module_name = filename[:-3]
+        path = os.path.join(plugins_dir, filename)
+        stat = os.stat(path)
+
+        cached = previous_modules.get(module_name)
+        if cached and cached.get("mtime") == stat.st_mtime and cached.get("size") == stat.st_size:
+            modules[module_name] = cached
+            continue
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = scan_plugin_source(f.read(), filename=path)
+        except (SyntaxError, UnicodeDecodeError) as e:
+            # Plugin rusak tetap di-load eager supaya error-nya kelihatan seperti biasa
+            entry = {"commands": [], "handlers": {}, "eager": True, "reason": f"scan gagal: {e}",
+                     "description": "No description available", "help": [], "premium": False,
+                     "plugin_version": "1.0.0"}
+
+        entry["mtime"] = stat.st_mtime
+        entry["size"] = stat.st_size
+        modules[module_name] = entry
+
+    return {
+        "version": MANIFEST_VERSION,
+        "plugins_dir": plugins_dir,
+        "generated_at": time.time(),
+        "modules": modules,
+    }
+
+
+def is_manifest_fresh(manifest: Optional[Dict[str, Any]], plugins_dir: str = DEFAULT_PLUGINS_DIR) -> bool:
+    """Cek manifest masih cocok dengan file plugin di disk (stat saja, tanpa parse)"""
+    if not manifest or manifest.get("version") != MANIFEST_VERSION:
+        return False
+
+    modules = manifest.get("modules", {})
+    files = _plugin_files(plugins_dir)
+    if set(modules) != {name[:-3] for name in files}:
+        return False
+
+    for filename in files:
+        stat = os.stat(os.path.join(plugins_dir, filename))
+        entry = modules[filename[:-3]]
+        if entry.get("mtime") != stat.st_mtime or entry.get("size") != stat.st_size:
+            return False
+    return True
+
+
+def read_manifest(manifest_path: str = DEFAULT_MANIFEST_PATH) -> Optional[Dict[str, Any]]:
+    """Baca manifest dari disk, None kalau belum ada / rusak"""
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def write_manifest(manifest: Dict[str, Any], manifest_path: str = DEFAULT_MANIFEST_PATH) -> None:
+    """Tulis manifest ke disk (temp file unik + rename, aman untuk writer paralel)"""
+    atomic_write_json(manifest_path, manifest)
+
+
+def load_manifest(plugins_dir: str = DEFAULT_PLUGINS_DIR,
+                  manifest_path: str = DEFAULT_MANIFEST_PATH) -> Dict[str, Any]:
+    """
+    Load manifest, rebuild otomatis kalau stale
+
+    Cold start normal cuma butuh satu json.load + os.stat per plugin.
+    """
+    manifest = read_manifest(manifest_path)
+    if is_manifest_fresh(manifest, plugins_dir):
+        return manifest
+
+    manifest = build_manifest(plugins_dir, previous=manifest)
+    try:
+        write_manifest(manifest, manifest_path)
+    except OSError as e:
+        logger.warning(f"Gagal menulis plugin manifest: {e}")
+    return manifest
+
+
+def split_modules(manifest: Dict[str, Any]) -> Tuple[List[str], Dict[str, List[str]]]:
+    """
+    Pisahkan module eager dan lazy
+
+    Returns:
+        (eager_modules, {lazy_module: [commands]})
+    """
+    eager: List[str] = []
+    lazy: Dict[str, List[str]] = {}
+    for module_name, entry in sorted(manifest.get("modules", {}).items()):
+        if entry.get("eager") or not entry.get("commands"):
+            eager.append(module_name)
+        else:
+            lazy[module_name] = list(entry["commands"])
+    return eager, lazy
@@ -10,6 +10,7 @@ import asyncio
 import logging
 from typing import Dict, List, Any, Optional
 from utils.assets import VzoelAssets, vzoel_msg, bold, italic, emoji
+from .loader_registry import reload_module, schedule_swap
 
 class PremiumPluginLoader:
     """
@@ -20,14 +21,16 @@ class PremiumPluginLoader:
     - Asynchronous loading support
     """
     
-    def __init__(self, assets: Optional[VzoelAssets] = None):
+    def __init__(self, assets: Optional[VzoelAssets] = None, client=None):
         """
         Initialize Premium Plugin Loader
         
         Args:
             assets: VzoelAssets instance untuk premium styling
+            client: Client yang dispatcher-nya di-update saat reload_plugin
         """
         self.assets = assets or VzoelAssets()
+        self.client = client
         self.logger = self._setup_premium_logging()
         self.plugins_dir = "plugins"
         self.loaded_plugins = []
@@ -319,11 +322,10 @@ class PremiumPluginLoader:
             # Remove from failed list if present
             self.failed_plugins = [f for f in self.failed_plugins if f['module'] != module_path]
             
-            # Reload the module
-            if module_path in importlib.sys.modules:
-                importlib.reload(importlib.sys.modules[module_path])
-            else:
-                importlib.import_module(module_path)
+            # Reload the module, handler lama diganti handler baru (tidak dobel)
+            _, old_handlers, new_handlers = reload_module(self.client, module_path)
+            if self.client is not None and (old_handlers or new_handlers):
+                schedule_swap(self.client, old_handlers, new_handlers)
             
             success_msg = f"{emoji('centang')} Plugin {bold(module_path)} reloaded successfully"
             self.logger.info(success_msg)
@@ -0,0 +1,129 @@
+"""
+Premium Handler Registry - Hot Reload Plugin Tanpa Handler Dobel
+Handler lama module di-swap dengan handler baru secara atomik di dispatcher
+Created by: Vzoel Fox's
+"""
+
+import asyncio
+import importlib
+import logging
+import sys
+from collections import OrderedDict
+from typing import List, Optional, Set, Tuple
+
+from pyrogram import Client
+from pyrogram.handlers.handler import Handler
+
+logger = logging.getLogger(__name__)
+
+HandlerList = List[Tuple[Handler, int]]
+
+
+def collect_handlers(module) -> HandlerList:
+    """Handler yang dimiliki module (atribut `.handlers` dari decorator Pyrogram)"""
+    handlers: HandlerList = []
+    seen = set()
+    for name in list(vars(module).keys()):
+        for handler, group in getattr(getattr(module, name, None), "handlers", None) or []:
+            if isinstance(handler, Handler) and isinstance(group, int) and id(handler) not in seen:
+                seen.add(id(handler))
+                handlers.append((handler, group))
+    return handlers
+
+
+def _apply_swap(dispatcher, old: HandlerList, new: HandlerList) -> None:
+    """
+    Bangun groups baru (list baru, bukan mutasi) supaya worker yang sedang
+    iterasi groups lama tidak terganggu; group kosong dibuang
+    """
+    old_ids = {id(handler) for handler, _ in old}
+    groups = {
+        group: [handler for handler in handlers if id(handler) not in old_ids]
+        for group, handlers in dispatcher.groups.items()
+    }
+    for handler, group in new:
+        groups.setdefault(group, []).append(handler)
+    dispatcher.groups = OrderedDict(sorted((group, handlers) for group, handlers in groups.items() if handlers))
+
+
+# Referensi task swap yang sedang jalan (supaya tidak di-GC sebelum selesai)
+_swap_tasks: Set[asyncio.Task] = set()
+
+
+async def swap_handlers(client: Client, old: HandlerList, new: HandlerList) -> None:
+    """
+    Ganti handler lama dengan yang baru di bawah SEMUA lock dispatcher
+    (urutan sama seperti add_handler/remove_handler Pyrogram): update yang
+    sedang diproses versi lama selesai dulu, update berikutnya melihat versi baru.
+    Jangan di-await dari dalam handler (lock worker sendiri ikut ditunggu) ->
+    pakai schedule_swap.
+    """
+    dispatcher = client.dispatcher
+    acquired = []
+    try:
+        for lock in dispatcher.locks_list:
+            await lock.acquire()
+            acquired.append(lock)
+        _apply_swap(dispatcher, old, new)
+    finally:
+        for lock in acquired:
+            lock.release()
+
+
+def _lazy_module(client: Client, module_path: str):
+    lazy_loader = getattr(client, "lazy_loader", None)
+    if lazy_loader is None or not module_path.startswith(f"{lazy_loader.root}."):
+        return None
+    return lazy_loader.modules.get(module_path[len(lazy_loader.root) + 1:])
+
+
+def reload_module(client: Optional[Client], module_path: str) -> Tuple[object, HandlerList, HandlerList]:
+    """
+    Import / reload module, return (module, handler lama, handler baru).
+    Handler lama dikumpulkan SEBELUM reload (reload memakai __dict__ yang sama).
+    Module lazy yang belum dipakai tidak di-swap: stub yang akan register.
+    """
+    module = sys.modules.get(module_path)
+    lazy = _lazy_module(client, module_path) if client is not None else None
+    if lazy is not None and lazy.module is None:
+        if module is not None:
+            importlib.reload(module)
+        return module, [], []
+
+    if module is None:
+        module = importlib.import_module(module_path)
+        old: HandlerList = []
+    else:
+        old = collect_handlers(module)
+        module = importlib.reload(module)
+
+    new = collect_handlers(module)
+    if lazy is not None:
+        lazy.handlers = new
+    return module, old, new
+
+
+def reload_plugin_module(client: Client, module_path: str) -> int:
+    """
+    Reload plugin + jadwalkan swap handler (task terpisah, aman dipanggil dari
+    handler); swap berlaku setelah handler pemanggil selesai.
+    Return jumlah handler module versi baru.
+    """
+    _, old, new = reload_module(client, module_path)
+    if old or new:
+        schedule_swap(client, old, new)
+    logger.info(f"Plugin {module_path} reloaded: {len(old)} handler lama -> {len(new)} handler baru (swap dijadwalkan)")
+    return len(new)
+
+
+def schedule_swap(client: Client, old: HandlerList, new: HandlerList) -> Optional[asyncio.Task]:
+    """Swap dijadwalkan sebagai task terpisah (atau langsung kalau belum ada loop)"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _apply_swap(client.dispatcher, old, new)
+        return None
+    task = loop.create_task(swap_handlers(client, old, new))
+    _swap_tasks.add(task)
+    task.add_done_callback(_swap_tasks.discard)
+    return task
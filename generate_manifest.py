@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+VZOEL ASSISTANT v2 - Plugin Manifest Generator
+Build vzoel/plugins_manifest.json (command -> module) untuk lazy plugin loading
+Created by: Vzoel Fox's
+
+Usage: python3 generate_manifest.py [--check]
+"""
+
+import sys
+
+from core.loader.loader_manifest import (
+    DEFAULT_MANIFEST_PATH, DEFAULT_PLUGINS_DIR,
+    build_manifest, is_manifest_fresh, read_manifest, split_modules, write_manifest
+)
+
+
+def main() -> int:
+    if "--check" in sys.argv:
+        fresh = is_manifest_fresh(read_manifest(DEFAULT_MANIFEST_PATH), DEFAULT_PLUGINS_DIR)
+        print(f"{'✅' if fresh else '❌'} Manifest {'up to date' if fresh else 'stale - run python3 generate_manifest.py'}")
+        return 0 if fresh else 1
+
+    manifest = build_manifest(DEFAULT_PLUGINS_DIR)
+    write_manifest(manifest, DEFAULT_MANIFEST_PATH)
+
+    eager_modules, lazy_modules = split_modules(manifest)
+    print(f"✅ Manifest ditulis ke {DEFAULT_MANIFEST_PATH}")
+    print(f"⚡ Lazy plugins ({len(lazy_modules)}):")
+    for name, commands in lazy_modules.items():
+        print(f"   • {name}: {', '.join(commands)}")
+    print(f"🔥 Eager plugins ({len(eager_modules)}):")
+    for name in eager_modules:
+        print(f"   • {name}: {manifest['modules'][name].get('reason') or '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,13 +10,16 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from main import VzoelAssistant
+    # Import dari application container, BUKAN dari main - `from main import`
+    # bikin main.py dieksekusi dua kali saat bot dijalankan via `python main.py`
+    from core.app import VzoelAssistant, get_app
     # Alias for backward compatibility
     VzoelClient = VzoelAssistant
 except ImportError:
-    # Fallback if main module can't be imported
+    # Fallback if core.app can't be imported
     from pyrogram import Client
     VzoelClient = Client
+    get_app = None
 
 def is_user_mode(client) -> bool:
     """Check if client is running in user mode (not bot)"""
@@ -1,39 +1,266 @@
 """
 Helper module for configuration management
 Provides config access for plugins
+
+Semua pembaca vzoel/config.json (VzoelConfig, core.client, logger, autobot,
+filters) berbagi satu ConfigService: file di-parse sekali, hasilnya snapshot
+immutable dengan set yang sudah dihitung (sudo IDs, blacklist). Reload otomatis
+saat mtime berubah, lalu subscriber dikabari.
 """
 
 import json
+import logging
 import os
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, NamedTuple, Optional
+
+from dotenv import load_dotenv
 
 CONFIG_JSON_PATH = os.path.join("vzoel", "config.json")
+SESSION_FILE_PATH = "vzoel_session.txt"
 
-class ConfigHelper:
-    def __init__(self):
-        self._load_config()
-    
-    def _load_config(self):
+# Minimal jarak antar os.stat() untuk cek perubahan file (detik)
+RELOAD_CHECK_INTERVAL = 2.0
+
+logger = logging.getLogger(__name__)
+
+
+def _freeze(value: Any) -> Any:
+    """Deep-freeze hasil json.load: dict -> MappingProxyType, list -> tuple"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _parse_ids(*sources: Any) -> FrozenSet[int]:
+    """Gabungkan ID dari list config / string env "1,2,3" jadi frozenset[int]"""
+    ids = set()
+    for source in sources:
+        if source is None:
+            continue
+        if isinstance(source, str):
+            source = source.split(",")
+        elif isinstance(source, int):
+            source = [source]
+        for item in source:
+            text = str(item).strip()
+            if text.lstrip("-").isdigit() and int(text) != 0:
+                ids.add(int(text))
+    return frozenset(ids)
+
+
+def _parse_int(*values: Any) -> int:
+    """Nilai numerik pertama dari config / env, 0 kalau tidak ada yang valid"""
+    for value in values:
+        text = str(value).strip() if value is not None else ""
+        if text.lstrip("-").isdigit():
+            return int(text)
+    return 0
+
+
+def _truthy(value: Optional[str]) -> bool:
+    return (value or "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class ConfigSnapshot(NamedTuple):
+    """Immutable view of config.json + env, dibangun sekali per reload"""
+    data: Mapping[str, Any]
+    version: int
+    loaded: bool
+    api_id: int
+    api_hash: str
+    bot_token: str
+    session_name: str
+    session_string: Optional[str]
+    founder_id: int
+    developer_ids: FrozenSet[int]
+    sudo_ids: FrozenSet[int]
+    log_group_id: Optional[int]
+    blacklist_groups: FrozenSet[int]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style access ke config mentah"""
+        return self.data.get(key, default)
+
+
+class ConfigService:
+    """
+    Config service:
+    - Parse config.json + env sekali, simpan sebagai ConfigSnapshot
+    - Cek mtime (config.json dan vzoel_session.txt) maksimal tiap RELOAD_CHECK_INTERVAL
+    - Swap snapshot atomik (satu assignment) lalu notify subscriber
+    """
+
+    def __init__(self, config_path: str = CONFIG_JSON_PATH,
+                 session_path: str = SESSION_FILE_PATH,
+                 check_interval: float = RELOAD_CHECK_INTERVAL):
+        self.config_path = config_path
+        self.session_path = session_path
+        self.check_interval = check_interval
+        self._subscribers: List[Callable[[ConfigSnapshot, ConfigSnapshot], None]] = []
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._next_check = 0.0
+        self._version = 0
+        self._snapshot = self._build(self._read_stamp())
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """Current snapshot; reload kalau file berubah (stat dibatasi interval)"""
+        if time.monotonic() >= self._next_check:
+            self.reload()
+        return self._snapshot
+
+    def subscribe(self, callback: Callable[[ConfigSnapshot, ConfigSnapshot], None]):
+        """Register callback(old, new) yang dipanggil setiap snapshot berganti"""
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def reload(self, force: bool = False) -> bool:
+        """Reload kalau mtime berubah (atau force). Return True kalau snapshot diganti"""
+        with self._lock:
+            self._next_check = time.monotonic() + self.check_interval
+            stamp = self._read_stamp()
+            if not force and stamp == self._stamp:
+                return False
+
+            old = self._snapshot
+            new = self._build(stamp, previous=old)
+            if new is old:
+                return False
+            self._snapshot = new
+
+        for callback in list(self._subscribers):
+            try:
+                callback(old, new)
+            except Exception as e:
+                logger.error(f"Config subscriber {getattr(callback, '__name__', callback)} gagal: {e}")
+        return True
+
+    def _read_stamp(self):
+        stamps = []
+        for path in (self.config_path, self.session_path):
+            try:
+                stat = os.stat(path)
+                stamps.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    def _read_json(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.config_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, OSError) as e:
+            logger.error(f"Failed to load config: {e}")
+            raise
+
+    def _read_session_file(self) -> Optional[str]:
+        try:
+            with open(self.session_path, "r") as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def _build(self, stamp, previous: Optional[ConfigSnapshot] = None) -> Optional[ConfigSnapshot]:
         try:
-            with open(CONFIG_JSON_PATH, 'r', encoding='utf-8') as f:
-                self.data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.data = self._get_default_config()
-    
-    def _get_default_config(self):
-        return {
-            "blacklist": {
-                "groups": []
-            }
-        }
-    
+            raw = self._read_json()
+        except (json.JSONDecodeError, OSError):
+            # File sedang ditulis / rusak: pertahankan snapshot lama
+            if previous is not None:
+                return previous
+            raw = None
+
+        self._stamp = stamp
+        self._version += 1
+        loaded = raw is not None
+        raw = raw or {}
+
+        load_dotenv()
+        telegram_api = raw.get("telegram_api", {})
+        credentials = raw.get("bot_credentials", {})
+        owner = raw.get("owner_info", {})
+
+        session_string = (
+            self._read_session_file()
+            or os.getenv("SESSION_STRING")
+            or credentials.get("session_string")
+            or None
+        )
+
+        # Sudo hanya dari env (FOUNDER_ID, DEVELOPER_IDS, SUDO_USER_IDS);
+        # ID di owner_info config.json ikut hanya kalau SUDO_FROM_CONFIG=1
+        config_sudo = _truthy(os.getenv("SUDO_FROM_CONFIG"))
+        founder_ids = _parse_ids(os.getenv("FOUNDER_ID"), owner.get("founder_id") if config_sudo else None)
+        developer_ids = _parse_ids(os.getenv("DEVELOPER_IDS"), owner.get("developer_ids") if config_sudo else None)
+        sudo_ids = founder_ids | developer_ids | _parse_ids(
+            os.getenv("SUDO_USER_IDS"), owner.get("sudo_user_ids") if config_sudo else None
+        )
+
+        return ConfigSnapshot(
+            data=_freeze(raw),
+            version=self._version,
+            loaded=loaded,
+            api_id=_parse_int(telegram_api.get("api_id"), os.getenv("API_ID")),
+            api_hash=telegram_api.get("api_hash") or os.getenv("API_HASH") or "",
+            bot_token=credentials.get("bot_token") or os.getenv("BOT_TOKEN") or "",
+            session_name=credentials.get("session_name") or "vzoel_session",
+            session_string=session_string,
+            founder_id=_parse_int(owner.get("founder_id"), os.getenv("FOUNDER_ID")),
+            developer_ids=developer_ids,
+            sudo_ids=sudo_ids,
+            log_group_id=raw.get("logging", {}).get("log_group_id"),
+            blacklist_groups=_parse_ids(raw.get("blacklist", {}).get("groups")),
+        )
+
+
+_services: Dict[str, ConfigService] = {}
+
+
+def get_config_service(config_path: str = CONFIG_JSON_PATH) -> ConfigService:
+    """Shared ConfigService per path (semua consumer config.json pakai instance yang sama)"""
+    key = os.path.abspath(config_path)
+    service = _services.get(key)
+    if service is None:
+        service = _services[key] = ConfigService(config_path)
+    return service
+
+
+class ConfigHelper:
+    def __init__(self, service: Optional[ConfigService] = None):
+        self.service = service or get_config_service()
+        self._blacklist = BlacklistConfig(self.service.snapshot)
+        self.service.subscribe(self._on_reload)
+
+    def _on_reload(self, old: ConfigSnapshot, new: ConfigSnapshot):
+        if old.blacklist_groups != new.blacklist_groups:
+            self._blacklist = BlacklistConfig(new)
+
+    @property
+    def data(self) -> Mapping[str, Any]:
+        """Raw config (read-only snapshot)"""
+        return self.service.snapshot.data
+
     @property
     def blacklist(self):
         """Access blacklist configuration"""
-        return BlacklistConfig(self.data.get("blacklist", {"groups": []}))
+        self.service.snapshot  # trigger mtime check
+        return self._blacklist
 
 class BlacklistConfig:
-    def __init__(self, blacklist_data):
-        self.groups = blacklist_data.get("groups", [])
+    def __init__(self, snapshot: ConfigSnapshot):
+        # List mutable untuk kompatibilitas plugin lama (append/remove)
+        self.groups = list(snapshot.data.get("blacklist", {}).get("groups", ()))
 
 # Global config instance
-CONFIG = ConfigHelper()
\ No newline at end of file
+CONFIG = ConfigHelper()
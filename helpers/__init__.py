@@ -4,14 +4,38 @@ Enhanced with premium emoji, font system, and image handling
 Created by: Vzoel Fox's
 """
 
-from .logo_helper import LogoHelper, send_logo_message
-from .image_helper import ImageHelper, process_vzoel_images
-from .format_helper import FormatHelper, premium_format
-from .display_helper import DisplayHelper, create_premium_display
-from utils.assets import emoji, bold, italic
+import importlib
+import multiprocessing
 
-# Premium helpers initialization
-print(f"{emoji('utama')} {bold('Premium Helpers Module')} - {italic('Enhanced Functions Loaded')}")
+# Worker process pool gambar ikut meng-import package ini (unpickle helpers.image_ops.*):
+# banner + utils.assets hanya di proses utama
+if multiprocessing.parent_process() is None:
+    from utils.assets import emoji, bold, italic
+
+    # Premium helpers initialization
+    print(f"{emoji('utama')} {bold('Premium Helpers Module')} - {italic('Enhanced Functions Loaded')}")
+
+# Helper di-import saat pertama diakses (PEP 562): `import helpers.gcast_blacklist`
+# tidak ikut memuat PIL lewat image_helper
+_LAZY_EXPORTS = {
+    "LogoHelper": ".logo_helper",
+    "send_logo_message": ".logo_helper",
+    "ImageHelper": ".image_helper",
+    "process_vzoel_images": ".image_helper",
+    "process_vzoel_images_async": ".image_helper",
+    "FormatHelper": ".format_helper",
+    "premium_format": ".format_helper",
+    "DisplayHelper": ".display_helper",
+    "create_premium_display": ".display_helper",
+}
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 # Export all helper functions
 __all__ = [
@@ -19,6 +43,7 @@ __all__ = [
     "send_logo_message", 
     "ImageHelper",
     "process_vzoel_images",
+    "process_vzoel_images_async",
     "FormatHelper", 
     "premium_format",
     "DisplayHelper",
@@ -10,12 +10,15 @@ import json
 import os
 import random
 import string
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Mapping, Optional, List, Tuple
 from pyrogram import Client
 from pyrogram.types import Message
 from pyrogram.errors import FloodWait, PeerFlood
+from helper_config import get_config_service
+from helpers.job_manager import report_progress
+from helpers.conversation import conversations
+from helpers.bot_api import bot_api
 from datetime import datetime
-import time
 
 try:
     from utils.assets import VzoelAssets, bold, italic, emoji, premium_emoji, vzoel_signature
@@ -41,7 +44,6 @@ class AutonomousBotCreator:
     def __init__(self, user_client: Client, config_path: str = "vzoel/config.json"):
         self.user_client = user_client
         self.config_path = config_path
-        self.config = self.load_config()
         self.botfather_id = 93372553  # @BotFather ID
         
         # Bot creation templates
@@ -57,16 +59,15 @@ class AutonomousBotCreator:
         self.created_bots_file = "autonomous_bots.json"
         self.created_bots = self.load_created_bots()
     
-    def load_config(self) -> Dict[str, Any]:
-        """Load configuration dari file"""
-        try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return {}
-        except Exception as e:
-            log_error(f"Failed to load config: {e}")
-            return {}
+    @property
+    def config(self) -> Mapping[str, Any]:
+        """Config snapshot terbaru (hot reload saat config.json berubah)"""
+        return self.load_config()
+    
+    def load_config(self) -> Mapping[str, Any]:
+        """Load configuration dari shared ConfigService (snapshot read-only)"""
+        snapshot = get_config_service(self.config_path).snapshot
+        return snapshot.data if snapshot.loaded else {}
     
     def load_created_bots(self) -> Dict[str, Any]:
         """Load list created bots"""
@@ -113,24 +114,6 @@ class AutonomousBotCreator:
         
         return username[:32]  # Telegram username limit
     
-    async def wait_for_response(self, timeout: int = 30) -> Optional[Message]:
-        """Wait for BotFather response"""
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            try:
-                # Get recent messages from BotFather
-                async for message in self.user_client.get_chat_history(self.botfather_id, limit=10):
-                    if message.date.timestamp() > start_time - 5:  # Recent message
-                        return message
-                
-                await asyncio.sleep(1)
-            except Exception as e:
-                log_error(f"Error waiting for response: {e}")
-                await asyncio.sleep(2)
-        
-        return None
-    
     async def create_bot_automatically(self, 
                                      bot_name: Optional[str] = None,
                                      bot_username: Optional[str] = None,
@@ -152,52 +135,57 @@ class AutonomousBotCreator:
             if not bot_description:
                 bot_description = f"Autonomous bot created by Vzoel Assistant - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
             
-            # Step 1: Start bot creation process
-            log_info(f"Sending /newbot command to BotFather...")
-            await self.user_client.send_message(self.botfather_id, "/newbot")
-            await asyncio.sleep(2)
-            
-            # Wait for response
-            response = await self.wait_for_response()
-            if not response or "Alright, a new bot" not in response.text:
-                log_error("Failed to start bot creation process")
-                return {"success": False, "error": "Failed to start bot creation"}
-            
-            # Step 2: Send bot name
-            log_info(f"Sending bot name: {bot_name}")
-            await self.user_client.send_message(self.botfather_id, bot_name)
-            await asyncio.sleep(2)
-            
-            # Step 3: Send bot username
-            log_info(f"Sending bot username: {bot_username}")
-            await self.user_client.send_message(self.botfather_id, bot_username)
-            await asyncio.sleep(3)
-            
-            # Wait for final response with token
-            response = await self.wait_for_response(timeout=45)
-            if not response:
-                log_error("No response received from BotFather")
-                return {"success": False, "error": "No response from BotFather"}
-            
-            # Extract token from response
-            token_match = re.search(r'(\d+:[A-Za-z0-9_-]+)', response.text)
-            if not token_match:
-                log_error("Failed to extract bot token from response")
-                log_error(f"BotFather response: {response.text}")
-                return {"success": False, "error": "Failed to extract token", "response": response.text}
-            
-            bot_token = token_match.group(1)
-            
-            # Step 4: Set bot description (optional)
-            try:
-                await self.user_client.send_message(self.botfather_id, "/setdescription")
-                await asyncio.sleep(2)
-                await self.user_client.send_message(self.botfather_id, f"@{bot_username}")
-                await asyncio.sleep(2)
-                await self.user_client.send_message(self.botfather_id, bot_description)
-                await asyncio.sleep(2)
-            except Exception as e:
-                log_warning(f"Failed to set bot description: {e}")
+            async with conversations.open(self.user_client, self.botfather_id) as conv:
+                # Step 1: Start bot creation process
+                log_info(f"Sending /newbot command to BotFather...")
+                report_progress("Sending /newbot")
+                await conv.send("/newbot")
+                
+                response = await conv.get_response()
+                if not response or "Alright, a new bot" not in (response.text or ""):
+                    log_error("Failed to start bot creation process")
+                    return {"success": False, "error": "Failed to start bot creation"}
+                
+                # Step 2: Send bot name
+                log_info(f"Sending bot name: {bot_name}")
+                report_progress(f"Sending name {bot_name}")
+                await conv.send(bot_name)
+                
+                response = await conv.get_response()
+                if not response:
+                    log_error("BotFather did not accept bot name")
+                    return {"success": False, "error": "No response after bot name"}
+                
+                # Step 3: Send bot username
+                log_info(f"Sending bot username: {bot_username}")
+                report_progress(f"Waiting token @{bot_username}")
+                await conv.send(bot_username)
+                
+                # Wait for final response with token
+                response = await conv.get_response(timeout=45)
+                if not response:
+                    log_error("No response received from BotFather")
+                    return {"success": False, "error": "No response from BotFather"}
+                
+                # Extract token from response
+                token_match = re.search(r'(\d+:[A-Za-z0-9_-]+)', response.text or "")
+                if not token_match:
+                    log_error("Failed to extract bot token from response")
+                    log_error(f"BotFather response: {response.text}")
+                    return {"success": False, "error": "Failed to extract token", "response": response.text}
+                
+                bot_token = token_match.group(1)
+                
+                # Step 4: Set bot description (optional)
+                try:
+                    report_progress(f"Setting description @{bot_username}")
+                    for text in ("/setdescription", f"@{bot_username}", bot_description):
+                        await conv.send(text)
+                        if not await conv.get_response(timeout=15):
+                            log_warning(f"No BotFather reply for description step: {text[:20]}")
+                            break
+                except Exception as e:
+                    log_warning(f"Failed to set bot description: {e}")
             
             # Save bot information
             bot_info = {
@@ -241,6 +229,7 @@ class AutonomousBotCreator:
         
         for i in range(count):
             log_info(f"Creating bot {i+1}/{count}...")
+            report_progress(f"Bot {i+1}/{count}")
             
             result = await self.create_bot_automatically()
             results.append(result)
@@ -253,38 +242,35 @@ class AutonomousBotCreator:
             # Delay between creations to avoid flood
             if i < count - 1:  # Don't wait after last bot
                 log_info(f"Waiting {delay} seconds before next bot creation...")
+                report_progress(f"Bot {i+1}/{count} selesai, jeda {delay}s")
                 await asyncio.sleep(delay)
         
         return results
     
     async def test_bot_token(self, token: str) -> Dict[str, Any]:
-        """Test if bot token is valid"""
-        
-        try:
-            # Create temporary client to test token
-            test_client = Client(
-                name="test_bot",
-                api_id=self.config.get("telegram_api", {}).get("api_id"),
-                api_hash=self.config.get("telegram_api", {}).get("api_hash"),
-                bot_token=token
-            )
-            
-            await test_client.start()
-            me = await test_client.get_me()
-            await test_client.stop()
-            
-            return {
-                "valid": True,
-                "bot_id": me.id,
-                "bot_username": me.username,
-                "bot_name": me.first_name
-            }
-            
-        except Exception as e:
-            return {
-                "valid": False,
-                "error": str(e)
-            }
+        """Test if bot token is valid (Bot API getMe, tanpa start Client)"""
+        return await bot_api.get_me(token)
+    
+    async def validate_created_bots(self) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Validasi semua token di autonomous_bots.json sekaligus, update status bot"""
+        bots = [bot for bot in self.created_bots["bots"] if bot.get("token")]
+        results = await bot_api.validate_many(bot["token"] for bot in bots)
+        
+        checked = []
+        changed = False
+        for bot in bots:
+            result = results[bot["token"]]
+            checked.append((bot, result))
+            # Hanya jawaban pasti (ok / 401) yang mengubah status tersimpan
+            if result["valid"] or result.get("error_code") == 401:
+                status = "active" if result["valid"] else "invalid"
+                if bot.get("status") != status:
+                    bot["status"] = status
+                    changed = True
+        
+        if changed:
+            self.save_created_bots()
+        return checked
     
     def get_created_bots_report(self, premium_format: bool = False) -> str:
         """Generate report of created bots dengan premium emoji support"""
@@ -0,0 +1,107 @@
+"""
+Premium Bot API Client - Validasi Token Lewat HTTP getMe
+Satu aiohttp session keep-alive dipakai bersama, hasil di-cache dengan TTL
+Created by: Vzoel Fox's
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, Iterable, Optional
+
+import aiohttp
+
+from utils.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Bisa diarahkan ke Bot API server lokal / stand-in lewat env
+BOT_API_BASE_URL = os.environ.get("VZOEL_BOT_API_URL", "https://api.telegram.org")
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_CACHE_TTL = 600
+DEFAULT_REQUEST_TIMEOUT = 10
+
+
+class BotApiClient:
+    """
+    Bot API client ringan:
+    - Session + connector dibuat sekali (keep-alive), dibatasi `concurrency`
+    - get_me(token) hasilnya sama dengan format test_bot_token lama
+    - Hasil pasti (ok / token ditolak) di-cache `cache_ttl` detik;
+      error jaringan tidak di-cache
+    """
+
+    def __init__(self, base_url: str = BOT_API_BASE_URL, concurrency: int = DEFAULT_CONCURRENCY,
+                 cache_ttl: float = DEFAULT_CACHE_TTL, timeout: float = DEFAULT_REQUEST_TIMEOUT,
+                 cache_size: int = 1024):
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._cache = LRUCache(maxsize=cache_size, ttl=cache_ttl)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._session
+
+    async def get_me(self, token: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Validasi satu token via getMe"""
+        if use_cache:
+            cached = self._cache.get(token)
+            if cached is not None:
+                return cached
+
+        session = self._get_session()
+        try:
+            async with self._semaphore:
+                async with session.get(f"{self.base_url}/bot{token}/getMe") as response:
+                    payload = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            return {"valid": False, "error": str(e) or type(e).__name__}
+
+        if payload.get("ok"):
+            me = payload.get("result", {})
+            result = {
+                "valid": True,
+                "bot_id": me.get("id"),
+                "bot_username": me.get("username"),
+                "bot_name": me.get("first_name")
+            }
+        else:
+            error_code = payload.get("error_code")
+            result = {"valid": False, "error": payload.get("description", "Unknown error"),
+                      "error_code": error_code}
+            # 5xx / 429 bukan jawaban pasti soal token
+            if error_code is None or error_code == 429 or error_code >= 500:
+                return result
+
+        self._cache.set(token, result)
+        return result
+
+    async def validate_many(self, tokens: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Validasi banyak token sekaligus (concurrent, dibatasi semaphore)"""
+        unique = list(dict.fromkeys(token for token in tokens if token))
+        results = await asyncio.gather(*(self.get_me(token) for token in unique))
+        return dict(zip(unique, results))
+
+    def invalidate(self, token: Optional[str] = None) -> None:
+        if token is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(token)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+# Global Bot API client
+bot_api = BotApiClient()
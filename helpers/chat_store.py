@@ -0,0 +1,271 @@
+"""
+Premium Chat Store - Async Per-Chat Key/Value Store di SQLite
+Hanya chat yang aktif di-cache (LRU), chat lain di-load on demand
+Created by: Vzoel Fox's
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import aiosqlite
+
+from utils.cache import LRUCache
+
+CHAT_STORE_DB_PATH = "vzoel_chat_data.db"
+
+logger = logging.getLogger(__name__)
+
+# Penanda delete di antrian tulis
+_DELETE = object()
+
+# Jeda sebelum flush diulang kalau transaksi gagal (mis. database locked / disk penuh)
+FLUSH_RETRY_DELAY = 5.0
+
+
+class ChatStore:
+    """
+    Async key/value store per (namespace, chat_id, key):
+    - Satu row per key -> edit trigger / lock / welcome = satu row, bukan rewrite file
+    - Data per chat di-load sekali lalu di-cache di LRU (hot chats saja)
+    - Mutasi masuk antrian dan di-flush dalam satu transaksi per tick
+    - Migrasi satu kali dari file JSON lama (ditandai di tabel store_meta)
+    """
+
+    def __init__(self, db_path: str = CHAT_STORE_DB_PATH, cache_size: int = 512,
+                 flush_delay: float = 0.05):
+        self.db_path = db_path
+        self.flush_delay = flush_delay
+        self._cache = LRUCache(maxsize=cache_size)
+        self._pending: Dict[Tuple[str, int, str], Any] = {}
+        self._inflight: Dict[Tuple[str, int, str], Any] = {}
+        self._db: Optional[aiosqlite.Connection] = None
+        self._open_lock = asyncio.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._flush_handle: Optional[asyncio.Handle] = None
+        # Referensi task flush otomatis (event loop hanya simpan weakref)
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+    async def _connection(self) -> aiosqlite.Connection:
+        if self._db is not None:
+            return self._db
+        async with self._open_lock:
+            if self._db is None:
+                db = await aiosqlite.connect(self.db_path)
+                await db.execute("PRAGMA journal_mode=WAL")
+                await db.execute("PRAGMA synchronous=NORMAL")
+                await db.execute("""
+                    CREATE TABLE IF NOT EXISTS chat_kv (
+                        namespace TEXT NOT NULL,
+                        chat_id INTEGER NOT NULL,
+                        key TEXT NOT NULL,
+                        value TEXT NOT NULL,
+                        PRIMARY KEY (namespace, chat_id, key)
+                    ) WITHOUT ROWID
+                """)
+                await db.execute("""
+                    CREATE TABLE IF NOT EXISTS store_meta (
+                        name TEXT PRIMARY KEY,
+                        value TEXT
+                    )
+                """)
+                await db.commit()
+                self._db = db
+        return self._db
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    async def get_chat(self, namespace: str, chat_id: int) -> Dict[str, Any]:
+        """
+        Semua key milik chat di namespace ini (dict hasil cache - jangan dimutasi,
+        pakai set()/delete())
+        """
+        cache_key = (namespace, chat_id)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        db = await self._connection()
+        async with db.execute(
+            "SELECT key, value FROM chat_kv WHERE namespace = ? AND chat_id = ?",
+            (namespace, chat_id)
+        ) as cursor:
+            values = {key: json.loads(value) async for key, value in cursor}
+
+        # Overlay mutasi yang belum di-commit (sedang di-flush, lalu yang masih antri)
+        for queue in (self._inflight, self._pending):
+            for (pending_ns, pending_chat, key), value in queue.items():
+                if pending_ns == namespace and pending_chat == chat_id:
+                    if value is _DELETE:
+                        values.pop(key, None)
+                    else:
+                        values[key] = value
+
+        self._cache.set(cache_key, values)
+        return values
+
+    async def get(self, namespace: str, chat_id: int, key: str, default: Any = None) -> Any:
+        return (await self.get_chat(namespace, chat_id)).get(key, default)
+
+    async def chat_ids(self, namespace: str) -> List[int]:
+        """Chat yang punya data di namespace ini"""
+        await self.flush()
+        db = await self._connection()
+        async with db.execute(
+            "SELECT DISTINCT chat_id FROM chat_kv WHERE namespace = ?", (namespace,)
+        ) as cursor:
+            return [row[0] async for row in cursor]
+
+    async def count(self, namespace: str) -> int:
+        await self.flush()
+        db = await self._connection()
+        async with db.execute("SELECT COUNT(*) FROM chat_kv WHERE namespace = ?", (namespace,)) as cursor:
+            row = await cursor.fetchone()
+        return row[0] if row else 0
+
+    # ------------------------------------------------------------------
+    # Writes (batched per tick)
+    # ------------------------------------------------------------------
+    async def set(self, namespace: str, chat_id: int, key: str, value: Any) -> None:
+        chat = await self.get_chat(namespace, chat_id)
+        chat[key] = value
+        self._queue((namespace, chat_id, key), value)
+
+    async def delete(self, namespace: str, chat_id: int, key: str) -> bool:
+        chat = await self.get_chat(namespace, chat_id)
+        if key not in chat:
+            return False
+        del chat[key]
+        self._queue((namespace, chat_id, key), _DELETE)
+        return True
+
+    async def delete_chat(self, namespace: str, chat_id: int) -> int:
+        chat = await self.get_chat(namespace, chat_id)
+        keys = list(chat)
+        for key in keys:
+            del chat[key]
+            self._queue((namespace, chat_id, key), _DELETE)
+        return len(keys)
+
+    def _queue(self, row_key: Tuple[str, int, str], value: Any) -> None:
+        self._pending[row_key] = value
+        self._schedule_flush(self.flush_delay)
+
+    def _schedule_flush(self, delay: float) -> None:
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(delay, self._start_flush)
+
+    def _start_flush(self) -> None:
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self) -> bool:
+        """
+        Tulis semua mutasi tertunda dalam satu transaksi. Return False kalau gagal:
+        row dikembalikan ke antrian dan flush dijadwalkan ulang (tidak raise,
+        flush otomatis jalan sebagai task tanpa pemilik)
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return True
+
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return True
+            self._inflight = pending
+            upserts = [
+                (ns, chat_id, key, json.dumps(value, ensure_ascii=False))
+                for (ns, chat_id, key), value in pending.items() if value is not _DELETE
+            ]
+            deletes = [row_key for row_key, value in pending.items() if value is _DELETE]
+            try:
+                db = await self._connection()
+                if upserts:
+                    await db.executemany(
+                        "INSERT OR REPLACE INTO chat_kv (namespace, chat_id, key, value) VALUES (?, ?, ?, ?)",
+                        upserts
+                    )
+                if deletes:
+                    await db.executemany(
+                        "DELETE FROM chat_kv WHERE namespace = ? AND chat_id = ? AND key = ?",
+                        deletes
+                    )
+                await db.commit()
+                return True
+            except Exception as e:
+                logger.error(f"Chat store flush gagal ({len(pending)} row), diulang {FLUSH_RETRY_DELAY:g}s lagi: {e}")
+                if self._db is not None:
+                    try:
+                        await self._db.rollback()
+                    except Exception:
+                        pass
+                # Kembalikan ke antrian, mutasi lebih baru tetap menang
+                for row_key, value in pending.items():
+                    self._pending.setdefault(row_key, value)
+                self._schedule_flush(FLUSH_RETRY_DELAY)
+                return False
+            finally:
+                self._inflight = {}
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+
+    # ------------------------------------------------------------------
+    # One-time JSON migration
+    # ------------------------------------------------------------------
+    async def migrate_json(self, name: str, json_path: str,
+                           convert: Callable[[Dict[str, Any]], Iterable[Tuple[str, int, str, Any]]]) -> int:
+        """
+        Import file JSON lama sekali saja.
+
+        Args:
+            name: nama migrasi (disimpan di store_meta)
+            json_path: file JSON lama
+            convert: fungsi data -> iterable (namespace, chat_id, key, value)
+        """
+        db = await self._connection()
+        async with db.execute("SELECT 1 FROM store_meta WHERE name = ?", (f"migrated:{name}",)) as cursor:
+            if await cursor.fetchone():
+                return 0
+
+        rows = []
+        if os.path.exists(json_path):
+            try:
+                with open(json_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                rows = [
+                    (ns, int(chat_id), str(key), json.dumps(value, ensure_ascii=False))
+                    for ns, chat_id, key, value in convert(data)
+                ]
+            except Exception as e:
+                logger.error(f"Migrasi {json_path} gagal, file lama dibiarkan: {e}")
+                return 0
+
+        await db.executemany(
+            "INSERT OR IGNORE INTO chat_kv (namespace, chat_id, key, value) VALUES (?, ?, ?, ?)", rows
+        )
+        await db.execute(
+            "INSERT OR REPLACE INTO store_meta (name, value) VALUES (?, datetime('now'))",
+            (f"migrated:{name}",)
+        )
+        await db.commit()
+
+        if os.path.exists(json_path):
+            os.replace(json_path, f"{json_path}.migrated")
+        logger.info(f"Migrasi {json_path}: {len(rows)} row dipindah ke {self.db_path}")
+        return len(rows)
+
+
+# Global store instance (dipakai blacklist & welcome)
+chat_store = ChatStore()
@@ -0,0 +1,184 @@
+"""
+Premium Conversation - Tunggu Balasan Chat Lewat Handler, Bukan Polling
+Satu MessageHandler per client meneruskan message ke conversation yang aktif
+Created by: Vzoel Fox's
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+
+from pyrogram import filters
+from pyrogram.handlers import MessageHandler
+from pyrogram.types import Message
+
+logger = logging.getLogger(__name__)
+
+# Group handler conversation (jalan sebelum plugin lain, tidak menghentikan propagation)
+CONVERSATION_GROUP = -100
+DEFAULT_RESPONSE_TIMEOUT = 30
+
+
+class Conversation:
+    """
+    Conversation dengan satu chat:
+
+        async with conversations.open(client, chat_id) as conv:
+            await conv.send("/newbot")
+            reply = await conv.get_response(timeout=30)
+
+    Hanya message masuk yang lebih baru dari message terakhir yang kita kirim
+    yang dihitung sebagai balasan. Satu conversation per (client, chat) pada satu
+    waktu: conversation kedua menunggu sampai yang pertama selesai.
+    """
+
+    __slots__ = ("manager", "client", "chat_id", "last_sent_id", "_queue")
+
+    def __init__(self, manager: "ConversationManager", client, chat_id: int, max_pending: int = 50):
+        self.manager = manager
+        self.client = client
+        self.chat_id = chat_id
+        self.last_sent_id = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+
+    async def __aenter__(self) -> "Conversation":
+        await self.manager._acquire(self)
+        self.manager._register(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.manager._unregister(self)
+        self.manager._release(self)
+
+    def _deliver(self, message: Message) -> None:
+        if message.id <= self.last_sent_id:
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(message)
+
+    async def send(self, text: str, **kwargs) -> Message:
+        """
+        Kirim message; yang antri dan lebih lama dari message ini dibuang. Balasan
+        yang sudah masuk sebelum send_message selesai (id lebih besar) tetap dipakai
+        """
+        sent = await self.client.send_message(self.chat_id, text, **kwargs)
+        self.last_sent_id = max(self.last_sent_id, sent.id)
+        fresh = []
+        while not self._queue.empty():
+            message = self._queue.get_nowait()
+            if message.id > self.last_sent_id:
+                fresh.append(message)
+        for message in fresh:
+            self._queue.put_nowait(message)
+        return sent
+
+    async def get_response(self, timeout: float = DEFAULT_RESPONSE_TIMEOUT) -> Optional[Message]:
+        """Balasan berikutnya, None kalau timeout"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return await self._latest_reply()
+            try:
+                message = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return await self._latest_reply()
+            if message.id > self.last_sent_id:
+                return message
+
+    async def _latest_reply(self) -> Optional[Message]:
+        """
+        Satu kali cek history saat timeout: menutup celah kalau balasan datang
+        sebelum handler terpasang (add_handler Pyrogram berjalan async)
+        """
+        try:
+            async for message in self.client.get_chat_history(self.chat_id, limit=1):
+                if message.id > self.last_sent_id and not message.outgoing:
+                    return message
+        except Exception as e:
+            logger.warning(f"Conversation {self.chat_id}: cek history gagal: {e}")
+        return None
+
+
+class ConversationManager:
+    """
+    Router conversation:
+    - MessageHandler dipasang sekali per client (group CONVERSATION_GROUP)
+    - Filter async cek O(1) apakah chat sedang punya conversation aktif
+    """
+
+    def __init__(self, group: int = CONVERSATION_GROUP):
+        self.group = group
+        self._active: Dict[int, Set[Conversation]] = {}
+        self._installed: Set[int] = set()
+        # (id client, chat_id) -> [lock, jumlah pemakai]; bot seperti @BotFather punya
+        # satu state per akun, dua conversation paralel akan saling baca balasan
+        self._locks: Dict[Tuple[int, int], List] = {}
+
+    def open(self, client, chat_id: int) -> Conversation:
+        return Conversation(self, client, chat_id)
+
+    def is_active(self, chat_id: int) -> bool:
+        return chat_id in self._active
+
+    async def _acquire(self, conversation: Conversation) -> None:
+        key = (id(conversation.client), conversation.chat_id)
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            await entry[0].acquire()
+        except BaseException:
+            self._drop_lock(key, entry)
+            raise
+
+    def _release(self, conversation: Conversation) -> None:
+        key = (id(conversation.client), conversation.chat_id)
+        entry = self._locks.get(key)
+        if entry is None:
+            return
+        entry[0].release()
+        self._drop_lock(key, entry)
+
+    def _drop_lock(self, key: Tuple[int, int], entry: List) -> None:
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self._locks[key]
+
+    def _register(self, conversation: Conversation) -> None:
+        self._install(conversation.client)
+        self._active.setdefault(conversation.chat_id, set()).add(conversation)
+
+    def _unregister(self, conversation: Conversation) -> None:
+        conversations = self._active.get(conversation.chat_id)
+        if conversations is None:
+            return
+        conversations.discard(conversation)
+        if not conversations:
+            del self._active[conversation.chat_id]
+
+    def _install(self, client) -> None:
+        if id(client) in self._installed:
+            return
+
+        async def active_chat(_, __, message: Message) -> bool:
+            return message.chat is not None and message.chat.id in self._active
+
+        client.add_handler(
+            MessageHandler(self._on_message, filters.create(active_chat) & filters.incoming),
+            self.group
+        )
+        self._installed.add(id(client))
+        logger.info(f"Conversation handler terpasang (group {self.group})")
+
+    async def _on_message(self, client, message: Message) -> None:
+        for conversation in tuple(self._active.get(message.chat.id, ())):
+            if conversation.client is client:
+                conversation._deliver(message)
+
+
+# Global conversation manager
+conversations = ConversationManager()
@@ -0,0 +1,150 @@
+"""
+Premium File ID Cache - Upload Sekali, Kirim Ulang Pakai file_id
+sha256(isi file) -> Telegram file_id per akun, disimpan ke disk
+Created by: Vzoel Fox's
+"""
+
+import asyncio
+import json
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from pyrogram import Client
+from pyrogram.errors import (
+    FileIdInvalid, FileReferenceExpired, FileReferenceInvalid, MediaEmpty, PhotoInvalid
+)
+from pyrogram.types import InputMediaPhoto, Message
+
+from utils.atomic_io import atomic_write_json
+from utils.file_hash import file_sha256
+
+logger = logging.getLogger(__name__)
+
+FILE_ID_CACHE_PATH = "vzoel/file_ids.json"
+
+# file_id dari cache ditolak Telegram -> hapus entry, upload ulang dari file
+STALE_FILE_ID_ERRORS = (FileIdInvalid, FileReferenceExpired, FileReferenceInvalid, MediaEmpty, PhotoInvalid)
+
+
+class FileIdCache:
+    """
+    Content-addressed cache file_id Telegram:
+    - Key = akun + sha256 file; file berubah -> hash baru -> upload ulang
+    - sha256 dihitung ulang hanya kalau (mtime_ns, size) file berubah (utils.file_hash)
+    - file_id terikat akun (userbot dan assistant bot punya file_id sendiri)
+    """
+
+    def __init__(self, path: str = FILE_ID_CACHE_PATH):
+        self.path = path
+        self._entries: Optional[Dict[str, Dict[str, str]]] = None
+        self._write_lock = asyncio.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        if self._entries is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, ValueError) as e:
+                logger.warning(f"File id cache {self.path} tidak terbaca, mulai kosong: {e}")
+                self._entries = {}
+        return self._entries
+
+    @staticmethod
+    def account(client: Client) -> str:
+        """ID akun pemilik file_id (file_id tidak bisa dipakai lintas akun)"""
+        me = getattr(client, "me", None)
+        return str(me.id) if me is not None else client.name
+
+    def _key(self, client: Client, file_path: str) -> Optional[str]:
+        sha = file_sha256(file_path)
+        return f"{self.account(client)}:{sha}" if sha else None
+
+    def get(self, client: Client, file_path: str) -> Optional[str]:
+        """file_id tersimpan untuk isi file ini, atau None"""
+        key = self._key(client, file_path)
+        entry = self._load().get(key) if key else None
+        return entry["file_id"] if entry else None
+
+    def _put(self, client: Client, file_path: str, file_id: str) -> bool:
+        key = self._key(client, file_path)
+        if not key or not file_id:
+            return False
+        account = self.account(client)
+        entries = self._load()
+        for stale in [k for k, v in entries.items()
+                      if v.get("path") == file_path and k != key and k.startswith(f"{account}:")]:
+            del entries[stale]
+        entries[key] = {"file_id": file_id, "path": file_path}
+        return True
+
+    async def set(self, client: Client, file_path: str, file_id: str) -> None:
+        """Simpan file_id; entry lama path yang sama (isi lama) ikut dibuang"""
+        if self._put(client, file_path, file_id):
+            await self._save()
+
+    async def invalidate(self, client: Client, file_path: str) -> None:
+        key = self._key(client, file_path)
+        if key and self._load().pop(key, None) is not None:
+            await self._save()
+
+    async def _save(self) -> None:
+        async with self._write_lock:
+            snapshot = dict(self._load())
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, atomic_write_json, self.path, snapshot)
+            except OSError as e:
+                logger.warning(f"Gagal menyimpan file id cache: {e}")
+
+    async def send_photo(self, client: Client, chat_id, photo_path: str, **kwargs) -> Message:
+        """send_photo pakai file_id tersimpan; upload + simpan file_id kalau belum ada"""
+        file_id = self.get(client, photo_path)
+        if file_id:
+            try:
+                return await client.send_photo(chat_id=chat_id, photo=file_id, **kwargs)
+            except STALE_FILE_ID_ERRORS:
+                await self.invalidate(client, photo_path)
+
+        sent = await client.send_photo(chat_id=chat_id, photo=photo_path, **kwargs)
+        if sent and sent.photo:
+            await self.set(client, photo_path, sent.photo.file_id)
+        return sent
+
+    async def send_media_group(self, client: Client, chat_id, photos: List[Tuple[str, str]],
+                               **kwargs) -> List[Message]:
+        """
+        send_media_group dari list (path, caption); foto yang sudah pernah
+        di-upload dikirim lewat file_id, sisanya di-upload lalu disimpan
+        """
+        cached = [self.get(client, path) for path, _ in photos]
+        try:
+            sent = await client.send_media_group(
+                chat_id=chat_id,
+                media=[InputMediaPhoto(media=file_id or path, caption=caption)
+                       for (path, caption), file_id in zip(photos, cached)],
+                **kwargs
+            )
+        except STALE_FILE_ID_ERRORS:
+            for path, _ in photos:
+                await self.invalidate(client, path)
+            cached = [None] * len(photos)
+            sent = await client.send_media_group(
+                chat_id=chat_id,
+                media=[InputMediaPhoto(media=path, caption=caption) for path, caption in photos],
+                **kwargs
+            )
+
+        # Simpan hanya foto yang barusan di-upload, tulis ke disk sekali
+        stored = [
+            self._put(client, path, message.photo.file_id)
+            for (path, _), file_id, message in zip(photos, cached, sent or [])
+            if file_id is None and message.photo
+        ]
+        if any(stored):
+            await self._save()
+        return sent
+
+
+# Global file id cache
+file_id_cache = FileIdCache()
@@ -0,0 +1,152 @@
+"""
+Premium Gcast Blacklist Store - Indexed Blacklist untuk Broadcast
+Tabel SQLite ber-index + mirror set di memori + mirror debounced ke config.json
+Created by: Vzoel Fox's
+"""
+
+import asyncio
+import logging
+from typing import FrozenSet, Iterable, List
+
+import aiosqlite
+
+from helper_config import CONFIG_JSON_PATH, get_config_service
+from utils.atomic_io import DebouncedJsonWriter
+
+# Satu database dengan tabel `chats` milik gcast, supaya target query bisa anti-join
+GCAST_DB_PATH = "broadcast_chats.db"
+
+logger = logging.getLogger(__name__)
+
+
+class GcastBlacklistStore:
+    """
+    Gcast blacklist store:
+    - Source of truth: tabel `gcast_blacklist` (chat_id PRIMARY KEY)
+    - Mirror set di memori untuk cek O(1) dan hitungan
+    - config.json tetap diupdate (blacklist.groups) tapi debounced + atomik
+    - config.json hanya dibaca sekali (migrasi pertama); setelah itu cuma output,
+      jadi ID yang dihapus tidak bisa "hidup lagi" dari mirror yang belum di-flush
+    """
+
+    def __init__(self, db_path: str = GCAST_DB_PATH, config_path: str = CONFIG_JSON_PATH):
+        self.db_path = db_path
+        self.config_service = get_config_service(config_path)
+        self.config_writer = DebouncedJsonWriter(config_path, delay=2.0)
+        self._groups: set = set()
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    def __contains__(self, chat_id: int) -> bool:
+        return chat_id in self._groups
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    @property
+    def groups(self) -> FrozenSet[int]:
+        return frozenset(self._groups)
+
+    def sorted_groups(self) -> List[int]:
+        return sorted(self._groups)
+
+    async def ensure_loaded(self) -> None:
+        """Create table, migrasi config.json (sekali seumur database), lalu load ke memori"""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            async with aiosqlite.connect(self.db_path) as db:
+                await db.execute("""
+                    CREATE TABLE IF NOT EXISTS gcast_blacklist (
+                        chat_id INTEGER PRIMARY KEY,
+                        added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                await db.execute("""
+                    CREATE TABLE IF NOT EXISTS gcast_blacklist_meta (
+                        key TEXT PRIMARY KEY,
+                        value TEXT
+                    )
+                """)
+                async with db.execute(
+                    "SELECT 1 FROM gcast_blacklist_meta WHERE key = 'config_migrated'"
+                ) as cursor:
+                    migrated = await cursor.fetchone() is not None
+                config_groups = self.config_service.snapshot.blacklist_groups
+                if not migrated:
+                    await db.executemany(
+                        "INSERT OR IGNORE INTO gcast_blacklist (chat_id) VALUES (?)",
+                        [(chat_id,) for chat_id in config_groups]
+                    )
+                    await db.execute(
+                        "INSERT INTO gcast_blacklist_meta (key, value) VALUES ('config_migrated', CURRENT_TIMESTAMP)"
+                    )
+                await db.commit()
+                async with db.execute("SELECT chat_id FROM gcast_blacklist") as cursor:
+                    self._groups = {row[0] async for row in cursor}
+            self._loaded = True
+            if set(config_groups) != self._groups:
+                # Mirror basi (mis. proses mati sebelum debounce flush) -> tulis ulang dari database
+                self._schedule_config_sync()
+            logger.info(f"Gcast blacklist loaded: {len(self._groups)} grup")
+
+    async def add_many(self, chat_ids: Iterable[int]) -> List[int]:
+        """Tambah banyak chat sekaligus, return ID yang benar-benar baru"""
+        await self.ensure_loaded()
+        new_ids = [chat_id for chat_id in dict.fromkeys(chat_ids) if chat_id not in self._groups]
+        if not new_ids:
+            return []
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany(
+                "INSERT OR IGNORE INTO gcast_blacklist (chat_id) VALUES (?)",
+                [(chat_id,) for chat_id in new_ids]
+            )
+            await db.commit()
+        self._groups.update(new_ids)
+        self._schedule_config_sync()
+        return new_ids
+
+    async def remove_many(self, chat_ids: Iterable[int]) -> List[int]:
+        """Hapus banyak chat sekaligus, return ID yang benar-benar dihapus"""
+        await self.ensure_loaded()
+        removed = [chat_id for chat_id in dict.fromkeys(chat_ids) if chat_id in self._groups]
+        if not removed:
+            return []
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany(
+                "DELETE FROM gcast_blacklist WHERE chat_id = ?",
+                [(chat_id,) for chat_id in removed]
+            )
+            await db.commit()
+        self._groups.difference_update(removed)
+        self._schedule_config_sync()
+        return removed
+
+    async def clear(self) -> int:
+        """Hapus semua blacklist, return jumlah yang dihapus"""
+        await self.ensure_loaded()
+        count = len(self._groups)
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("DELETE FROM gcast_blacklist")
+            await db.commit()
+        self._groups.clear()
+        self._schedule_config_sync()
+        return count
+
+    async def flush(self) -> bool:
+        """Paksa tulis config.json sekarang (mis. sebelum shutdown)"""
+        return await self.config_writer.flush()
+
+    def _schedule_config_sync(self) -> None:
+        groups = self.sorted_groups()
+
+        def apply(data):
+            data.setdefault("blacklist", {})["groups"] = groups
+
+        self.config_writer.schedule("blacklist.groups", apply)
+
+
+# Global store instance
+gcast_blacklist = GcastBlacklistStore()
@@ -0,0 +1,219 @@
+"""
+Premium Image Cache - Cache Gambar Turunan (Content-Addressed)
+Hasil optimize/watermark/resize disimpan per (hash sumber, operasi, parameter) dengan batas ukuran LRU
+Created by: Vzoel Fox's
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import shutil
+import tempfile
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Optional
+
+from utils.file_hash import file_sha256
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IMAGE_CACHE_MB = 64.0
+
+
+def _cache_megabytes() -> float:
+    """VZOEL_IMAGE_CACHE_MB; nilai tidak valid -> default (jangan crash saat import)"""
+    raw = os.environ.get("VZOEL_IMAGE_CACHE_MB")
+    if not raw:
+        return DEFAULT_IMAGE_CACHE_MB
+    try:
+        value = float(raw)
+    except ValueError:
+        value = -1.0
+    if not math.isfinite(value) or value <= 0:
+        logger.warning(f"VZOEL_IMAGE_CACHE_MB={raw!r} tidak valid, pakai {DEFAULT_IMAGE_CACHE_MB:g}MB")
+        return DEFAULT_IMAGE_CACHE_MB
+    return value
+
+
+IMAGE_CACHE_DIR = os.environ.get("VZOEL_IMAGE_CACHE_DIR", "vzoel/cache/images")
+IMAGE_CACHE_MAX_BYTES = int(_cache_megabytes() * 1024 * 1024)
+
+_TEMP_PREFIX = ".tmp-"
+
+
+class ImageCache:
+    """
+    Cache file gambar turunan di satu direktori:
+    - key = sha256(sha256 sumber + operasi + parameter JSON), nama file = key + ext
+    - Hit memperbarui mtime (urutan LRU tetap terjaga setelah restart)
+    - Total ukuran dibatasi `max_bytes`; file paling lama tidak dipakai dihapus
+    - Hasil baru ditulis ke temp file di direktori cache lalu os.replace (atomik)
+    - get/commit dengan pin=True menahan entry dari eviction sampai unpin()
+      (caller yang masih menyalin / upload file cache)
+    """
+
+    def __init__(self, cache_dir: str = IMAGE_CACHE_DIR, max_bytes: int = IMAGE_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._index: Optional["OrderedDict[str, int]"] = None
+        self._total_bytes = 0
+        self._pins: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def _load_index(self) -> "OrderedDict[str, int]":
+        """Scan direktori sekali, urut dari yang paling lama tidak dipakai"""
+        if self._index is None:
+            entries = []
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for entry in os.scandir(self.cache_dir):
+                if not entry.is_file():
+                    continue
+                if entry.name.startswith(_TEMP_PREFIX):
+                    # Sisa proses yang mati di tengah penulisan
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name, stat.st_size))
+            entries.sort()
+            self._index = OrderedDict((name, size) for _, name, size in entries)
+            self._total_bytes = sum(self._index.values())
+        return self._index
+
+    def key(self, source_path: Optional[str], operation: str, params: Dict[str, Any]) -> Optional[str]:
+        """Key turunan, None kalau file sumber tidak ada (source_path None = tanpa file sumber)"""
+        source_sha = file_sha256(source_path) if source_path else ""
+        if source_sha is None:
+            return None
+        payload = json.dumps([source_sha, operation, params], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, ext: str, pin: bool = False) -> Optional[str]:
+        """Path file cache kalau ada (dan tandai baru dipakai), None kalau miss"""
+        name = f"{key}{ext}"
+        path = os.path.join(self.cache_dir, name)
+        with self._lock:
+            index = self._load_index()
+            if name not in index:
+                self.misses += 1
+                return None
+            try:
+                os.utime(path)
+            except OSError:
+                # Dihapus dari luar
+                self._total_bytes -= index.pop(name)
+                self.misses += 1
+                return None
+            index.move_to_end(name)
+            if pin:
+                self._pins[name] += 1
+            self.hits += 1
+        return path
+
+    def temp_path(self, ext: str) -> str:
+        """Temp file di direktori cache (filesystem sama -> os.replace atomik)"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, path = tempfile.mkstemp(prefix=_TEMP_PREFIX, suffix=ext, dir=self.cache_dir)
+        os.close(fd)
+        return path
+
+    def discard(self, temp_path: str) -> None:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+    def commit(self, key: str, ext: str, temp_path: str, pin: bool = False) -> str:
+        """Pindahkan hasil dari temp ke cache, lalu evict sampai di bawah batas"""
+        name = f"{key}{ext}"
+        path = os.path.join(self.cache_dir, name)
+        size = os.path.getsize(temp_path)
+        with self._lock:
+            # Replace di dalam lock: eviction / commit lain tidak bisa menyela
+            os.replace(temp_path, path)
+            index = self._load_index()
+            self._total_bytes += size - index.pop(name, 0)
+            index[name] = size
+            if pin:
+                self._pins[name] += 1
+            self._evict(keep=name)
+        return path
+
+    def unpin(self, cached_path: str) -> None:
+        """Lepas pin dari get/commit(pin=True); entry boleh di-evict lagi"""
+        name = os.path.basename(cached_path)
+        with self._lock:
+            if self._pins[name] > 1:
+                self._pins[name] -= 1
+                return
+            self._pins.pop(name, None)
+            if self._index is not None:
+                self._evict(keep=None)
+
+    def _evict(self, keep: Optional[str]) -> None:
+        """Hapus entry paling lama tidak dipakai (kecuali `keep` dan yang di-pin)"""
+        index = self._index
+        for name in list(index):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if name == keep or name in self._pins:
+                continue
+            self._total_bytes -= index.pop(name)
+            try:
+                os.unlink(os.path.join(self.cache_dir, name))
+            except OSError:
+                pass
+            logger.debug(f"Image cache evict: {name}")
+
+    def deliver(self, cached_path: str, output_path: str) -> str:
+        """
+        Salin hasil ke `output_path` (atomik). Entry sebaiknya di-pin selama copy;
+        caller tidak pernah dapat path cache yang bisa hilang kena LRU
+        """
+        if os.path.abspath(output_path) == os.path.abspath(cached_path):
+            return cached_path
+        directory = os.path.dirname(os.path.abspath(output_path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(output_path)}.", suffix=".tmp", dir=directory)
+        os.close(fd)
+        try:
+            shutil.copyfile(cached_path, temp_path)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            self.discard(temp_path)
+            raise
+        return output_path
+
+    def clear(self) -> None:
+        """Hapus semua entry kecuali yang sedang di-pin"""
+        with self._lock:
+            index = self._load_index()
+            for name in list(index):
+                if name in self._pins:
+                    continue
+                self._total_bytes -= index.pop(name)
+                try:
+                    os.unlink(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            index = self._load_index()
+            return {
+                "entries": len(index),
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Global derived image cache
+image_cache = ImageCache()
@@ -5,18 +5,26 @@ Created by: Vzoel Fox's
 """
 
 import os
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, Awaitable, Callable, List, Tuple
 from utils.assets import VzoelAssets, vzoel_msg, bold, italic, emoji
+from helpers.image_cache import image_cache
 
 # Optional PIL import dengan fallback
 try:
-    from PIL import Image, ImageDraw, ImageFont
+    from PIL import Image
+    from helpers.image_ops import (
+        TELEGRAM_MAX_SIZE, TELEGRAM_QUALITY, optimize_file, resize_file, run_image_op, watermark_file
+    )
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
     print(f"{emoji('loading')} PIL not available - advanced image processing disabled")
 
+# Parameter optimize Telegram (bagian dari key image cache)
+TELEGRAM_PARAMS = {"max_size": TELEGRAM_MAX_SIZE, "quality": TELEGRAM_QUALITY} if PIL_AVAILABLE else {}
+
 class ImageHelper:
     """
     Premium Image Helper dengan enhanced features:
@@ -168,14 +176,80 @@ class ImageHelper:
         
         return info
     
+    def _derive(self, func: Callable, source_path: str, operation: str, ext: str,
+                params: Dict[str, Any], output_path: str) -> Tuple[str, Any]:
+        """
+        Ambil hasil turunan dari image_cache; miss -> generate ke temp file cache.
+        Entry di-pin sampai disalin ke output_path (tidak bisa kena evict di tengah).
+        Return (path hasil, return value func atau None kalau cache hit)
+        """
+        key = image_cache.key(source_path, operation, params)
+        cached = image_cache.get(key, ext, pin=True)
+        result = None
+        if cached is None:
+            temp_path = image_cache.temp_path(ext)
+            try:
+                result = func(source_path, temp_path, **params)
+            except BaseException:
+                image_cache.discard(temp_path)
+                raise
+            cached = image_cache.commit(key, ext, temp_path, pin=True)
+        try:
+            return image_cache.deliver(cached, output_path), result
+        finally:
+            image_cache.unpin(cached)
+    
+    async def _derive_async(self, func: Callable, source_path: str, operation: str, ext: str,
+                            params: Dict[str, Any], output_path: Optional[str]) -> Tuple[str, Any]:
+        """Versi async _derive: hash + I/O cache di thread, generate di process pool"""
+        loop = asyncio.get_running_loop()
+        key = await loop.run_in_executor(None, image_cache.key, source_path, operation, params)
+        cached = image_cache.get(key, ext, pin=True)
+        result = None
+        if cached is None:
+            temp_path = image_cache.temp_path(ext)
+            try:
+                result = await run_image_op(func, source_path, temp_path, **params)
+            except BaseException:
+                image_cache.discard(temp_path)
+                raise
+            cached = image_cache.commit(key, ext, temp_path, pin=True)
+        try:
+            path = await loop.run_in_executor(None, image_cache.deliver, cached, output_path)
+        finally:
+            image_cache.unpin(cached)
+        return path, result
+    
+    def _resize_params(self, max_size: Optional[Tuple[int, int]]) -> Dict[str, Any]:
+        return {"max_size": tuple(max_size or self.max_size), "quality": self.quality}
+    
+    def _watermark_params(self, watermark_text: str, position: str) -> Dict[str, Any]:
+        return {"watermark_text": watermark_text, "position": position, "quality": self.quality}
+    
+    @staticmethod
+    def _source_ext(path: str) -> str:
+        return os.path.splitext(path)[1].lower()
+    
+    @staticmethod
+    def _default_output(path: str, suffix: str, ext: Optional[str] = None) -> str:
+        """Output default di samping file sumber (mis. logo_resized.png), bukan path cache"""
+        name, source_ext = os.path.splitext(path)
+        return f"{name}_{suffix}{ext or source_ext}"
+    
+    def _optimized_info(self, path: str, result: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Info hasil optimize: dari worker kalau baru dibuat, baca header kalau cache hit"""
+        if result is None:
+            return self.get_image_info(path)
+        return dict(result, path=path, filename=os.path.basename(path))
+
     def resize_image(self, input_path: str, output_path: str = None,
                     max_size: Tuple[int, int] = None) -> Optional[str]:
         """
-        Resize image untuk optimal display
+        Resize image untuk optimal display (JPEG besar di-decode lewat draft/reduce)
         
         Args:
             input_path: Path to input image
-            output_path: Path untuk output (optional)
+            output_path: Path untuk output (optional, default <nama>_resized<ext> di samping input)
             max_size: Maximum dimensions (optional)
             
         Returns:
@@ -189,26 +263,11 @@ class ImageHelper:
             if not self.validate_image(input_path):
                 return None
             
-            max_size = max_size or self.max_size
-            
-            with Image.open(input_path) as img:
-                # Convert to RGB if necessary
-                if img.mode in ('RGBA', 'P'):
-                    img = img.convert('RGB')
-                
-                # Calculate new size maintaining aspect ratio
-                img.thumbnail(max_size, Image.Resampling.LANCZOS)
-                
-                # Generate output path if not provided
-                if not output_path:
-                    name, ext = os.path.splitext(input_path)
-                    output_path = f"{name}_resized{ext}"
-                
-                # Save resized image
-                img.save(output_path, optimize=True, quality=self.quality)
-                
-                self.logger.info(f"{emoji('centang')} Image resized: {os.path.basename(output_path)}")
-                return output_path
+            output_path, _ = self._derive(resize_file, input_path, "resize", self._source_ext(input_path),
+                                          self._resize_params(max_size),
+                                          output_path or self._default_output(input_path, "resized"))
+            self.logger.info(f"{emoji('centang')} Image resized: {os.path.basename(output_path)}")
+            return output_path
                 
         except Exception as e:
             self.logger.error(f"{emoji('merah')} Failed to resize image: {e}")
@@ -222,7 +281,7 @@ class ImageHelper:
         Args:
             image_path: Path to image
             watermark_text: Text untuk watermark
-            output_path: Output path (optional)
+            output_path: Output path (optional, default <nama>_watermarked<ext> di samping input)
             position: Watermark position
             
         Returns:
@@ -230,76 +289,17 @@ class ImageHelper:
         """
         if not PIL_AVAILABLE:
             self.logger.warning(f"{emoji('loading')} PIL not available - watermarking disabled")
-            return input_path
+            return image_path
         
         try:
             if not self.validate_image(image_path):
                 return None
             
-            with Image.open(image_path) as img:
-                # Convert to RGBA untuk transparency support
-                if img.mode != 'RGBA':
-                    img = img.convert('RGBA')
-                
-                # Create transparent overlay
-                overlay = Image.new('RGBA', img.size, (255, 255, 255, 0))
-                draw = ImageDraw.Draw(overlay)
-                
-                # Calculate text size dan position
-                try:
-                    # Try to use better font if available
-                    font_size = max(20, img.size[0] // 30)  # Scale font with image
-                    font = ImageFont.truetype("/system/fonts/Roboto-Regular.ttf", font_size)
-                except:
-                    font = ImageFont.load_default()
-                
-                # Get text dimensions
-                bbox = draw.textbbox((0, 0), watermark_text, font=font)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
-                
-                # Calculate position
-                margin = 20
-                positions = {
-                    "bottom-right": (img.size[0] - text_width - margin, 
-                                   img.size[1] - text_height - margin),
-                    "bottom-left": (margin, img.size[1] - text_height - margin),
-                    "top-right": (img.size[0] - text_width - margin, margin),
-                    "top-left": (margin, margin),
-                    "center": ((img.size[0] - text_width) // 2, 
-                             (img.size[1] - text_height) // 2)
-                }
-                
-                text_pos = positions.get(position, positions["bottom-right"])
-                
-                # Draw watermark with semi-transparent background
-                draw.rectangle([text_pos[0] - 5, text_pos[1] - 5,
-                               text_pos[0] + text_width + 5, text_pos[1] + text_height + 5],
-                              fill=(0, 0, 0, 128))
-                
-                # Draw text
-                draw.text(text_pos, watermark_text, font=font, fill=(255, 255, 255, 200))
-                
-                # Composite overlay onto image
-                watermarked = Image.alpha_composite(img, overlay)
-                
-                # Convert back to RGB untuk saving
-                if watermarked.mode == 'RGBA':
-                    final_img = Image.new('RGB', watermarked.size, (255, 255, 255))
-                    final_img.paste(watermarked, mask=watermarked.split()[-1])
-                else:
-                    final_img = watermarked
-                
-                # Generate output path if not provided
-                if not output_path:
-                    name, ext = os.path.splitext(image_path)
-                    output_path = f"{name}_watermarked{ext}"
-                
-                # Save watermarked image
-                final_img.save(output_path, optimize=True, quality=self.quality)
-                
-                self.logger.info(f"{emoji('centang')} Watermark added: {os.path.basename(output_path)}")
-                return output_path
+            output_path, _ = self._derive(watermark_file, image_path, "watermark", self._source_ext(image_path),
+                                          self._watermark_params(watermark_text, position),
+                                          output_path or self._default_output(image_path, "watermarked"))
+            self.logger.info(f"{emoji('centang')} Watermark added: {os.path.basename(output_path)}")
+            return output_path
                 
         except Exception as e:
             self.logger.error(f"{emoji('merah')} Failed to add watermark: {e}")
@@ -311,7 +311,7 @@ class ImageHelper:
         
         Args:
             image_path: Path to input image
-            output_path: Path untuk output (optional)
+            output_path: Path untuk output (optional, default <nama>_telegram.jpg di samping input)
             
         Returns:
             Path to optimized image or None
@@ -325,37 +325,68 @@ class ImageHelper:
                 return None
             
             # Telegram photo limits: 10MB, max 1280x1280
-            telegram_max_size = (1280, 1280)
-            telegram_quality = 85
-            
-            with Image.open(image_path) as img:
-                # Convert to RGB
-                if img.mode in ('RGBA', 'P'):
-                    img = img.convert('RGB')
-                
-                # Resize if needed
-                if img.size[0] > telegram_max_size[0] or img.size[1] > telegram_max_size[1]:
-                    img.thumbnail(telegram_max_size, Image.Resampling.LANCZOS)
-                
-                # Generate output path
-                if not output_path:
-                    name, ext = os.path.splitext(image_path)
-                    output_path = f"{name}_telegram{ext}"
-                
-                # Save optimized image
-                img.save(output_path, format='JPEG', optimize=True, 
-                        quality=telegram_quality, progressive=True)
-                
-                # Check file size (should be under 10MB)
-                file_size = os.path.getsize(output_path) / (1024 * 1024)
-                
-                self.logger.info(f"{emoji('centang')} Telegram optimization complete: {file_size:.2f}MB")
-                return output_path
+            output_path, _ = self._derive(optimize_file, image_path, "telegram", ".jpg", TELEGRAM_PARAMS,
+                                          output_path or self._default_output(image_path, "telegram", ".jpg"))
+            self.logger.info(f"{emoji('centang')} Telegram optimization complete: {os.path.basename(output_path)}")
+            return output_path
                 
         except Exception as e:
             self.logger.error(f"{emoji('merah')} Failed to optimize for Telegram: {e}")
             return None
     
+    # Versi async: kerja PIL jalan di process pool, event loop tetap responsif
+    
+    async def resize_image_async(self, input_path: str, output_path: str = None,
+                                 max_size: Tuple[int, int] = None) -> Optional[str]:
+        """Async resize_image (process pool)"""
+        if not PIL_AVAILABLE:
+            return input_path
+        
+        try:
+            output_path, _ = await self._derive_async(resize_file, input_path, "resize",
+                                                      self._source_ext(input_path),
+                                                      self._resize_params(max_size),
+                                                      output_path or self._default_output(input_path, "resized"))
+            self.logger.info(f"{emoji('centang')} Image resized: {os.path.basename(output_path)}")
+            return output_path
+        except Exception as e:
+            self.logger.error(f"{emoji('merah')} Failed to resize image: {e}")
+            return None
+    
+    async def add_watermark_async(self, image_path: str, watermark_text: str,
+                                  output_path: str = None, position: str = "bottom-right") -> Optional[str]:
+        """Async add_watermark (process pool)"""
+        if not PIL_AVAILABLE:
+            return image_path
+        
+        try:
+            output_path, _ = await self._derive_async(watermark_file, image_path, "watermark",
+                                                      self._source_ext(image_path),
+                                                      self._watermark_params(watermark_text, position),
+                                                      output_path or self._default_output(image_path, "watermarked"))
+            self.logger.info(f"{emoji('centang')} Watermark added: {os.path.basename(output_path)}")
+            return output_path
+        except Exception as e:
+            self.logger.error(f"{emoji('merah')} Failed to add watermark: {e}")
+            return None
+    
+    async def optimize_for_telegram_async(self, image_path: str, output_path: str = None) -> Optional[Dict[str, Any]]:
+        """Async optimize_for_telegram (process pool), return info hasil atau None"""
+        if not PIL_AVAILABLE:
+            return None
+        
+        try:
+            output_path, result = await self._derive_async(
+                optimize_file, image_path, "telegram", ".jpg", TELEGRAM_PARAMS,
+                output_path or self._default_output(image_path, "telegram", ".jpg")
+            )
+            info = self._optimized_info(output_path, result)
+            self.logger.info(f"{emoji('centang')} Telegram optimization complete: {info['size_mb']:.2f}MB")
+            return info
+        except Exception as e:
+            self.logger.error(f"{emoji('merah')} Failed to optimize for Telegram: {e}")
+            return None
+    
     def get_helper_info(self) -> Dict[str, Any]:
         """Get comprehensive image helper information"""
         return {
@@ -427,4 +458,71 @@ def process_vzoel_images(input_dir: str = "vzoel", output_dir: str = "vzoel/proc
                 })
     
     helper.logger.info(f"{emoji('centang')} Batch processing complete: {results['success_count']}/{results['total']}")
-    return results
\ No newline at end of file
+    return results
+
+async def process_vzoel_images_async(input_dir: str = "vzoel", output_dir: str = "vzoel/processed",
+                                     on_progress: Optional[Callable[[int, int, str, bool], Awaitable[None]]] = None
+                                     ) -> Dict[str, Any]:
+    """
+    Versi async process_vzoel_images: semua file di-optimize paralel di process pool
+    
+    Args:
+        input_dir: Input directory path
+        output_dir: Output directory path
+        on_progress: Callback async (done, total, filename, ok) tiap satu file selesai
+        
+    Returns:
+        Processing results dictionary (format sama dengan process_vzoel_images)
+    """
+    helper = ImageHelper()
+    results = {
+        "processed": [],
+        "failed": [],
+        "total": 0,
+        "success_count": 0
+    }
+    
+    if not os.path.exists(input_dir):
+        helper.logger.warning(f"{emoji('loading')} Input directory not found: {input_dir}")
+        return results
+    
+    os.makedirs(output_dir, exist_ok=True)
+    
+    filenames = sorted(
+        filename for filename in os.listdir(input_dir)
+        if any(filename.lower().endswith(fmt) for fmt in helper.supported_formats)
+    )
+    results["total"] = len(filenames)
+    
+    async def process_one(filename: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        input_path = os.path.join(input_dir, filename)
+        if not helper.validate_image(input_path):
+            return filename, None
+        return filename, await helper.optimize_for_telegram_async(input_path, os.path.join(output_dir, filename))
+    
+    done = 0
+    for next_done in asyncio.as_completed([process_one(filename) for filename in filenames]):
+        filename, info = await next_done
+        done += 1
+        input_path = os.path.join(input_dir, filename)
+        
+        if info:
+            results["processed"].append({
+                "filename": filename,
+                "input_path": input_path,
+                "output_path": info["path"],
+                "info": info
+            })
+            results["success_count"] += 1
+        else:
+            results["failed"].append({
+                "filename": filename,
+                "input_path": input_path,
+                "error": "Processing failed"
+            })
+        
+        if on_progress:
+            await on_progress(done, results["total"], filename, bool(info))
+    
+    helper.logger.info(f"{emoji('centang')} Batch processing complete: {results['success_count']}/{results['total']}")
+    return results
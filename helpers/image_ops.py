@@ -0,0 +1,235 @@
+"""
+Premium Image Ops - Operasi PIL untuk Process Pool
+Fungsi top-level (picklable) yang dijalankan di worker process, bukan di event loop
+Created by: Vzoel Fox's
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# Worker process untuk operasi gambar (decode/resize berat, CPU-bound)
+IMAGE_POOL_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+TELEGRAM_MAX_SIZE = (1280, 1280)
+TELEGRAM_QUALITY = 85
+
+# Font dicoba berurutan (Termux/Android lalu Linux), fallback font bawaan Pillow
+FONT_PATHS = (
+    "/system/fonts/Roboto-Regular.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+)
+BOLD_FONT_PATHS = (
+    "/system/fonts/Roboto-Bold.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+)
+
+WELCOME_CARD_SIZE = (1000, 400)
+WELCOME_CARD_QUALITY = 90
+
+_pool: Optional[Executor] = None
+_pool_failed = False
+
+
+def open_downscaled(image_path: str, max_size: Tuple[int, int]) -> Image.Image:
+    """
+    Buka gambar yang sudah dikecilkan mendekati `max_size`:
+    - JPEG: draft() decode langsung di skala 1/2, 1/4, 1/8 (memori decode kecil)
+    - Format lain: reduce() integer dulu, sisanya thumbnail LANCZOS
+    """
+    with Image.open(image_path) as source:
+        if source.format == "JPEG":
+            source.draft("RGB", max_size)
+        img = source.copy()
+
+    scale = max(img.size[0] / max_size[0], img.size[1] / max_size[1])
+    factor = int(scale // 2)
+    if factor >= 2:
+        img = img.reduce(factor)
+    if scale > 1:
+        img.thumbnail(max_size, Image.Resampling.LANCZOS)
+    return img
+
+
+@functools.lru_cache(maxsize=32)
+def load_font(size: int, bold: bool = False) -> ImageFont.ImageFont:
+    """Font di-load sekali per (size, bold) per worker process"""
+    for path in (BOLD_FONT_PATHS if bold else FONT_PATHS):
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size=size)
+
+
+def _draw_label(draw: ImageDraw.ImageDraw, position: Tuple[int, int], text: str,
+                font: ImageFont.ImageFont, padding: int = 5) -> None:
+    """Text putih semi-transparan di atas kotak gelap (dipakai watermark dan welcome card)"""
+    bbox = draw.textbbox(position, text, font=font)
+    draw.rectangle([bbox[0] - padding, bbox[1] - padding, bbox[2] + padding, bbox[3] + padding],
+                   fill=(0, 0, 0, 128))
+    draw.text(position, text, font=font, fill=(255, 255, 255, 200))
+
+
+def _to_rgb(img: Image.Image) -> Image.Image:
+    return img.convert("RGB") if img.mode in ("RGBA", "P", "LA", "CMYK") else img
+
+
+def resize_file(input_path: str, output_path: str, max_size: Tuple[int, int], quality: int) -> str:
+    """Resize + simpan, return output path"""
+    img = _to_rgb(open_downscaled(input_path, max_size))
+    img.save(output_path, optimize=True, quality=quality)
+    return output_path
+
+
+def optimize_file(input_path: str, output_path: str,
+                  max_size: Tuple[int, int] = TELEGRAM_MAX_SIZE,
+                  quality: int = TELEGRAM_QUALITY) -> Dict[str, Any]:
+    """Optimize untuk Telegram (JPEG progressive), return info hasil tanpa buka ulang file"""
+    img = _to_rgb(open_downscaled(input_path, max_size))
+    img.save(output_path, format="JPEG", optimize=True, quality=quality, progressive=True)
+    size_bytes = os.path.getsize(output_path)
+    return {
+        "path": output_path,
+        "filename": os.path.basename(output_path),
+        "exists": True,
+        "valid": True,
+        "size_bytes": size_bytes,
+        "size_mb": round(size_bytes / (1024 * 1024), 2),
+        "dimensions": img.size,
+        "width": img.size[0],
+        "height": img.size[1],
+        "format": "JPEG",
+        "mode": img.mode,
+        "aspect_ratio": round(img.size[0] / img.size[1], 2),
+        "needs_resize": False,
+    }
+
+
+def watermark_file(image_path: str, output_path: str, watermark_text: str,
+                   position: str, quality: int) -> str:
+    """Tambah watermark text semi-transparan, return output path"""
+    with Image.open(image_path) as source:
+        img = source.convert("RGBA")
+
+    overlay = Image.new("RGBA", img.size, (255, 255, 255, 0))
+    draw = ImageDraw.Draw(overlay)
+
+    font = load_font(max(20, img.size[0] // 30))  # Scale font with image
+
+    bbox = draw.textbbox((0, 0), watermark_text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+
+    margin = 20
+    positions = {
+        "bottom-right": (img.size[0] - text_width - margin, img.size[1] - text_height - margin),
+        "bottom-left": (margin, img.size[1] - text_height - margin),
+        "top-right": (img.size[0] - text_width - margin, margin),
+        "top-left": (margin, margin),
+        "center": ((img.size[0] - text_width) // 2, (img.size[1] - text_height) // 2),
+    }
+    _draw_label(draw, positions.get(position, positions["bottom-right"]), watermark_text, font)
+
+    watermarked = Image.alpha_composite(img, overlay)
+    final_img = Image.new("RGB", watermarked.size, (255, 255, 255))
+    final_img.paste(watermarked, mask=watermarked.split()[-1])
+    final_img.save(output_path, optimize=True, quality=quality)
+    return output_path
+
+
+def _fit_text(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.ImageFont, max_width: int) -> str:
+    """Potong text dengan elipsis supaya muat `max_width` pixel"""
+    if draw.textlength(text, font=font) <= max_width:
+        return text
+    while text and draw.textlength(f"{text}…", font=font) > max_width:
+        text = text[:-1]
+    return f"{text}…"
+
+
+def render_welcome_card(logo_path: Optional[str], output_path: str, user_name: str,
+                        chat_title: str, member_count: Optional[int]) -> str:
+    """
+    Welcome card: background gradient, logo grup bulat di kiri,
+    nama user + nama grup + nomor member di kanan
+    """
+    width, height = WELCOME_CARD_SIZE
+    gradient = Image.linear_gradient("L").rotate(90).resize(WELCOME_CARD_SIZE)
+    card = ImageOps.colorize(gradient, black=(18, 18, 38), white=(72, 36, 110)).convert("RGBA")
+
+    logo_size = height - 140
+    logo_box = (60, (height - logo_size) // 2)
+    if logo_path:
+        logo = ImageOps.fit(_to_rgb(open_downscaled(logo_path, (logo_size * 2, logo_size * 2))),
+                            (logo_size, logo_size), Image.Resampling.LANCZOS)
+        mask = Image.new("L", (logo_size, logo_size), 0)
+        ImageDraw.Draw(mask).ellipse((0, 0, logo_size - 1, logo_size - 1), fill=255)
+        card.paste(logo, logo_box, mask)
+
+    overlay = Image.new("RGBA", card.size, (255, 255, 255, 0))
+    draw = ImageDraw.Draw(overlay)
+    text_x = logo_box[0] + logo_size + 50
+    text_width = width - text_x - 50
+
+    draw.text((text_x, 90), "WELCOME", font=load_font(36, bold=True), fill=(255, 255, 255, 160))
+    name_font = load_font(56, bold=True)
+    draw.text((text_x, 140), _fit_text(draw, user_name, name_font, text_width),
+              font=name_font, fill=(255, 255, 255, 255))
+    info_font = load_font(28)
+    draw.text((text_x, 220), _fit_text(draw, chat_title, info_font, text_width),
+              font=info_font, fill=(255, 255, 255, 200))
+    if member_count:
+        _draw_label(draw, (text_x, 280), f"Member #{member_count}", info_font, padding=8)
+
+    final_img = Image.alpha_composite(card, overlay).convert("RGB")
+    final_img.save(output_path, format="JPEG", optimize=True, quality=WELCOME_CARD_QUALITY)
+    return output_path
+
+
+def get_image_pool() -> Optional[Executor]:
+    """
+    Process pool bersama (spawn: aman walau proses utama punya thread), None kalau tidak bisa.
+    Worker hanya load PIL + module ini: main.py di-guard `__name__ == "__main__"` dan
+    helpers/__init__ melewati banner di child process
+    """
+    global _pool, _pool_failed
+    if _pool is None and not _pool_failed:
+        try:
+            _pool = ProcessPoolExecutor(
+                max_workers=IMAGE_POOL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        except (OSError, NotImplementedError, ValueError) as e:
+            logger.warning(f"Image process pool tidak tersedia, pakai thread pool: {e}")
+            _pool_failed = True
+    return _pool
+
+
+async def run_image_op(func: Callable, *args, **kwargs) -> Any:
+    """Jalankan operasi gambar di process pool (fallback thread pool)"""
+    global _pool
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, *args, **kwargs)
+    try:
+        return await loop.run_in_executor(get_image_pool(), call)
+    except BrokenProcessPool:
+        # Worker mati (OOM / kill) -> buat pool baru, ulang sekali
+        logger.warning("Image process pool rusak, dibuat ulang")
+        _pool = None
+        return await loop.run_in_executor(get_image_pool(), call)
+
+
+def shutdown_image_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
@@ -0,0 +1,146 @@
+"""
+Premium Job Manager - Background Job dengan Time Budget dan Cancellation
+Command lama (BotFather flow, bulk create) jalan di luar worker update Pyrogram
+Created by: Vzoel Fox's
+"""
+
+import asyncio
+import contextvars
+import itertools
+import logging
+import time
+from collections import OrderedDict, deque
+from typing import Awaitable, Callable, Coroutine, Deque, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Time budget default per jenis job (detik)
+JOB_BUDGETS = {
+    "autobot_create": 180,
+    "autobot_bulk": 1200,
+    "purge": 900,
+}
+DEFAULT_JOB_BUDGET = 300
+
+# Job yang sedang jalan di task ini (untuk report progress dari helper)
+current_job: contextvars.ContextVar[Optional["Job"]] = contextvars.ContextVar("current_job", default=None)
+
+
+class Job:
+    """Satu background job"""
+
+    __slots__ = ("id", "name", "chat_id", "budget", "started_at", "finished_at",
+                 "status", "progress", "error", "task")
+
+    def __init__(self, job_id: int, name: str, chat_id: Optional[int], budget: float):
+        self.id = job_id
+        self.name = name
+        self.chat_id = chat_id
+        self.budget = budget
+        self.started_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+        self.status = "running"  # running / done / failed / cancelled / timeout
+        self.progress = ""
+        self.error: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.budget - self.elapsed)
+
+    @property
+    def running(self) -> bool:
+        return self.status == "running"
+
+
+class JobManager:
+    """
+    Job manager:
+    - start() menjalankan coroutine sebagai task sendiri -> handler langsung selesai
+    - Tiap job punya time budget (asyncio.wait_for), lewat budget = timeout
+    - cancel() membatalkan di await point berikutnya (cooperative)
+    - on_done(job) dipanggil setelah job selesai apapun statusnya (untuk report)
+    """
+
+    def __init__(self, max_running: int = 8, history_size: int = 20):
+        self.max_running = max_running
+        self._ids = itertools.count(1)
+        self._running: "OrderedDict[int, Job]" = OrderedDict()
+        self._history: Deque[Job] = deque(maxlen=history_size)
+
+    def start(self, name: str, coro: Coroutine, chat_id: Optional[int] = None,
+              budget: Optional[float] = None,
+              on_done: Optional[Callable[[Job], Awaitable[None]]] = None) -> Optional[Job]:
+        """Start job, return None (dan coroutine ditutup) kalau slot penuh"""
+        if len(self._running) >= self.max_running:
+            coro.close()
+            return None
+
+        job = Job(next(self._ids), name, chat_id, budget or JOB_BUDGETS.get(name, DEFAULT_JOB_BUDGET))
+        self._running[job.id] = job
+        job.task = asyncio.get_running_loop().create_task(self._run(job, coro, on_done))
+        logger.info(f"Job #{job.id} {name} started (budget {job.budget:g}s)")
+        return job
+
+    async def _run(self, job: Job, coro: Coroutine,
+                   on_done: Optional[Callable[[Job], Awaitable[None]]]) -> None:
+        current_job.set(job)
+        try:
+            await asyncio.wait_for(coro, timeout=job.budget)
+            job.status = "done"
+        except asyncio.TimeoutError:
+            job.status = "timeout"
+            job.error = f"Melewati budget {job.budget:g}s"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            logger.error(f"Job #{job.id} {job.name} gagal: {e}")
+        finally:
+            job.finished_at = time.monotonic()
+            job.task = None
+            self._running.pop(job.id, None)
+            self._history.append(job)
+            logger.info(f"Job #{job.id} {job.name} {job.status} ({job.elapsed:.1f}s)")
+
+        if on_done is not None:
+            try:
+                await on_done(job)
+            except Exception as e:
+                logger.warning(f"Job #{job.id} on_done gagal: {e}")
+
+    def cancel(self, job_id: int) -> bool:
+        job = self._running.get(job_id)
+        if job is None or job.task is None:
+            return False
+        job.task.cancel()
+        return True
+
+    def cancel_all(self) -> int:
+        jobs = list(self._running)
+        return sum(1 for job_id in jobs if self.cancel(job_id))
+
+    def get(self, job_id: int) -> Optional[Job]:
+        return self._running.get(job_id) or next((job for job in self._history if job.id == job_id), None)
+
+    def running(self) -> List[Job]:
+        return list(self._running.values())
+
+    def history(self) -> List[Job]:
+        return list(self._history)
+
+
+def report_progress(text: str) -> None:
+    """Update progress job yang sedang jalan (no-op di luar job)"""
+    job = current_job.get()
+    if job is not None:
+        job.progress = text
+
+
+# Global job manager
+job_manager = JobManager()
@@ -8,8 +8,9 @@ import os
 import logging
 from typing import Optional, Dict, Any, List
 from pyrogram import Client
-from pyrogram.types import Message, InputMediaPhoto
+from pyrogram.types import Message
 from utils.assets import VzoelAssets, vzoel_msg, bold, italic, emoji
+from helpers.file_id_cache import file_id_cache
 
 class LogoHelper:
     """
@@ -304,9 +305,11 @@ class LogoHelper:
             loading_emojis = self.assets.get_status_emojis("loading")
             self.logger.info(f"{loading_emojis[0] if loading_emojis else '⏳'} Sending logo with {caption_type} caption")
             
-            sent_message = await client.send_photo(
-                chat_id=chat_id,
-                photo=logo_path,
+            # Upload sekali, selanjutnya pakai file_id tersimpan
+            sent_message = await file_id_cache.send_photo(
+                client,
+                chat_id,
+                logo_path,
                 caption=caption,
                 reply_to_message_id=reply_to_message_id
             )
@@ -370,24 +373,21 @@ class LogoHelper:
                 self.logger.warning(f"{emoji('loading')} No images available for gallery")
                 return None
             
-            # Prepare media list
+            # Prepare media list (path, caption)
             media_list = []
             for i, image_name in enumerate(image_names[:10]):  # Max 10 images
                 image_path = self.get_image_path(image_name)
                 if image_path:
                     # First image gets the caption
                     img_caption = caption if i == 0 else ""
-                    media_list.append(InputMediaPhoto(media=image_path, caption=img_caption))
+                    media_list.append((image_path, img_caption))
             
             if not media_list:
                 self.logger.warning(f"{emoji('loading')} No valid images found for gallery")
                 return None
             
-            # Send media group
-            sent_messages = await client.send_media_group(
-                chat_id=chat_id,
-                media=media_list
-            )
+            # Send media group (foto yang sudah pernah di-upload dikirim via file_id)
+            sent_messages = await file_id_cache.send_media_group(client, chat_id, media_list)
             
             success_emojis = self.assets.get_status_emojis("success")
             self.logger.info(f"{success_emojis[0] if success_emojis else '✅'} Image gallery sent: {len(media_list)} images")
@@ -0,0 +1,298 @@
+"""
+Premium Member Roster - Cache Member per Chat di SQLite
+Diisi sekali dari get_chat_members, lalu diupdate incremental dari event
+Created by: Vzoel Fox's
+"""
+
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Dict, Optional, Set, Tuple
+
+import aiosqlite
+from pyrogram.enums import ChatMemberStatus
+
+from utils.cache import LRUCache
+
+MEMBER_ROSTER_DB_PATH = "vzoel_member_roster.db"
+
+# Flag member (bitmask kolom `flags`)
+FLAG_BOT = 1
+FLAG_DELETED = 2
+
+# Roster lebih tua dari ini di-refresh penuh saat dipakai
+DEFAULT_ROSTER_TTL = 6 * 3600
+
+# Jeda sebelum flush diulang kalau transaksi gagal
+FLUSH_RETRY_DELAY = 5.0
+
+logger = logging.getLogger(__name__)
+
+_GONE_STATUSES = (ChatMemberStatus.BANNED, ChatMemberStatus.LEFT)
+
+
+class RosterMember:
+    """Data minimal satu member (cukup untuk mention)"""
+
+    __slots__ = ("id", "first_name", "username", "flags")
+
+    def __init__(self, user_id: int, first_name: Optional[str], username: Optional[str], flags: int = 0):
+        self.id = user_id
+        self.first_name = first_name
+        self.username = username
+        self.flags = flags
+
+    @classmethod
+    def from_user(cls, user) -> "RosterMember":
+        flags = (FLAG_BOT if user.is_bot else 0) | (FLAG_DELETED if user.is_deleted else 0)
+        return cls(user.id, user.first_name, user.username, flags)
+
+    @property
+    def is_bot(self) -> bool:
+        return bool(self.flags & FLAG_BOT)
+
+    @property
+    def is_deleted(self) -> bool:
+        return bool(self.flags & FLAG_DELETED)
+
+    def row(self, chat_id: int, seen_at: float) -> Tuple:
+        return (chat_id, self.id, self.first_name, self.username, self.flags, seen_at)
+
+
+class MemberRoster:
+    """
+    Roster member per chat:
+    - Tabel `roster` (chat_id, user_id) WITHOUT ROWID: id, nama, username, flags
+    - Full refresh di-stream: member langsung dipakai sambil ditulis per chunk
+    - Update incremental (join/leave, author message) di-batch lalu di-flush
+    - Roster kadaluarsa setelah `ttl` detik -> full refresh berikutnya
+    """
+
+    def __init__(self, db_path: str = MEMBER_ROSTER_DB_PATH, ttl: float = DEFAULT_ROSTER_TTL,
+                 flush_delay: float = 1.0, chunk_size: int = 500, seen_cache: int = 8192):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.flush_delay = flush_delay
+        self.chunk_size = chunk_size
+        # chat_id -> waktu full refresh terakhir (hanya chat yang punya roster)
+        self.refreshed_at: Dict[int, float] = {}
+        self._seen = LRUCache(maxsize=seen_cache)
+        self._pending: Dict[Tuple[int, int], Optional[Tuple]] = {}
+        self._flush_handle: Optional[asyncio.Handle] = None
+        # Referensi task flush otomatis (event loop hanya simpan weakref)
+        self._flush_tasks: Set[asyncio.Task] = set()
+        self._db: Optional[aiosqlite.Connection] = None
+        self._open_lock = asyncio.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._refreshing: Set[int] = set()
+
+    def is_tracked(self, chat_id: int) -> bool:
+        return chat_id in self.refreshed_at
+
+    def is_fresh(self, chat_id: int) -> bool:
+        refreshed_at = self.refreshed_at.get(chat_id)
+        return refreshed_at is not None and time.time() - refreshed_at < self.ttl
+
+    async def ensure_loaded(self) -> None:
+        await self._connection()
+
+    async def _connection(self) -> aiosqlite.Connection:
+        if self._db is not None:
+            return self._db
+        async with self._open_lock:
+            if self._db is None:
+                db = await aiosqlite.connect(self.db_path)
+                await db.execute("PRAGMA journal_mode=WAL")
+                await db.execute("PRAGMA synchronous=NORMAL")
+                await db.execute("""
+                    CREATE TABLE IF NOT EXISTS roster (
+                        chat_id INTEGER NOT NULL,
+                        user_id INTEGER NOT NULL,
+                        first_name TEXT,
+                        username TEXT,
+                        flags INTEGER NOT NULL DEFAULT 0,
+                        seen_at REAL NOT NULL,
+                        PRIMARY KEY (chat_id, user_id)
+                    ) WITHOUT ROWID
+                """)
+                await db.execute("""
+                    CREATE TABLE IF NOT EXISTS roster_meta (
+                        chat_id INTEGER PRIMARY KEY,
+                        refreshed_at REAL NOT NULL
+                    )
+                """)
+                await db.commit()
+                async with db.execute("SELECT chat_id, refreshed_at FROM roster_meta") as cursor:
+                    self.refreshed_at = {row[0]: row[1] async for row in cursor}
+                self._db = db
+                logger.info(f"Member roster loaded: {len(self.refreshed_at)} chat")
+        return self._db
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    async def iter_members(self, chat_id: int) -> AsyncIterator[RosterMember]:
+        """Stream member dari roster lokal"""
+        await self.flush()
+        db = await self._connection()
+        async with db.execute(
+            "SELECT user_id, first_name, username, flags FROM roster WHERE chat_id = ?", (chat_id,)
+        ) as cursor:
+            async for user_id, first_name, username, flags in cursor:
+                yield RosterMember(user_id, first_name, username, flags)
+
+    async def count(self, chat_id: int) -> int:
+        await self.flush()
+        db = await self._connection()
+        async with db.execute("SELECT COUNT(*) FROM roster WHERE chat_id = ?", (chat_id,)) as cursor:
+            row = await cursor.fetchone()
+        return row[0] if row else 0
+
+    async def stream_members(self, client, chat_id: int, force: bool = False) -> AsyncIterator[RosterMember]:
+        """
+        Member chat: dari roster kalau masih fresh, selain itu full refresh dari
+        API yang di-stream (member di-yield sambil ditulis ke roster)
+        """
+        await self._connection()
+        if not force and (self.is_fresh(chat_id) or chat_id in self._refreshing):
+            async for member in self.iter_members(chat_id):
+                yield member
+            return
+
+        self._refreshing.add(chat_id)
+        started_at = time.time()
+        chunk = []
+        completed = False
+        try:
+            async for chat_member in client.get_chat_members(chat_id):
+                if not chat_member.user or chat_member.status in _GONE_STATUSES:
+                    continue
+                member = RosterMember.from_user(chat_member.user)
+                chunk.append(member.row(chat_id, started_at))
+                if len(chunk) >= self.chunk_size:
+                    await self._write_rows(chunk)
+                    chunk = []
+                yield member
+            completed = True
+        finally:
+            self._refreshing.discard(chat_id)
+            if chunk:
+                await self._write_rows(chunk)
+            if completed:
+                await self._finish_refresh(chat_id, started_at)
+
+    async def refresh(self, client, chat_id: int) -> int:
+        """Full refresh roster, return jumlah member"""
+        count = 0
+        async for _ in self.stream_members(client, chat_id, force=True):
+            count += 1
+        return count
+
+    async def _write_rows(self, rows) -> None:
+        db = await self._connection()
+        await db.executemany(
+            "INSERT OR REPLACE INTO roster (chat_id, user_id, first_name, username, flags, seen_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        await db.commit()
+
+    async def _finish_refresh(self, chat_id: int, started_at: float) -> None:
+        """Buang member yang tidak muncul di refresh ini, tandai roster fresh"""
+        await self.flush()
+        db = await self._connection()
+        await db.execute("DELETE FROM roster WHERE chat_id = ? AND seen_at < ?", (chat_id, started_at))
+        await db.execute(
+            "INSERT OR REPLACE INTO roster_meta (chat_id, refreshed_at) VALUES (?, ?)",
+            (chat_id, started_at)
+        )
+        await db.commit()
+        self.refreshed_at[chat_id] = started_at
+
+    # ------------------------------------------------------------------
+    # Incremental updates (hanya untuk chat yang sudah punya roster)
+    # ------------------------------------------------------------------
+    def observe(self, chat_id: int, user) -> None:
+        """Catat user yang terlihat di chat (join / kirim message)"""
+        if chat_id not in self.refreshed_at:
+            return
+        member = RosterMember.from_user(user)
+        signature = (member.first_name, member.username, member.flags)
+        if self._seen.get((chat_id, member.id)) == signature:
+            return
+        self._seen.set((chat_id, member.id), signature)
+        self._queue((chat_id, member.id), member.row(chat_id, time.time()))
+
+    def remove(self, chat_id: int, user_id: int) -> None:
+        """User keluar / di-ban"""
+        if chat_id not in self.refreshed_at:
+            return
+        self._seen.pop((chat_id, user_id))
+        self._queue((chat_id, user_id), None)
+
+    def _queue(self, key: Tuple[int, int], row: Optional[Tuple]) -> None:
+        self._pending[key] = row
+        self._schedule_flush(self.flush_delay)
+
+    def _schedule_flush(self, delay: float) -> None:
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(delay, self._start_flush)
+
+    def _start_flush(self) -> None:
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self) -> bool:
+        """
+        Tulis update incremental tertunda dalam satu transaksi. Return False kalau gagal:
+        koneksi ditutup (dibuka ulang saat retry), row dikembalikan ke antrian dan
+        flush dijadwalkan ulang
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return True
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return True
+            upserts = [row for row in pending.values() if row is not None]
+            deletes = [key for key, row in pending.items() if row is None]
+            try:
+                db = await self._connection()
+                if upserts:
+                    await db.executemany(
+                        "INSERT OR REPLACE INTO roster (chat_id, user_id, first_name, username, flags, seen_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        upserts
+                    )
+                if deletes:
+                    await db.executemany("DELETE FROM roster WHERE chat_id = ? AND user_id = ?", deletes)
+                await db.commit()
+                return True
+            except Exception as e:
+                logger.error(f"Member roster flush gagal ({len(pending)} row), diulang {FLUSH_RETRY_DELAY:g}s lagi: {e}")
+                db, self._db = self._db, None
+                if db is not None:
+                    try:
+                        await db.close()
+                    except Exception:
+                        pass
+                # Kembalikan ke antrian, update lebih baru tetap menang
+                for key, row in pending.items():
+                    self._pending.setdefault(key, row)
+                self._schedule_flush(FLUSH_RETRY_DELAY)
+                return False
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+
+
+# Global roster instance
+member_roster = MemberRoster()
@@ -0,0 +1,454 @@
+"""
+Premium Moderation Helper - Compiled Per-Chat Ruleset Index
+Chat tanpa rule ditolak O(1) sebelum ada RPC / query apapun
+Created by: Vzoel Fox's
+"""
+
+import asyncio
+import logging
+import re
+import time
+from array import array
+from collections import OrderedDict
+from typing import (
+    AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, FrozenSet, Iterable,
+    List, Optional, Pattern, Set, Tuple, Union
+)
+
+from pyrogram.errors import ChatAdminRequired, FloodWait, MessageDeleteForbidden
+
+from helpers.chat_store import ChatStore, chat_store
+from utils.cache import LRUCache
+
+# Namespace di chat store: satu row per trigger / per user yang di-lock
+TRIGGERS_NS = "bl_triggers"
+LOCKED_NS = "bl_locked"
+SETTINGS_NS = "bl_settings"
+
+# Batas ID per delete_messages dari API Telegram
+DELETE_BATCH_LIMIT = 100
+
+# Batas setting anti-flood (.setflood N T)
+FLOOD_LIMIT_RANGE = (2, 50)
+FLOOD_WINDOW_RANGE = (1, 300)
+
+logger = logging.getLogger(__name__)
+
+
+class ChatRuleset:
+    """Rule satu chat yang sudah di-compile (triggers -> satu regex alternation)"""
+
+    __slots__ = ("chat_id", "triggers", "pattern", "locked_users", "enabled", "flood_limit", "flood_window")
+
+    def __init__(self, chat_id: int, triggers: List[str], locked_users: FrozenSet[int], enabled: bool = True,
+                 flood_limit: int = 0, flood_window: float = 0.0):
+        self.chat_id = chat_id
+        self.triggers = {trigger.lower(): trigger for trigger in triggers}
+        self.locked_users = locked_users
+        self.enabled = enabled
+        # Anti-flood: lebih dari flood_limit message dalam flood_window detik (0 = off)
+        self.flood_limit = flood_limit
+        self.flood_window = flood_window
+        self.pattern: Optional[Pattern] = None
+        if self.triggers:
+            # Trigger terpanjang dulu supaya "judi online" menang atas "judi"
+            alternation = "|".join(re.escape(t) for t in sorted(self.triggers, key=len, reverse=True))
+            self.pattern = re.compile(alternation, re.IGNORECASE)
+
+    @property
+    def has_rules(self) -> bool:
+        return bool(self.triggers or self.locked_users or self.flood_limit)
+
+    def is_locked(self, user_id: int) -> bool:
+        return user_id in self.locked_users
+
+    def match_triggers(self, text: str, limit: int = 2) -> List[str]:
+        """Trigger yang muncul di text (substring, case insensitive), maks `limit`"""
+        if self.pattern is None or not text:
+            return []
+        matched = []
+        for found in self.pattern.finditer(text):
+            trigger = self.triggers.get(found.group(0).lower())
+            if trigger and trigger not in matched:
+                matched.append(trigger)
+                if len(matched) >= limit:
+                    break
+        return matched
+
+
+class ModerationIndex:
+    """
+    Index rule moderasi:
+    - moderated: set chat_id yang punya rule DAN enabled -> cek O(1) di filter
+    - ruleset ter-compile per chat, di-cache LRU, dibangun ulang saat rule berubah
+    """
+
+    def __init__(self, store: ChatStore = chat_store, cache_size: int = 1024):
+        self.store = store
+        self.moderated: Set[int] = set()
+        self.loaded = False
+        self._rulesets = LRUCache(maxsize=cache_size)
+        self._load_lock = asyncio.Lock()
+
+    async def ensure_loaded(self) -> None:
+        """Load daftar chat yang dimoderasi (sekali, satu query per namespace)"""
+        if self.loaded:
+            return
+        async with self._load_lock:
+            if self.loaded:
+                return
+            chats = set(await self.store.chat_ids(TRIGGERS_NS)) | set(await self.store.chat_ids(LOCKED_NS))
+            disabled = set()
+            for chat_id in await self.store.chat_ids(SETTINGS_NS):
+                settings = await self.store.get_chat(SETTINGS_NS, chat_id)
+                if not settings.get("enabled", True):
+                    disabled.add(chat_id)
+                if settings.get("flood"):
+                    chats.add(chat_id)
+            self.moderated = chats - disabled
+            self.loaded = True
+            logger.info(f"Moderation index: {len(self.moderated)} chat dimoderasi")
+
+    def is_moderated(self, chat_id: int) -> bool:
+        return chat_id in self.moderated
+
+    async def get_ruleset(self, chat_id: int) -> ChatRuleset:
+        ruleset = self._rulesets.get(chat_id)
+        if ruleset is None:
+            triggers = await self.store.get_chat(TRIGGERS_NS, chat_id)
+            locked = await self.store.get_chat(LOCKED_NS, chat_id)
+            settings = await self.store.get_chat(SETTINGS_NS, chat_id)
+            flood = settings.get("flood") or {}
+            ruleset = ChatRuleset(
+                chat_id,
+                list(triggers.values()),
+                frozenset(int(user_id) for user_id in locked),
+                enabled=bool(settings.get("enabled", True)),
+                flood_limit=int(flood.get("limit", 0)),
+                flood_window=float(flood.get("window", 0))
+            )
+            self._rulesets.set(chat_id, ruleset)
+        return ruleset
+
+    async def refresh_chat(self, chat_id: int) -> ChatRuleset:
+        """Rebuild ruleset satu chat setelah trigger/lock/enabled berubah"""
+        self._rulesets.pop(chat_id)
+        ruleset = await self.get_ruleset(chat_id)
+        if ruleset.has_rules and ruleset.enabled:
+            self.moderated.add(chat_id)
+        else:
+            self.moderated.discard(chat_id)
+        return ruleset
+
+    async def set_enabled(self, chat_id: int, enabled: bool) -> ChatRuleset:
+        if enabled:
+            await self.store.delete(SETTINGS_NS, chat_id, "enabled")
+        else:
+            await self.store.set(SETTINGS_NS, chat_id, "enabled", False)
+        return await self.refresh_chat(chat_id)
+
+    async def set_flood(self, chat_id: int, limit: int, window: float) -> ChatRuleset:
+        """Set anti-flood chat, limit 0 = off"""
+        if limit:
+            await self.store.set(SETTINGS_NS, chat_id, "flood", {"limit": limit, "window": window})
+        else:
+            await self.store.delete(SETTINGS_NS, chat_id, "flood")
+        return await self.refresh_chat(chat_id)
+
+
+class _FloodWindow:
+    """Ring buffer timestamp + message ID N message terakhir satu (chat, user)"""
+
+    __slots__ = ("stamps", "message_ids", "pos", "count", "expires")
+
+    def __init__(self, size: int):
+        self.stamps = array("d", bytes(8 * size))
+        self.message_ids = array("q", bytes(8 * size))
+        self.pos = 0
+        self.count = 0
+        self.expires = 0.0
+
+
+class FloodTracker:
+    """
+    Sliding-window flood detector:
+    - Per (chat, user) hanya N timestamp terakhir (array double, bukan list object)
+    - Flood = message ke-N+1 datang kurang dari T detik setelah message N sebelumnya
+    - Entry idle (lewat window) dibuang, total entry dibatasi `max_tracked` (LRU)
+    """
+
+    def __init__(self, max_tracked: int = 20000):
+        self.max_tracked = max_tracked
+        self._windows: "OrderedDict[Tuple[int, int], _FloodWindow]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def hit(self, chat_id: int, user_id: int, message_id: int, limit: int, window: float,
+            now: Optional[float] = None) -> Optional[List[int]]:
+        """
+        Catat satu message. Kalau user melewati limit, return ID message burst
+        (N sebelumnya + message ini) dan reset window user, selain itu None
+        """
+        now = time.monotonic() if now is None else now
+        key = (chat_id, user_id)
+        entry = self._windows.get(key)
+        if entry is None or len(entry.stamps) != limit:
+            entry = _FloodWindow(limit)
+            self._windows[key] = entry
+        else:
+            self._windows.move_to_end(key)
+
+        # Slot di `pos` = timestamp `limit` message yang lalu
+        flooded = entry.count >= limit and now - entry.stamps[entry.pos] <= window
+        burst = entry.message_ids.tolist() + [message_id] if flooded else None
+        entry.stamps[entry.pos] = now
+        entry.message_ids[entry.pos] = message_id
+        entry.pos = (entry.pos + 1) % limit
+        entry.count = min(entry.count + 1, limit)
+        entry.expires = now + window
+
+        if flooded:
+            del self._windows[key]
+        self._evict(now)
+        return burst
+
+    def forget_chat(self, chat_id: int) -> None:
+        for key in [key for key in self._windows if key[0] == chat_id]:
+            del self._windows[key]
+
+    def _evict(self, now: float) -> None:
+        windows = self._windows
+        while windows:
+            key, entry = next(iter(windows.items()))
+            if len(windows) <= self.max_tracked and entry.expires > now:
+                break
+            del windows[key]
+
+
+class ChatModerationStats:
+    """Counter moderasi per chat"""
+
+    __slots__ = ("queued", "deleted", "failed", "batches", "flood_locks", "last_error")
+
+    def __init__(self):
+        self.queued = 0
+        self.deleted = 0
+        self.failed = 0
+        self.batches = 0
+        self.flood_locks = 0
+        self.last_error: Optional[str] = None
+
+
+class ModerationStats:
+    """Statistik moderasi (in-memory, per chat + total)"""
+
+    def __init__(self):
+        self.chats: Dict[int, ChatModerationStats] = {}
+
+    def chat(self, chat_id: int) -> ChatModerationStats:
+        stats = self.chats.get(chat_id)
+        if stats is None:
+            stats = self.chats[chat_id] = ChatModerationStats()
+        return stats
+
+    def totals(self) -> Dict[str, int]:
+        return {
+            "queued": sum(s.queued for s in self.chats.values()),
+            "deleted": sum(s.deleted for s in self.chats.values()),
+            "failed": sum(s.failed for s in self.chats.values()),
+            "batches": sum(s.batches for s in self.chats.values()),
+        }
+
+
+class DeletionQueue:
+    """
+    Antrian delete per chat:
+    - Message ID dikumpulkan selama `window` detik lalu dihapus dalam satu RPC
+    - Langsung di-flush kalau sudah DELETE_BATCH_LIMIT ID
+    - Sebagian gagal (pts_count < jumlah ID / error) dicatat ke ModerationStats
+    """
+
+    def __init__(self, stats: ModerationStats, window: float = 0.5, batch_limit: int = DELETE_BATCH_LIMIT):
+        self.stats = stats
+        self.window = window
+        self.batch_limit = batch_limit
+        self._pending: Dict[int, List[int]] = {}
+        self._clients: Dict[int, object] = {}
+        self._timers: Dict[int, asyncio.TimerHandle] = {}
+        self._locks: Dict[int, asyncio.Lock] = {}
+        # Referensi task flush yang sedang jalan (event loop hanya simpan weakref)
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        return sum(len(ids) for ids in self._pending.values())
+
+    def enqueue(self, client, chat_id: int, message_id: int) -> None:
+        """Queue satu message untuk dihapus (non-blocking)"""
+        ids = self._pending.setdefault(chat_id, [])
+        ids.append(message_id)
+        self._clients[chat_id] = client
+        self.stats.chat(chat_id).queued += 1
+
+        if len(ids) >= self.batch_limit:
+            self._cancel_timer(chat_id)
+            self._start_flush(chat_id)
+        elif chat_id not in self._timers:
+            self._timers[chat_id] = asyncio.get_running_loop().call_later(
+                self.window, self._start_flush, chat_id
+            )
+
+    def _start_flush(self, chat_id: int) -> None:
+        task = asyncio.get_running_loop().create_task(self.flush_chat(chat_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush_chat(self, chat_id: int) -> None:
+        self._cancel_timer(chat_id)
+        lock = self._locks.setdefault(chat_id, asyncio.Lock())
+        async with lock:
+            ids = self._pending.pop(chat_id, None)
+            client = self._clients.pop(chat_id, None)
+            if not ids or client is None:
+                return
+            for start in range(0, len(ids), self.batch_limit):
+                await self._delete_batch(client, chat_id, ids[start:start + self.batch_limit])
+
+    async def flush(self) -> None:
+        """Flush semua chat (mis. sebelum shutdown)"""
+        await asyncio.gather(*(self.flush_chat(chat_id) for chat_id in list(self._pending)))
+
+    async def _delete_batch(self, client, chat_id: int, ids: List[int]) -> None:
+        await delete_batch(client, chat_id, ids, self.stats)
+
+    def _cancel_timer(self, chat_id: int) -> None:
+        timer = self._timers.pop(chat_id, None)
+        if timer is not None:
+            timer.cancel()
+
+
+async def delete_batch(client, chat_id: int, ids: List[int], stats: ModerationStats) -> int:
+    """
+    Satu delete_messages (maks DELETE_BATCH_LIMIT ID), hasil dicatat ke stats.
+    Return jumlah message yang benar-benar terhapus
+    """
+    chat_stats = stats.chat(chat_id)
+    chat_stats.batches += 1
+    for attempt in range(2):
+        try:
+            deleted = await client.delete_messages(chat_id, ids)
+            deleted = min(deleted or 0, len(ids))
+            chat_stats.deleted += deleted
+            if deleted < len(ids):
+                # Sudah terhapus duluan / bukan milik chat ini lagi
+                chat_stats.failed += len(ids) - deleted
+                chat_stats.last_error = f"{len(ids) - deleted}/{len(ids)} message tidak terhapus"
+            return deleted
+        except FloodWait as e:
+            if attempt:
+                error = f"FloodWait {e.value}s"
+                break
+            await asyncio.sleep(e.value)
+        except (MessageDeleteForbidden, ChatAdminRequired) as e:
+            error = f"Tidak punya izin delete ({e.__class__.__name__})"
+            break
+        except Exception as e:
+            error = str(e)
+            break
+    chat_stats.failed += len(ids)
+    chat_stats.last_error = error
+    logger.warning(f"Batch delete {len(ids)} message di {chat_id} gagal: {error}")
+    return 0
+
+
+# ----------------------------------------------------------------------
+# Purge pipeline: history -> filter -> batch -> delete (concurrency terbatas)
+# ----------------------------------------------------------------------
+async def history_messages(client, chat_id: int, offset_id: int = 0, min_id: int = 0,
+                           max_messages: int = 0) -> AsyncIterator:
+    """
+    Stream history (terbaru dulu, per page dari server), berhenti di bawah min_id
+    atau setelah `max_messages` message di-scan (0 = tanpa batas)
+    """
+    async for message in client.get_chat_history(chat_id, limit=max_messages, offset_id=offset_id):
+        if message.id < min_id:
+            break
+        yield message
+
+
+async def select_message_ids(messages: AsyncIterable, predicate: Optional[Callable] = None,
+                             limit: int = 0) -> AsyncIterator[int]:
+    """Filter message lewat predicate, yield ID-nya (maks `limit`, 0 = tanpa batas)"""
+    count = 0
+    async for message in messages:
+        if predicate is None or predicate(message):
+            yield message.id
+            count += 1
+            if limit and count >= limit:
+                break
+
+
+async def batched_ids(ids: Union[AsyncIterable[int], Iterable[int]],
+                      size: int = DELETE_BATCH_LIMIT) -> AsyncIterator[List[int]]:
+    """Kelompokkan ID (sync / async iterable) jadi list berukuran `size`"""
+    batch: List[int] = []
+    if hasattr(ids, "__aiter__"):
+        async for message_id in ids:
+            batch.append(message_id)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+    else:
+        for message_id in ids:
+            batch.append(message_id)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+async def purge_batches(client, chat_id: int, batches: AsyncIterable[List[int]],
+                        stats: ModerationStats, concurrency: int = 4,
+                        on_progress: Optional[Callable[[int, int], Awaitable[None]]] = None,
+                        progress_interval: float = 2.0) -> Tuple[int, int]:
+    """
+    Hapus batch secara paralel (maks `concurrency` RPC in-flight). Scan history
+    tetap jalan selama delete berlangsung. Return (deleted, scanned_ids)
+    """
+    window = asyncio.Semaphore(concurrency)
+    tasks: Set[asyncio.Task] = set()
+    totals = {"deleted": 0, "queued": 0}
+    last_report = time.monotonic()
+
+    async def run(batch: List[int]) -> None:
+        try:
+            deleted = await delete_batch(client, chat_id, batch, stats)
+            totals["deleted"] += deleted
+        finally:
+            window.release()
+
+    try:
+        async for batch in batches:
+            await window.acquire()
+            totals["queued"] += len(batch)
+            task = asyncio.create_task(run(batch))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+            if on_progress and time.monotonic() - last_report >= progress_interval:
+                last_report = time.monotonic()
+                await on_progress(totals["deleted"], totals["queued"])
+        if tasks:
+            await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return totals["deleted"], totals["queued"]
+
+
+# Global instances
+moderation_index = ModerationIndex()
+moderation_stats = ModerationStats()
+deletion_queue = DeletionQueue(moderation_stats)
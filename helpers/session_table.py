@@ -0,0 +1,116 @@
+"""
+Premium Session Table - Record Ringkas untuk Session Animasi / Monitor
+Session cukup simpan chat_id + message_id + data minimal, bukan Message/User
+Created by: Vzoel Fox's
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+from pyrogram.errors import MessageNotModified
+
+logger = logging.getLogger(__name__)
+
+# Batas session aktif per jenis; session tertua dihentikan kalau penuh
+DEFAULT_SESSION_LIMITS = {
+    "tagall": 200,
+    "checkid": 20,
+    "vc": 50,
+}
+
+
+class SessionRecord:
+    """Satu session aktif: cukup untuk edit message dan render ulang"""
+
+    __slots__ = ("kind", "key", "chat_id", "message_id", "data", "started_at", "active")
+
+    def __init__(self, kind: str, key: Hashable, chat_id: int, message_id: int, data: Any = None):
+        self.kind = kind
+        self.key = key
+        self.chat_id = chat_id
+        self.message_id = message_id
+        self.data = data
+        self.started_at = time.time()
+        self.active = True
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.started_at
+
+    async def edit(self, client, text: str, **kwargs) -> None:
+        """Edit message session lewat (chat_id, message_id), MessageNotModified diabaikan"""
+        try:
+            await client.edit_message_text(self.chat_id, self.message_id, text, **kwargs)
+        except MessageNotModified:
+            pass
+
+
+class SessionTable:
+    """
+    Tabel session per jenis (tagall / checkid / vc):
+    - open() mendaftarkan record, session tertua jenis itu dihentikan kalau limit penuh
+    - stop() / stop_kind() cukup set flag `active`; loop session keluar sendiri
+    """
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None, default_limit: int = 50):
+        self.limits = dict(DEFAULT_SESSION_LIMITS if limits is None else limits)
+        self.default_limit = default_limit
+        self._sessions: Dict[str, "OrderedDict[Hashable, SessionRecord]"] = {}
+
+    def open(self, kind: str, key: Hashable, chat_id: int, message_id: int,
+             data: Any = None) -> SessionRecord:
+        sessions = self._sessions.setdefault(kind, OrderedDict())
+        existing = sessions.pop(key, None)
+        if existing is not None:
+            existing.active = False
+
+        limit = self.limits.get(kind, self.default_limit)
+        while len(sessions) >= limit:
+            _, oldest = sessions.popitem(last=False)
+            oldest.active = False
+            logger.info(f"Session limit {kind} ({limit}) tercapai, session {oldest.key} dihentikan")
+
+        record = SessionRecord(kind, key, chat_id, message_id, data)
+        sessions[key] = record
+        return record
+
+    def get(self, kind: str, key: Hashable) -> Optional[SessionRecord]:
+        return self._sessions.get(kind, {}).get(key)
+
+    def close(self, record: SessionRecord) -> None:
+        """Dipanggil loop session saat selesai"""
+        record.active = False
+        sessions = self._sessions.get(record.kind)
+        if sessions is not None and sessions.get(record.key) is record:
+            del sessions[record.key]
+
+    def stop(self, kind: str, key: Hashable) -> bool:
+        record = self._sessions.get(kind, {}).pop(key, None)
+        if record is None:
+            return False
+        record.active = False
+        return True
+
+    def stop_kind(self, kind: str, chat_id: Optional[int] = None) -> int:
+        """Hentikan semua session satu jenis (opsional hanya di satu chat)"""
+        sessions = self._sessions.get(kind)
+        if not sessions:
+            return 0
+        stopped = [key for key, record in sessions.items() if chat_id is None or record.chat_id == chat_id]
+        for key in stopped:
+            sessions.pop(key).active = False
+        return len(stopped)
+
+    def sessions(self, kind: str) -> List[SessionRecord]:
+        return list(self._sessions.get(kind, {}).values())
+
+    def count(self, kind: Optional[str] = None) -> int:
+        if kind is not None:
+            return len(self._sessions.get(kind, ()))
+        return sum(len(sessions) for sessions in self._sessions.values())
+
+
+# Global session table
+session_table = SessionTable()
@@ -8,9 +8,10 @@ import logging
 import json
 import os
 from datetime import datetime
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Mapping, Optional, Union, List
 from pyrogram import Client
 from pyrogram.types import Message
+from helper_config import get_config_service
 
 try:
     from utils.assets import VzoelAssets, vzoel_msg, bold, italic, emoji
@@ -28,7 +29,6 @@ class VzoelLogger:
     
     def __init__(self, config_path: str = "vzoel/config.json"):
         self.config_path = config_path
-        self.config = self.load_config()
         self.assets = None
         
         # Initialize premium assets if available
@@ -41,7 +41,6 @@ class VzoelLogger:
         self.setup_local_logging()
         
         # Telegram logging setup
-        self.log_group_id = self.config.get("logging", {}).get("log_group_id")
         self.telegram_client = None
         
         # Logging statistics
@@ -54,17 +53,19 @@ class VzoelLogger:
             "session_start": datetime.now().isoformat()
         }
     
-    def load_config(self) -> Dict[str, Any]:
-        """Load configuration dari vzoel/config.json"""
-        try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                return {}
-        except Exception as e:
-            print(f"Failed to load config: {e}")
-            return {}
+    @property
+    def config(self) -> Mapping[str, Any]:
+        """Config snapshot terbaru (hot reload saat config.json berubah)"""
+        return self.load_config()
+    
+    @property
+    def log_group_id(self) -> Optional[int]:
+        return get_config_service(self.config_path).snapshot.log_group_id
+    
+    def load_config(self) -> Mapping[str, Any]:
+        """Load configuration dari shared ConfigService (snapshot read-only)"""
+        snapshot = get_config_service(self.config_path).snapshot
+        return snapshot.data if snapshot.loaded else {}
     
     def setup_local_logging(self):
         """Setup local file logging system"""
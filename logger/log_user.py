@@ -7,10 +7,11 @@ Created by: Vzoel Fox's
 import json
 import os
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Mapping, Optional, Union
 from collections import defaultdict
 from pyrogram import Client
 from pyrogram.types import Message, User, Chat
+from helper_config import get_config_service
 
 try:
     from utils.assets import VzoelAssets, bold, italic, emoji
@@ -27,7 +28,6 @@ class UserActivityLogger:
     def __init__(self, config_path: str = "vzoel/config.json", data_dir: str = "user_data"):
         self.config_path = config_path
         self.data_dir = data_dir
-        self.config = self.load_config()
         
         # Create data directory
         os.makedirs(self.data_dir, exist_ok=True)
@@ -47,16 +47,15 @@ class UserActivityLogger:
         except:
             pass
     
-    def load_config(self) -> Dict[str, Any]:
-        """Load configuration dari vzoel/config.json"""
-        try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return {}
-        except Exception as e:
-            print(f"Failed to load config: {e}")
-            return {}
+    @property
+    def config(self) -> Mapping[str, Any]:
+        """Config snapshot terbaru (hot reload saat config.json berubah)"""
+        return self.load_config()
+    
+    def load_config(self) -> Mapping[str, Any]:
+        """Load configuration dari shared ConfigService (snapshot read-only)"""
+        snapshot = get_config_service(self.config_path).snapshot
+        return snapshot.data if snapshot.loaded else {}
     
     def load_user_activities(self) -> Dict[str, Any]:
         """Load user activities dari file"""
@@ -8,14 +8,45 @@ from pyrogram import Client, filters
 from pyrogram.types import Message, InlineKeyboardMarkup, InlineKeyboardButton, CallbackQuery
 from helpers.autonomous_bot_helper import AutonomousBotCreator, PremiumEmojiMapper
 from helpers.display_helper import DisplayHelper
-from utils.assets import VzoelAssets, vzoel_msg, bold, italic, emoji
+from helpers.job_manager import job_manager, JOB_BUDGETS
+from utils.assets import vzoel_assets, vzoel_msg, bold, italic, emoji
 from logger import log_info, log_error, log_success, log_user_command
 import asyncio
 import json
 
 # Initialize premium components
 display_helper = DisplayHelper()
-assets = VzoelAssets()
+assets = vzoel_assets  # shared instance, font/emoji JSON tidak di-load ulang
+
+# Jeda antar bot di bulk create (rate limit @BotFather)
+BULK_CREATE_DELAY = 60
+
+def job_footer(job) -> str:
+    """Info job + cara cancel, ditempel di loading message"""
+    return f"\n\n{emoji('loading')} Job #{job.id} (budget {job.budget:g}s) • `.cancel {job.id}`"
+
+def job_slots_full_message() -> str:
+    return display_helper.create_error_message(
+        "Too many background jobs running",
+        ["Check running jobs with .jobs", "Cancel one with .cancel <id>", "Try again later"]
+    )
+
+async def report_job_end(job, edit) -> None:
+    """Edit status message kalau job tidak selesai normal (timeout / cancelled / failed)"""
+    if job.status == "done":
+        return
+    reasons = {
+        "timeout": f"Job #{job.id} exceeded its {job.budget:g}s time budget",
+        "cancelled": f"Job #{job.id} was cancelled",
+    }
+    error_msg = display_helper.create_error_message(
+        reasons.get(job.status, f"Job #{job.id} failed: {job.error}"),
+        ["Bots created before this point are saved", "Use /autobot report to check"]
+    )
+    try:
+        await edit(error_msg)
+    except Exception as e:
+        log_error(f"Failed to report job #{job.id}: {e}")
 
 @Client.on_message(filters.command("autobot"))
 async def autonomous_bot_menu(client: Client, message: Message):
@@ -104,29 +135,40 @@ async def create_single_bot_command(client: Client, message: Message):
         )
         loading_message = await message.reply_text(loading_msg)
         
-        # Create bot
+        # Create bot di background job (handler langsung selesai)
         bot_creator = AutonomousBotCreator(client)
-        result = await bot_creator.create_bot_automatically()
-        
-        if result["success"]:
-            bot_info = result["bot_info"]
-            success_msg = display_helper.create_success_message(
-                f"Bot created successfully: @{bot_info['username']}",
-                [
-                    f"Name: {bot_info['name']}",
-                    f"Username: @{bot_info['username']}",
-                    f"Token: `{bot_info['token']}`",
-                    f"Description: {bot_info['description'][:50]}..."
-                ]
-            )
-            await loading_message.edit_text(success_msg)
-            log_success(f"Bot @{bot_info['username']} created via command")
-        else:
-            error_msg = display_helper.create_error_message(
-                f"Failed to create bot: {result.get('error', 'Unknown error')}",
-                ["Try again later", "Check @BotFather availability", "Contact support"]
-            )
-            await loading_message.edit_text(error_msg)
+        
+        async def run_create():
+            result = await bot_creator.create_bot_automatically()
+            
+            if result["success"]:
+                bot_info = result["bot_info"]
+                success_msg = display_helper.create_success_message(
+                    f"Bot created successfully: @{bot_info['username']}",
+                    [
+                        f"Name: {bot_info['name']}",
+                        f"Username: @{bot_info['username']}",
+                        f"Token: `{bot_info['token']}`",
+                        f"Description: {bot_info['description'][:50]}..."
+                    ]
+                )
+                await loading_message.edit_text(success_msg)
+                log_success(f"Bot @{bot_info['username']} created via command")
+            else:
+                error_msg = display_helper.create_error_message(
+                    f"Failed to create bot: {result.get('error', 'Unknown error')}",
+                    ["Try again later", "Check @BotFather availability", "Contact support"]
+                )
+                await loading_message.edit_text(error_msg)
+
+        job = job_manager.start(
+            "autobot_create", run_create(), chat_id=message.chat.id,
+            on_done=lambda job: report_job_end(job, loading_message.edit_text)
+        )
+        if job is None:
+            await loading_message.edit_text(job_slots_full_message())
+            return
+        await loading_message.edit_text(loading_msg + job_footer(job))
             
     except Exception as e:
         error_msg = display_helper.create_error_message(
@@ -233,55 +275,65 @@ async def create_single_bot_callback(client: Client, callback_query: CallbackQue
             "Creating Single Autonomous Bot",
             ["Contacting @BotFather", "Generating unique credentials", "Setting up bot profile"]
         )
-        await callback_query.edit_message_text(loading_msg)
         
-        # Create bot
+        # Create bot di background job (handler langsung selesai)
         bot_creator = AutonomousBotCreator(client)
-        result = await bot_creator.create_bot_automatically()
         
-        if result["success"]:
-            bot_info = result["bot_info"]
-            success_lines = [
-                f"{emoji('utama')} **Bot Created Successfully!**",
-                "",
-                f"{emoji('centang')} **Bot Information:**",
-                f"• Name: {bold(bot_info['name'])}",
-                f"• Username: {bold('@' + bot_info['username'])}",
-                f"• Token: `{bot_info['token']}`",
-                f"• Created: {bold(bot_info['created_at'][:19])}",
-                "",
-                f"{emoji('loading')} **Next Steps:**",
-                f"• Save the token securely",
-                f"• Configure bot settings if needed",
-                f"• Test bot functionality",
-                "",
-                f"{italic('Bot is now ready for use!')}"
-            ]
+        async def run_create():
+            result = await bot_creator.create_bot_automatically()
             
-            back_keyboard = InlineKeyboardMarkup([
-                [InlineKeyboardButton(f"{emoji('loading')} ← Back to Menu", callback_data="autobot_main")]
-            ])
+            if result["success"]:
+                bot_info = result["bot_info"]
+                success_lines = [
+                    f"{emoji('utama')} **Bot Created Successfully!**",
+                    "",
+                    f"{emoji('centang')} **Bot Information:**",
+                    f"• Name: {bold(bot_info['name'])}",
+                    f"• Username: {bold('@' + bot_info['username'])}",
+                    f"• Token: `{bot_info['token']}`",
+                    f"• Created: {bold(bot_info['created_at'][:19])}",
+                    "",
+                    f"{emoji('loading')} **Next Steps:**",
+                    f"• Save the token securely",
+                    f"• Configure bot settings if needed",
+                    f"• Test bot functionality",
+                    "",
+                    f"{italic('Bot is now ready for use!')}"
+                ]
             
-            await callback_query.edit_message_text("\n".join(success_lines), reply_markup=back_keyboard)
-        else:
-            error_lines = [
-                f"{emoji('merah')} **Bot Creation Failed**",
-                "",
-                f"Error: {result.get('error', 'Unknown error')}",
-                "",
-                f"{emoji('loading')} **Possible Solutions:**",
-                f"• Wait a few minutes and try again",
-                f"• Check @BotFather availability",
-                f"• Ensure account has bot creation permissions",
-                "",
-                f"{italic('Contact support if problem persists')}"
-            ]
+                back_keyboard = InlineKeyboardMarkup([
+                    [InlineKeyboardButton(f"{emoji('loading')} ← Back to Menu", callback_data="autobot_main")]
+                ])
             
-            back_keyboard = InlineKeyboardMarkup([
-                [InlineKeyboardButton(f"{emoji('loading')} ← Back to Menu", callback_data="autobot_main")]
-            ])
+                await callback_query.edit_message_text("\n".join(success_lines), reply_markup=back_keyboard)
+            else:
+                error_lines = [
+                    f"{emoji('merah')} **Bot Creation Failed**",
+                    "",
+                    f"Error: {result.get('error', 'Unknown error')}",
+                    "",
+                    f"{emoji('loading')} **Possible Solutions:**",
+                    f"• Wait a few minutes and try again",
+                    f"• Check @BotFather availability",
+                    f"• Ensure account has bot creation permissions",
+                    "",
+                    f"{italic('Contact support if problem persists')}"
+                ]
+            
+                back_keyboard = InlineKeyboardMarkup([
+                    [InlineKeyboardButton(f"{emoji('loading')} ← Back to Menu", callback_data="autobot_main")]
+                ])
             
-            await callback_query.edit_message_text("\n".join(error_lines), reply_markup=back_keyboard)
+                await callback_query.edit_message_text("\n".join(error_lines), reply_markup=back_keyboard)
+
+        job = job_manager.start(
+            "autobot_create", run_create(), chat_id=callback_query.message.chat.id,
+            on_done=lambda job: report_job_end(job, callback_query.edit_message_text)
+        )
+        if job is None:
+            await callback_query.edit_message_text(job_slots_full_message())
+            return
+        await callback_query.edit_message_text(loading_msg + job_footer(job))
         
     except Exception as e:
         await callback_query.answer(f"❌ Error: {str(e)}", show_alert=True)
@@ -303,7 +355,7 @@ async def create_multiple_bots_callback(client: Client, callback_query: Callback
             f"{emoji('loading')} **Important Notes:**",
             f"• Each bot creation takes ~60 seconds",
             f"• Delays prevent @BotFather rate limits",
-            f"• Process cannot be cancelled once started",
+            f"• Runs in background, cancel with `.cancel <id>`",
             f"• All tokens will be saved automatically",
             "",
             f"{italic('Select quantity below:')}"
@@ -335,54 +387,65 @@ async def create_bulk_bots_callback(client: Client, callback_query: CallbackQuer
         
         loading_msg = display_helper.create_loading_message(
             f"Creating {count} Autonomous Bots",
-            ["This process will take several minutes", "Please wait patiently", "Do not close this message"]
+            ["This process will take several minutes", "Runs in background, check with .jobs", "Cancel anytime with .cancel <id>"]
         )
-        await callback_query.edit_message_text(loading_msg)
         
-        # Create multiple bots
+        # Create multiple bots di background job, budget sesuai jumlah bot
         bot_creator = AutonomousBotCreator(client)
-        results = await bot_creator.create_multiple_bots(count=count, delay=60)
-        
-        # Process results
-        successful = [r for r in results if r["success"]]
-        failed = [r for r in results if not r["success"]]
-        
-        result_lines = [
-            f"{emoji('utama')} **Bulk Bot Creation Complete**",
-            "",
-            f"{emoji('centang')} **Results Summary:**",
-            f"• Successful: {bold(str(len(successful)))}/{count}",
-            f"• Failed: {bold(str(len(failed)))}/{count}",
-            f"• Success Rate: {bold(f'{len(successful)/count*100:.1f}%')}",
-            ""
-        ]
         
-        if successful:
-            result_lines.append(f"{emoji('loading')} **Successfully Created:**")
-            for bot in successful[:3]:  # Show first 3
-                result_lines.append(f"• {bold(bot['name'])} (@{bot['username']})")
+        async def run_bulk():
+            results = await bot_creator.create_multiple_bots(count=count, delay=BULK_CREATE_DELAY)
             
-            if len(successful) > 3:
-                result_lines.append(f"... and {len(successful)-3} more bots")
-            result_lines.append("")
+            # Process results
+            successful = [r for r in results if r["success"]]
+            failed = [r for r in results if not r["success"]]
         
-        if failed:
-            result_lines.append(f"{emoji('merah')} **Failed Creations:**")
-            for bot in failed[:2]:  # Show first 2 errors
-                result_lines.append(f"• Error: {bot.get('error', 'Unknown')}")
-            result_lines.append("")
+            result_lines = [
+                f"{emoji('utama')} **Bulk Bot Creation Complete**",
+                "",
+                f"{emoji('centang')} **Results Summary:**",
+                f"• Successful: {bold(str(len(successful)))}/{count}",
+                f"• Failed: {bold(str(len(failed)))}/{count}",
+                f"• Success Rate: {bold(f'{len(successful)/count*100:.1f}%')}",
+                ""
+            ]
         
-        result_lines.extend([
-            f"{emoji('aktif')} **All bot tokens saved to autonomous_bots.json**",
-            "",
-            f"{italic('Use /autobot report to view detailed information')}"
-        ])
+            if successful:
+                result_lines.append(f"{emoji('loading')} **Successfully Created:**")
+                for bot in successful[:3]:  # Show first 3
+                    result_lines.append(f"• {bold(bot['name'])} (@{bot['username']})")
+            
+                if len(successful) > 3:
+                    result_lines.append(f"... and {len(successful)-3} more bots")
+                result_lines.append("")
+        
+            if failed:
+                result_lines.append(f"{emoji('merah')} **Failed Creations:**")
+                for bot in failed[:2]:  # Show first 2 errors
+                    result_lines.append(f"• Error: {bot.get('error', 'Unknown')}")
+                result_lines.append("")
+        
+            result_lines.extend([
+                f"{emoji('aktif')} **All bot tokens saved to autonomous_bots.json**",
+                "",
+                f"{italic('Use /autobot report to view detailed information')}"
+            ])
         
-        back_keyboard = InlineKeyboardMarkup([
-            [InlineKeyboardButton(f"{emoji('loading')} ← Back to Menu", callback_data="autobot_main")]
-        ])
+            back_keyboard = InlineKeyboardMarkup([
+                [InlineKeyboardButton(f"{emoji('loading')} ← Back to Menu", callback_data="autobot_main")]
+            ])
         
-        await callback_query.edit_message_text("\n".join(result_lines), reply_markup=back_keyboard)
+            await callback_query.edit_message_text("\n".join(result_lines), reply_markup=back_keyboard)
+
+        job = job_manager.start(
+            "autobot_bulk", run_bulk(), chat_id=callback_query.message.chat.id,
+            budget=count * (JOB_BUDGETS["autobot_create"] + BULK_CREATE_DELAY),
+            on_done=lambda job: report_job_end(job, callback_query.edit_message_text)
+        )
+        if job is None:
+            await callback_query.edit_message_text(job_slots_full_message())
+            return
+        await callback_query.edit_message_text(loading_msg + job_footer(job))
         
     except Exception as e:
         await callback_query.answer(f"❌ Error: {str(e)}", show_alert=True)
@@ -515,6 +578,48 @@ async def emoji_report_callback(client: Client, callback_query: CallbackQuery):
     except Exception as e:
         await callback_query.answer(f"❌ Error: {str(e)}", show_alert=True)
 
+@Client.on_callback_query(filters.regex("autobot_test_token"))
+async def test_tokens_callback(client: Client, callback_query: CallbackQuery):
+    """Validate all saved bot tokens (Bot API getMe, concurrent)"""
+    
+    try:
+        await callback_query.answer("Checking tokens...")
+        
+        bot_creator = AutonomousBotCreator(client)
+        checked = await bot_creator.validate_created_bots()
+        
+        valid = [bot for bot, result in checked if result["valid"]]
+        invalid = [(bot, result) for bot, result in checked if not result["valid"]]
+        
+        result_lines = [
+            f"{emoji('utama')} **Token Validation**",
+            "",
+            f"{emoji('centang')} **Results Summary:**",
+            f"• Checked: {bold(str(len(checked)))}",
+            f"• Valid: {bold(str(len(valid)))}",
+            f"• Invalid / Unreachable: {bold(str(len(invalid)))}",
+            ""
+        ]
+        
+        if invalid:
+            result_lines.append(f"{emoji('merah')} **Problems:**")
+            for bot, result in invalid[:5]:
+                result_lines.append(f"• @{bot.get('username', '?')}: {result.get('error', 'Unknown')}")
+            if len(invalid) > 5:
+                result_lines.append(f"... and {len(invalid)-5} more")
+            result_lines.append("")
+        
+        result_lines.append(f"{italic('Bot status in autonomous_bots.json updated')}")
+        
+        back_keyboard = InlineKeyboardMarkup([
+            [InlineKeyboardButton(f"{emoji('loading')} ← Back to Menu", callback_data="autobot_main")]
+        ])
+        
+        await callback_query.edit_message_text("\n".join(result_lines), reply_markup=back_keyboard)
+        
+    except Exception as e:
+        await callback_query.answer(f"❌ Error: {str(e)}", show_alert=True)
+
 @Client.on_callback_query(filters.regex("autobot_main"))
 async def return_to_main_menu(client: Client, callback_query: CallbackQuery):
     """Return to main autonomous bot menu"""
@@ -6,13 +6,12 @@ Created by: VZLfxs @Lutpan
 """
 
 import asyncio
-import json
-import os
 from typing import List, Dict, Set, Optional
+from pyrogram import filters
 from pyrogram.types import Message, User
-from pyrogram.enums import ParseMode, ChatMemberStatus
+from pyrogram.enums import ParseMode, ChatMemberStatus, ChatType
 from pyrogram.errors import (
-    ChatAdminRequired, MessageDeleteForbidden, MessageNotModified,
+    ChatAdminRequired, FloodWait, MessageDeleteForbidden, MessageNotModified,
     UsernameNotOccupied, UsernameInvalid, PeerIdInvalid
 )
 
@@ -20,16 +19,39 @@ from pyrogram.errors import (
 from helper_client import VzoelClient, is_user_mode, get_client_type
 from helper_cmd_handler import CMD_HANDLER, get_command, get_arguments
 from helper_logger import LOGGER
+from helpers.chat_store import chat_store
+from helpers.job_manager import job_manager, current_job, report_progress
+from helpers.moderation_helper import (
+    TRIGGERS_NS, LOCKED_NS, FLOOD_LIMIT_RANGE, FLOOD_WINDOW_RANGE, FloodTracker,
+    moderation_index, moderation_stats, deletion_queue,
+    history_messages, select_message_ids, batched_ids, purge_batches
+)
 from utils.assets import vzoel_assets, premium_emoji, bold, italic, monospace, emoji, vzoel_signature
+from utils.cache import LRUCache
+
+# Group handler sendiri: monitor tidak lagi menutupi handler lain di group 0
+BLACKLIST_MONITOR_GROUP = 1
+GROUP_CHAT_TYPES = (ChatType.GROUP, ChatType.SUPERGROUP)
+
+# Batas .purge N supaya salah ketik tidak menghapus seluruh history
+PURGE_MAX_MESSAGES = 50000
+# .purge N <filter>: history yang di-scan maks N x faktor ini (filter jarang match tidak scan seluruh chat)
+PURGE_SCAN_FACTOR = 10
 
 class PremiumBlacklistSystem:
     """Premium Blacklist System dengan word triggers dan user locks"""
     
     def __init__(self):
+        # File lama, dimigrasi sekali ke chat store (SQLite) saat pertama dipakai
         self.blacklist_file = "blacklist_data.json"
+        self._ready = False
+        self._ready_lock = asyncio.Lock()
         
-        # Load existing blacklist data
-        self.blacklist_data = self.load_blacklist_data()
+        # Status admin untuk monitor (hanya dicek setelah ada rule yang match)
+        self.admin_cache = LRUCache(maxsize=4096, ttl=300)
+        
+        # Anti-flood per (chat, user), memori dibatasi
+        self.flood_tracker = FloodTracker(max_tracked=20000)
         
         # Premium emoji hanya dari mapping
         self.blacklist_emoji = {
@@ -44,110 +66,94 @@ class PremiumBlacklistSystem:
             "warning": emoji("proses")      # 🔄 - Warning
         }
         
-    def load_blacklist_data(self) -> Dict:
-        """Load blacklist data dari file"""
-        try:
-            if os.path.exists(self.blacklist_file):
-                with open(self.blacklist_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return {"word_triggers": {}, "locked_users": {}}
-        except Exception as e:
-            LOGGER.error(f"Error loading blacklist data: {e}")
-            return {"word_triggers": {}, "locked_users": {}}
-    
-    def save_blacklist_data(self) -> bool:
-        """Save blacklist data ke file"""
-        try:
-            with open(self.blacklist_file, 'w', encoding='utf-8') as f:
-                json.dump(self.blacklist_data, f, indent=2, ensure_ascii=False)
-            return True
-        except Exception as e:
-            LOGGER.error(f"Error saving blacklist data: {e}")
-            return False
-    
-    def add_word_trigger(self, chat_id: int, trigger_word: str) -> bool:
+    async def ensure_ready(self) -> None:
+        """Migrasi satu kali dari blacklist_data.json ke chat store, lalu load rule index"""
+        if self._ready:
+            return
+        async with self._ready_lock:
+            if not self._ready:
+                await chat_store.migrate_json("blacklist", self.blacklist_file, self._convert_legacy)
+                await moderation_index.ensure_loaded()
+                self._ready = True
+    
+    @staticmethod
+    def _convert_legacy(data: Dict):
+        """blacklist_data.json lama -> row (namespace, chat_id, key, value)"""
+        for chat_key, triggers in data.get("word_triggers", {}).items():
+            for trigger in triggers:
+                yield TRIGGERS_NS, chat_key, trigger.lower(), trigger
+        for chat_key, users in data.get("locked_users", {}).items():
+            for user_key, info in users.items():
+                yield LOCKED_NS, chat_key, user_key, info
+    
+    async def add_word_trigger(self, chat_id: int, trigger_word: str) -> bool:
         """Add word trigger untuk chat"""
-        chat_key = str(chat_id)
-        
-        if chat_key not in self.blacklist_data["word_triggers"]:
-            self.blacklist_data["word_triggers"][chat_key] = []
+        await self.ensure_ready()
         
-        # Check if already exists
+        # Check if already exists (key = lowercase, case insensitive)
         trigger_lower = trigger_word.lower()
-        existing_triggers = [t.lower() for t in self.blacklist_data["word_triggers"][chat_key]]
+        if await chat_store.get(TRIGGERS_NS, chat_id, trigger_lower) is not None:
+            return False  # Already exists
         
-        if trigger_lower not in existing_triggers:
-            self.blacklist_data["word_triggers"][chat_key].append(trigger_word)
-            return self.save_blacklist_data()
-        
-        return False  # Already exists
+        await chat_store.set(TRIGGERS_NS, chat_id, trigger_lower, trigger_word)
+        await moderation_index.refresh_chat(chat_id)
+        return True
     
-    def remove_word_trigger(self, chat_id: int, trigger_word: str) -> bool:
+    async def remove_word_trigger(self, chat_id: int, trigger_word: str) -> bool:
         """Remove word trigger dari chat"""
-        chat_key = str(chat_id)
-        
-        if chat_key in self.blacklist_data["word_triggers"]:
-            trigger_lower = trigger_word.lower()
-            original_triggers = self.blacklist_data["word_triggers"][chat_key]
-            
-            # Remove matching trigger (case insensitive)
-            new_triggers = [t for t in original_triggers if t.lower() != trigger_lower]
-            
-            if len(new_triggers) != len(original_triggers):
-                self.blacklist_data["word_triggers"][chat_key] = new_triggers
-                return self.save_blacklist_data()
-        
-        return False  # Not found
+        await self.ensure_ready()
+        removed = await chat_store.delete(TRIGGERS_NS, chat_id, trigger_word.lower())
+        if removed:
+            await moderation_index.refresh_chat(chat_id)
+        return removed
     
-    def add_locked_user(self, chat_id: int, user_id: int, username: str = None) -> bool:
+    async def add_locked_user(self, chat_id: int, user_id: int, username: str = None) -> bool:
         """Add user ke locked list"""
-        chat_key = str(chat_id)
-        user_key = str(user_id)
-        
-        if chat_key not in self.blacklist_data["locked_users"]:
-            self.blacklist_data["locked_users"][chat_key] = {}
-        
-        self.blacklist_data["locked_users"][chat_key][user_key] = {
+        await self.ensure_ready()
+        await chat_store.set(LOCKED_NS, chat_id, str(user_id), {
             "user_id": user_id,
             "username": username
-        }
-        
-        return self.save_blacklist_data()
+        })
+        await moderation_index.refresh_chat(chat_id)
+        return True
     
-    def remove_locked_user(self, chat_id: int, user_id: int) -> bool:
+    async def remove_locked_user(self, chat_id: int, user_id: int) -> bool:
         """Remove user dari locked list"""
-        chat_key = str(chat_id)
-        user_key = str(user_id)
-        
-        if (chat_key in self.blacklist_data["locked_users"] and 
-            user_key in self.blacklist_data["locked_users"][chat_key]):
-            
-            del self.blacklist_data["locked_users"][chat_key][user_key]
-            return self.save_blacklist_data()
-        
-        return False
+        await self.ensure_ready()
+        removed = await chat_store.delete(LOCKED_NS, chat_id, str(user_id))
+        if removed:
+            await moderation_index.refresh_chat(chat_id)
+        return removed
+    
+    async def set_enabled(self, chat_id: int, enabled: bool) -> None:
+        """Aktif / nonaktifkan moderasi chat tanpa menghapus rule"""
+        await self.ensure_ready()
+        await moderation_index.set_enabled(chat_id, enabled)
+    
+    async def set_flood(self, chat_id: int, limit: int, window: float) -> None:
+        """Set anti-flood: lebih dari `limit` message dalam `window` detik = auto lock"""
+        await self.ensure_ready()
+        await moderation_index.set_flood(chat_id, limit, window)
+        self.flood_tracker.forget_chat(chat_id)
+    
+    def check_flood(self, ruleset, user_id: int, message_id: int) -> Optional[List[int]]:
+        """Catat message ke flood tracker, return ID burst kalau user flooding"""
+        if not ruleset.flood_limit:
+            return None
+        return self.flood_tracker.hit(
+            ruleset.chat_id, user_id, message_id, ruleset.flood_limit, ruleset.flood_window
+        )
     
-    def check_word_triggers(self, chat_id: int, text: str) -> List[str]:
+    async def check_word_triggers(self, chat_id: int, text: str) -> List[str]:
         """Check if text contains blacklisted words"""
-        chat_key = str(chat_id)
-        matched_triggers = []
-        
-        if chat_key in self.blacklist_data["word_triggers"]:
-            text_lower = text.lower()
-            
-            for trigger in self.blacklist_data["word_triggers"][chat_key]:
-                if trigger.lower() in text_lower:
-                    matched_triggers.append(trigger)
-        
-        return matched_triggers
+        await self.ensure_ready()
+        ruleset = await moderation_index.get_ruleset(chat_id)
+        return ruleset.match_triggers(text, limit=len(ruleset.triggers))
     
-    def is_user_locked(self, chat_id: int, user_id: int) -> bool:
+    async def is_user_locked(self, chat_id: int, user_id: int) -> bool:
         """Check if user is locked"""
-        chat_key = str(chat_id)
-        user_key = str(user_id)
-        
-        return (chat_key in self.blacklist_data["locked_users"] and 
-                user_key in self.blacklist_data["locked_users"][chat_key])
+        await self.ensure_ready()
+        return (await moderation_index.get_ruleset(chat_id)).is_locked(user_id)
     
     async def check_admin_permissions(self, client: VzoelClient, chat_id: int, 
                                     user_id: int) -> bool:
@@ -171,6 +177,15 @@ class PremiumBlacklistSystem:
             LOGGER.error(f"Error checking admin permissions: {e}")
             return False
     
+    async def is_exempt_admin(self, client: VzoelClient, chat_id: int, user_id: int) -> bool:
+        """Admin check untuk monitor, hasil di-cache per (chat, user)"""
+        cache_key = (chat_id, user_id)
+        is_admin = self.admin_cache.get(cache_key)
+        if is_admin is None:
+            is_admin = await self.check_admin_permissions(client, chat_id, user_id)
+            self.admin_cache.set(cache_key, is_admin)
+        return is_admin
+    
     async def resolve_target_user(self, client: VzoelClient, message: Message,
                                 args: str) -> Optional[User]:
         """Resolve target user dari argument atau reply"""
@@ -192,23 +207,36 @@ class PremiumBlacklistSystem:
         
         return None
     
-    def get_chat_blacklist_info(self, chat_id: int) -> Dict:
+    async def get_chat_blacklist_info(self, chat_id: int) -> Dict:
         """Get blacklist info untuk chat"""
-        chat_key = str(chat_id)
+        await self.ensure_ready()
         
-        word_triggers = self.blacklist_data["word_triggers"].get(chat_key, [])
-        locked_users = self.blacklist_data["locked_users"].get(chat_key, {})
+        word_triggers = list((await chat_store.get_chat(TRIGGERS_NS, chat_id)).values())
+        locked_users = dict(await chat_store.get_chat(LOCKED_NS, chat_id))
+        ruleset = await moderation_index.get_ruleset(chat_id)
         
         return {
             "word_triggers": word_triggers,
             "locked_users": locked_users,
             "total_triggers": len(word_triggers),
-            "total_locked": len(locked_users)
+            "total_locked": len(locked_users),
+            "enabled": ruleset.enabled,
+            "flood_limit": ruleset.flood_limit,
+            "flood_window": ruleset.flood_window
         }
 
 # Initialize premium blacklist system
 blacklist_system = PremiumBlacklistSystem()
 
+async def _moderated_chat(_, __, message: Message) -> bool:
+    """Filter monitor: chat tanpa rule ditolak dengan satu set lookup"""
+    if not blacklist_system._ready:
+        await blacklist_system.ensure_ready()
+    chat = message.chat
+    return chat is not None and chat.id in moderation_index.moderated and message.from_user is not None
+
+moderated_chat_filter = filters.create(_moderated_chat)
+
 @VzoelClient.on_message(CMD_HANDLER)
 async def blacklist_router(client: VzoelClient, message: Message):
     """Router untuk blacklist commands"""
@@ -224,47 +252,53 @@ async def blacklist_router(client: VzoelClient, message: Message):
         await unlock_handler(client, message)
     elif command == "bllist":
         await bllist_handler(client, message)
+    elif command == "blmode":
+        await blmode_handler(client, message)
+    elif command == "purge":
+        await purge_handler(client, message)
+    elif command == "setflood":
+        await setflood_handler(client, message)
 
-@VzoelClient.on_message()
+@VzoelClient.on_message(moderated_chat_filter, group=BLACKLIST_MONITOR_GROUP)
 async def blacklist_monitor(client: VzoelClient, message: Message):
     """Monitor messages untuk blacklist triggers dan locked users"""
     
-    # Skip if not in group or no text
-    if (message.chat.type not in ["group", "supergroup"] or 
-        not message.text or not message.from_user):
-        return
-    
-    # Skip if from admin (to prevent deletion loops)
-    if await blacklist_system.check_admin_permissions(
-        client, message.chat.id, message.from_user.id):
-        return
-    
     chat_id = message.chat.id
     user_id = message.from_user.id
-    should_delete = False
+    ruleset = await moderation_index.get_ruleset(chat_id)
     deletion_reason = ""
     
-    # Check if user is locked
-    if blacklist_system.is_user_locked(chat_id, user_id):
-        should_delete = True
-        deletion_reason = "User locked"
+    flood_burst = None
     
-    # Check word triggers
-    elif message.text:
-        matched_triggers = blacklist_system.check_word_triggers(chat_id, message.text)
+    # Rule dicek dulu (lokal), baru admin check (RPC, di-cache) kalau ada yang match
+    if ruleset.is_locked(user_id):
+        deletion_reason = "User locked"
+    else:
+        matched_triggers = ruleset.match_triggers(message.text or message.caption or "")
         if matched_triggers:
-            should_delete = True
-            deletion_reason = f"Triggered: {', '.join(matched_triggers[:2])}"
+            deletion_reason = f"Triggered: {', '.join(matched_triggers)}"
+        flood_burst = blacklist_system.check_flood(ruleset, user_id, message.id)
+        if flood_burst:
+            deletion_reason = deletion_reason or "Flood"
     
-    # Delete message if needed
-    if should_delete:
-        try:
-            await message.delete()
-            LOGGER.info(f"Deleted message in {chat_id}: {deletion_reason}")
-        except MessageDeleteForbidden:
-            LOGGER.warning(f"Cannot delete message in {chat_id}: insufficient permissions")
-        except Exception as e:
-            LOGGER.error(f"Error deleting message: {e}")
+    if not deletion_reason:
+        return
+    
+    # Skip if from admin (to prevent deletion loops)
+    if await blacklist_system.is_exempt_admin(client, chat_id, user_id):
+        return
+    
+    if flood_burst:
+        # Auto lock lewat alur locked_users yang sama dengan .lock
+        await blacklist_system.add_locked_user(chat_id, user_id, message.from_user.username)
+        moderation_stats.chat(chat_id).flood_locks += 1
+        for message_id in flood_burst[:-1]:
+            deletion_queue.enqueue(client, chat_id, message_id)
+        LOGGER.info(f"Flood auto-lock {user_id} in {chat_id}: {len(flood_burst)} messages")
+    
+    # Delete message (di-batch per chat, satu RPC untuk banyak message)
+    deletion_queue.enqueue(client, chat_id, message.id)
+    LOGGER.debug(f"Queued delete in {chat_id}: {deletion_reason}")
 
 async def bl_handler(client: VzoelClient, message: Message):
     """
@@ -274,7 +308,7 @@ async def bl_handler(client: VzoelClient, message: Message):
     """
     
     # Check if in group
-    if message.chat.type not in ["group", "supergroup"]:
+    if message.chat.type not in GROUP_CHAT_TYPES:
         await message.reply_text(
             f"{blacklist_system.blacklist_emoji['error']} {bold('Group Only!')}\\n\\n"
             f"{emoji('kuning')} Blacklist commands only work in groups.",
@@ -330,7 +364,7 @@ async def bl_handler(client: VzoelClient, message: Message):
         return
     
     # Add trigger word
-    success = blacklist_system.add_word_trigger(message.chat.id, trigger_word)
+    success = await blacklist_system.add_word_trigger(message.chat.id, trigger_word)
     
     if success:
         success_text = [
@@ -368,7 +402,7 @@ async def rmbl_handler(client: VzoelClient, message: Message):
     """
     
     # Check if in group
-    if message.chat.type not in ["group", "supergroup"]:
+    if message.chat.type not in GROUP_CHAT_TYPES:
         await message.reply_text(
             f"{blacklist_system.blacklist_emoji['error']} {bold('Group Only!')}\\n\\n"
             f"{emoji('kuning')} Blacklist commands only work in groups.",
@@ -397,7 +431,7 @@ async def rmbl_handler(client: VzoelClient, message: Message):
         trigger_word = reply_message.text.strip()
     else:
         # Show current triggers for removal
-        chat_info = blacklist_system.get_chat_blacklist_info(message.chat.id)
+        chat_info = await blacklist_system.get_chat_blacklist_info(message.chat.id)
         
         if chat_info['total_triggers'] == 0:
             await message.reply_text(
@@ -435,7 +469,7 @@ async def rmbl_handler(client: VzoelClient, message: Message):
         return
     
     # Remove trigger word
-    success = blacklist_system.remove_word_trigger(message.chat.id, trigger_word)
+    success = await blacklist_system.remove_word_trigger(message.chat.id, trigger_word)
     
     if success:
         success_text = [
@@ -526,7 +560,7 @@ async def lock_handler(client: VzoelClient, message: Message):
         return
     
     # Lock user
-    success = blacklist_system.add_locked_user(
+    success = await blacklist_system.add_locked_user(
         message.chat.id, target_user.id, target_user.username
     )
     
@@ -573,7 +607,7 @@ async def unlock_handler(client: VzoelClient, message: Message):
     args = get_arguments(message)
     target_user = await blacklist_system.resolve_target_user(client, message, args)
     
-    if target_user and blacklist_system.remove_locked_user(message.chat.id, target_user.id):
+    if target_user and await blacklist_system.remove_locked_user(message.chat.id, target_user.id):
         await message.reply_text(
             f"{blacklist_system.blacklist_emoji['add']} {bold('User Unlocked!')}\\n\\n"
             f"{emoji('centang')} **{target_user.first_name}** can now send messages.",
@@ -588,13 +622,20 @@ async def unlock_handler(client: VzoelClient, message: Message):
 async def bllist_handler(client: VzoelClient, message: Message):
     """Show blacklist info for current chat"""
     
-    chat_info = blacklist_system.get_chat_blacklist_info(message.chat.id)
+    chat_info = await blacklist_system.get_chat_blacklist_info(message.chat.id)
+    stats = moderation_stats.chat(message.chat.id)
     
     info_lines = [
         f"{blacklist_system.blacklist_emoji['list']} {bold('BLACKLIST STATUS')}",
         "",
         f"{blacklist_system.blacklist_emoji['trigger']} **Word Triggers:** {chat_info['total_triggers']}",
         f"{blacklist_system.blacklist_emoji['locked']} **Locked Users:** {chat_info['total_locked']}",
+        f"{emoji('aktif')} **Mode:** {'ON' if chat_info['enabled'] else 'OFF'}",
+        f"{emoji('petir')} **Anti-Flood:** " + (
+            f"{chat_info['flood_limit']} msg / {chat_info['flood_window']:g}s"
+            if chat_info['flood_limit'] else "OFF"
+        ),
+        f"{blacklist_system.blacklist_emoji['deleted']} **Deleted:** {stats.deleted} ({stats.batches} batch, {stats.failed} gagal)",
         "",
         f"{italic('Premium Blacklist by Vzoel VZLfxs @Lutpan')}"
     ]
@@ -604,5 +645,249 @@ async def bllist_handler(client: VzoelClient, message: Message):
         parse_mode=ParseMode.MARKDOWN
     )
 
+async def blmode_handler(client: VzoelClient, message: Message):
+    """
+    Toggle moderasi blacklist di chat ini (rule tetap tersimpan)
+    Usage: .blmode on|off
+    """
+    
+    # Check admin permissions
+    if not await blacklist_system.check_admin_permissions(
+        client, message.chat.id, message.from_user.id):
+        await message.reply_text(
+            f"{blacklist_system.blacklist_emoji['error']} {bold('Admin Required!')}",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+    
+    mode = get_arguments(message).strip().lower()
+    if mode not in ("on", "off"):
+        await message.reply_text(
+            f"{blacklist_system.blacklist_emoji['error']} **Usage:** {monospace('.blmode on|off')}",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+    
+    await blacklist_system.set_enabled(message.chat.id, mode == "on")
+    await message.reply_text(
+        f"{blacklist_system.blacklist_emoji['add']} {bold('Blacklist Mode:')} {monospace(mode.upper())}",
+        parse_mode=ParseMode.MARKDOWN
+    )
+
+async def purge_handler(client: VzoelClient, message: Message):
+    """
+    Bulk purge handler
+    Usage: .purge (reply) - hapus dari message yang di-reply sampai command
+           .purge N - hapus N message terakhir
+           .purge N @username - N message terakhir dari user
+           .purge N bl - N message terakhir yang kena blacklist trigger
+           .purge N kata - N message terakhir yang mengandung kata
+    Requires: Admin dengan delete message permission
+    """
+    
+    if message.chat.type not in GROUP_CHAT_TYPES:
+        await message.reply_text(
+            f"{blacklist_system.blacklist_emoji['error']} {bold('Group Only!')}",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+    
+    if not await blacklist_system.check_admin_permissions(
+        client, message.chat.id, message.from_user.id):
+        await message.reply_text(
+            f"{blacklist_system.blacklist_emoji['error']} {bold('Admin Required!')}\n\n"
+            f"{emoji('kuning')} You need admin privileges with delete message permission.",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+    
+    chat_id = message.chat.id
+    parts = get_arguments(message).split(maxsplit=1)
+    reply_message = message.reply_to_message
+    limit = 0
+    predicate = None
+    target_label = "all"
+    
+    if parts and parts[0].isdigit():
+        limit = min(int(parts[0]), PURGE_MAX_MESSAGES)
+        criteria = parts[1].strip() if len(parts) > 1 else ""
+        if criteria.lower() == "bl":
+            ruleset = await moderation_index.get_ruleset(chat_id)
+            if ruleset.pattern is None:
+                await message.reply_text(
+                    f"{blacklist_system.blacklist_emoji['error']} {bold('No Triggers Found!')}",
+                    parse_mode=ParseMode.MARKDOWN
+                )
+                return
+            predicate = lambda m: bool(ruleset.match_triggers(m.text or m.caption or "", limit=1))
+            target_label = "blacklist triggers"
+        elif criteria.startswith("@") or criteria.lstrip("-").isdigit():
+            target_user = await blacklist_system.resolve_target_user(client, message, criteria)
+            if not target_user:
+                await message.reply_text(
+                    f"{blacklist_system.blacklist_emoji['error']} {bold('User Not Found!')}",
+                    parse_mode=ParseMode.MARKDOWN
+                )
+                return
+            target_id = target_user.id
+            predicate = lambda m: m.from_user is not None and m.from_user.id == target_id
+            target_label = f"@{target_user.username}" if target_user.username else str(target_id)
+        elif criteria:
+            needle = criteria.lower()
+            predicate = lambda m: needle in (m.text or m.caption or "").lower()
+            target_label = criteria
+    elif not reply_message:
+        usage_text = [
+            f"{vzoel_signature()}",
+            "",
+            f"{blacklist_system.blacklist_emoji['list']} {bold('PREMIUM PURGE SYSTEM')}",
+            "",
+            f"{emoji('utama')} **Usage:**",
+            f"  • Reply + {monospace('.purge')} - Purge range sampai command",
+            f"  • {monospace('.purge 500')} - Purge 500 message terakhir",
+            f"  • {monospace('.purge 500 @username')} - Dari user tertentu",
+            f"  • {monospace('.purge 500 bl')} - Yang kena blacklist trigger",
+            f"  • {monospace('.purge 500 kata')} - Yang mengandung kata",
+            "",
+            f"{italic('Premium Blacklist by Vzoel VZLfxs @Lutpan')}"
+        ]
+        await message.reply_text("\n".join(usage_text), parse_mode=ParseMode.MARKDOWN)
+        return
+    
+    status = await message.reply_text(
+        f"{blacklist_system.blacklist_emoji['warning']} {bold('Purging...')} ({target_label})",
+        parse_mode=ParseMode.MARKDOWN
+    )
+    
+    # Sumber ID: range langsung (supergroup, tanpa filter) atau stream history
+    if reply_message and not limit and message.chat.type == ChatType.SUPERGROUP:
+        # ID message di supergroup berurutan per chat: tidak perlu scan history
+        ids = range(message.id, reply_message.id - 1, -1)
+    else:
+        min_id = reply_message.id if reply_message and not limit else 0
+        if limit:
+            # Command sendiri tidak ikut dihitung dalam N; dengan filter scan dibatasi N x faktor
+            max_scan = limit * PURGE_SCAN_FACTOR if predicate else limit
+            messages = history_messages(client, chat_id, offset_id=message.id, min_id=min_id,
+                                        max_messages=max_scan)
+        else:
+            messages = history_messages(client, chat_id, offset_id=message.id + 1, min_id=min_id)
+        ids = select_message_ids(messages, predicate, limit)
+    
+    async def edit_status(text: str):
+        try:
+            await status.edit_text(text, parse_mode=ParseMode.MARKDOWN)
+        except MessageNotModified:
+            pass
+        except FloodWait as e:
+            LOGGER.warning(f"FloodWait on purge status in {chat_id}: {e.value}s")
+            await asyncio.sleep(e.value)
+    
+    async def report(deleted: int, queued: int):
+        report_progress(f"{deleted}/{queued} deleted")
+        await edit_status(
+            f"{blacklist_system.blacklist_emoji['warning']} {bold('Purging...')} "
+            f"{deleted}/{queued} deleted"
+        )
+    
+    async def run_purge():
+        job = current_job.get()
+        await edit_status(
+            f"{blacklist_system.blacklist_emoji['warning']} {bold('Purging...')} ({target_label})\n"
+            f"{emoji('loading')} Job #{job.id} • {monospace(f'.cancel {job.id}')}"
+        )
+        started = asyncio.get_running_loop().time()
+        deleted, scanned = await purge_batches(
+            client, chat_id, batched_ids(ids), moderation_stats, on_progress=report
+        )
+        if limit:
+            deletion_queue.enqueue(client, chat_id, message.id)
+        elapsed = asyncio.get_running_loop().time() - started
+        
+        await edit_status(
+            f"{blacklist_system.blacklist_emoji['deleted']} {bold('Purge Complete!')}\n\n"
+            f"{emoji('centang')} **Deleted:** {deleted}/{scanned} ({target_label})\n"
+            f"{emoji('aktif')} **Time:** {elapsed:.1f}s"
+        )
+        LOGGER.info(f"Purged {deleted} messages in {chat_id} ({target_label})")
+    
+    async def report_end(job):
+        # Message yang sudah terhapus tetap terhapus; cukup laporkan kenapa berhenti
+        if job.status == "done":
+            return
+        reasons = {
+            "timeout": f"exceeded its {job.budget:g}s time budget",
+            "cancelled": "was cancelled",
+        }
+        await edit_status(
+            f"{blacklist_system.blacklist_emoji['error']} {bold('Purge Stopped!')}\n\n"
+            f"{emoji('kuning')} Job #{job.id} {reasons.get(job.status, f'failed: {job.error}')}"
+        )
+    
+    # Scan + delete jalan sebagai background job, worker update tidak tertahan
+    job = job_manager.start("purge", run_purge(), chat_id=chat_id, on_done=report_end)
+    if job is None:
+        await edit_status(
+            f"{blacklist_system.blacklist_emoji['error']} {bold('Too Many Jobs!')}\n\n"
+            f"{emoji('kuning')} Check {monospace('.jobs')} or try again later."
+        )
+
+async def setflood_handler(client: VzoelClient, message: Message):
+    """
+    Anti-flood handler: user yang kirim lebih dari N message dalam T detik
+    otomatis di-lock dan burst-nya dihapus
+    Usage: .setflood N T atau .setflood off
+    Requires: Admin dengan delete message permission
+    """
+    
+    if message.chat.type not in GROUP_CHAT_TYPES:
+        await message.reply_text(
+            f"{blacklist_system.blacklist_emoji['error']} {bold('Group Only!')}",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+    
+    if not await blacklist_system.check_admin_permissions(
+        client, message.chat.id, message.from_user.id):
+        await message.reply_text(
+            f"{blacklist_system.blacklist_emoji['error']} {bold('Admin Required!')}",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+    
+    parts = get_arguments(message).split()
+    if parts and parts[0].lower() == "off":
+        await blacklist_system.set_flood(message.chat.id, 0, 0)
+        await message.reply_text(
+            f"{blacklist_system.blacklist_emoji['remove']} {bold('Anti-Flood OFF')}",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+    
+    try:
+        limit = int(parts[0])
+        window = float(parts[1]) if len(parts) > 1 else 10.0
+    except (IndexError, ValueError):
+        limit, window = 0, 0.0
+    
+    if not (FLOOD_LIMIT_RANGE[0] <= limit <= FLOOD_LIMIT_RANGE[1] and
+            FLOOD_WINDOW_RANGE[0] <= window <= FLOOD_WINDOW_RANGE[1]):
+        await message.reply_text(
+            f"{blacklist_system.blacklist_emoji['error']} **Usage:** {monospace('.setflood N T')} / {monospace('.setflood off')}\n"
+            f"{emoji('kuning')} N = {FLOOD_LIMIT_RANGE[0]}-{FLOOD_LIMIT_RANGE[1]} message, "
+            f"T = {FLOOD_WINDOW_RANGE[0]}-{FLOOD_WINDOW_RANGE[1]} detik",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+    
+    await blacklist_system.set_flood(message.chat.id, limit, window)
+    await message.reply_text(
+        f"{blacklist_system.blacklist_emoji['add']} {bold('Anti-Flood ON')}\n\n"
+        f"{blacklist_system.blacklist_emoji['trigger']} **Limit:** {limit} message / {window:g} detik\n"
+        f"{blacklist_system.blacklist_emoji['locked']} **Action:** Auto lock + hapus burst",
+        parse_mode=ParseMode.MARKDOWN
+    )
+    LOGGER.info(f"Anti-flood {limit}/{window:g}s set in chat {message.chat.id}")
+
 # Register plugin info
 LOGGER.info(f"{emoji('centang')} Premium Blacklist System initialized")
\ No newline at end of file
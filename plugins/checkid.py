@@ -16,6 +16,8 @@ from pyrogram.errors import UsernameNotOccupied, UsernameInvalid, PeerIdInvalid,
 from helper_client import VzoelClient
 from helper_cmd_handler import CMD_HANDLER, get_command, get_arguments
 from helper_logger import LOGGER
+from helpers.member_roster import RosterMember
+from helpers.session_table import SessionRecord, session_table
 from utils.assets import vzoel_assets, premium_emoji, bold, italic, monospace, emoji, vzoel_signature
 
 class PremiumCheckIDSystem:
@@ -51,8 +53,7 @@ class PremiumCheckIDSystem:
             "fire": "🔥"        # merah
         }
         
-        # Control variables
-        self.active_loops = {}
+        # Loop aktif disimpan di session_table (kind "checkid")
         
     def extract_username_from_text(self, text: str) -> Optional[str]:
         """Extract username dari text dengan berbagai format"""
@@ -154,15 +155,20 @@ class PremiumCheckIDSystem:
         
         return progress_msg
     
-    async def start_unlimited_loop_animation(self, message: Message, user: User, 
-                                           loop_id: str) -> None:
+    def open_loop_session(self, message: Message, user: User, loop_id: str) -> SessionRecord:
+        """Daftarkan loop: cukup chat_id, message_id dan data user minimal"""
+        return session_table.open(
+            "checkid", loop_id, message.chat.id, message.id, RosterMember.from_user(user)
+        )
+    
+    async def start_unlimited_loop_animation(self, client: VzoelClient, record: SessionRecord) -> None:
         """Start unlimited loop animation untuk hasil dengan 2 detik interval"""
         
-        self.active_loops[loop_id] = True
+        user = record.data
         frame_index = 0
         
         try:
-            while self.active_loops.get(loop_id, False):
+            while record.active:
                 # Get current frame data
                 frame_data = self.result_loop_frames[frame_index % len(self.result_loop_frames)]
                 
@@ -170,16 +176,10 @@ class PremiumCheckIDSystem:
                 formatted_info = self.format_user_info(user, frame_data)
                 
                 try:
-                    await message.edit_text(
-                        formatted_info,
-                        parse_mode=ParseMode.MARKDOWN
-                    )
-                except MessageNotModified:
-                    pass
+                    await record.edit(client, formatted_info, parse_mode=ParseMode.MARKDOWN)
                 except Exception as e:
                     LOGGER.error(f"Error in loop animation: {e}")
                     # Stop animation jika ada error
-                    self.active_loops[loop_id] = False
                     break
                 
                 # Wait 2 seconds before next frame
@@ -188,13 +188,12 @@ class PremiumCheckIDSystem:
                 
         except Exception as e:
             LOGGER.error(f"Critical error in unlimited loop: {e}")
-            self.active_loops[loop_id] = False
+        finally:
+            session_table.close(record)
     
     def stop_loop_animation(self, loop_id: str) -> None:
         """Stop loop animation"""
-        if loop_id in self.active_loops:
-            self.active_loops[loop_id] = False
-            del self.active_loops[loop_id]
+        session_table.stop("checkid", loop_id)
     
     async def resolve_user_from_username(self, client: VzoelClient, username: str) -> Optional[User]:
         """Resolve user dari username"""
@@ -378,7 +377,7 @@ async def checkid_handler(client: VzoelClient, message: Message):
         # Start unlimited loop animation (2-second intervals)
         asyncio.create_task(
             checkid_system.start_unlimited_loop_animation(
-                progress_msg, target_user, loop_id
+                client, checkid_system.open_loop_session(progress_msg, target_user, loop_id)
             )
         )
         
@@ -387,12 +386,8 @@ async def checkid_handler(client: VzoelClient, message: Message):
 async def stop_checkid_handler(client: VzoelClient, message: Message):
     """Stop all active CheckID loop animations"""
     
-    stopped_count = 0
-    
     # Stop all active loops
-    for loop_id in list(checkid_system.active_loops.keys()):
-        checkid_system.stop_loop_animation(loop_id)
-        stopped_count += 1
+    stopped_count = session_table.stop_kind("checkid")
     
     if stopped_count > 0:
         stop_message = [
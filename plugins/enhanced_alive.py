@@ -9,7 +9,7 @@ from pyrogram.types import Message
 from helpers.logo_helper import LogoHelper, send_logo_message
 from helpers.format_helper import FormatHelper
 from helpers.display_helper import DisplayHelper
-from utils.assets import VzoelAssets, vzoel_msg, bold, italic, emoji
+from utils.assets import vzoel_assets, vzoel_msg, bold, italic, emoji
 import asyncio
 import time
 
@@ -17,7 +17,7 @@ import time
 logo_helper = LogoHelper()
 format_helper = FormatHelper()
 display_helper = DisplayHelper()
-assets = VzoelAssets()
+assets = vzoel_assets  # shared instance, font/emoji JSON tidak di-load ulang
 
 @Client.on_message(filters.command("alive"))
 async def enhanced_alive_command(client: Client, message: Message):
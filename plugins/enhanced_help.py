@@ -8,12 +8,12 @@ from pyrogram import Client, filters
 from pyrogram.types import Message, InlineKeyboardMarkup, InlineKeyboardButton, CallbackQuery
 from helpers.logo_helper import LogoHelper
 from helpers.display_helper import DisplayHelper
-from utils.assets import VzoelAssets, vzoel_msg, bold, italic, emoji
+from utils.assets import vzoel_assets, vzoel_msg, bold, italic, emoji
 
 # Initialize premium components
 logo_helper = LogoHelper()
 display_helper = DisplayHelper()
-assets = VzoelAssets()
+assets = vzoel_assets  # shared instance, font/emoji JSON tidak di-load ulang
 
 # Comprehensive help database dengan kategorisasi
 HELP_CATEGORIES = {
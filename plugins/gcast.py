@@ -20,7 +20,7 @@ from pyrogram.errors import (
 # Import sistem terintegrasi premium
 from helper_client import VzoelClient
 from helper_cmd_handler import CMD_HANDLER, get_command, get_arguments
-from helper_config import CONFIG
+from helpers.gcast_blacklist import gcast_blacklist
 from helper_logger import LOGGER
 from utils.assets import vzoel_assets, premium_emoji, bold, italic, monospace, emoji, vzoel_signature
 
@@ -114,15 +114,18 @@ class PremiumGcastSystem:
     async def get_active_chats(self, exclude_blacklist: bool = True) -> List[Tuple[int, str]]:
         """Get active chats for broadcasting dengan blacklist filtering"""
         active_chats = []
-        blacklist = CONFIG.blacklist.groups if exclude_blacklist else []
+        
+        # Blacklist difilter di SQL (anti-join ke tabel ber-index), bukan per chat di Python
+        query = "SELECT c.chat_id, c.chat_title FROM chats c WHERE c.is_active = 1"
+        if exclude_blacklist:
+            await gcast_blacklist.ensure_loaded()
+            query += " AND NOT EXISTS (SELECT 1 FROM gcast_blacklist b WHERE b.chat_id = c.chat_id)"
         
         async with aiosqlite.connect(DB_PATH) as db:
-            query = "SELECT chat_id, chat_title FROM chats WHERE is_active = 1"
             async with db.execute(query) as cursor:
                 async for row in cursor:
                     chat_id, chat_title = row
-                    if chat_id not in blacklist:
-                        active_chats.append((chat_id, chat_title or f"Group {chat_id}"))
+                    active_chats.append((chat_id, chat_title or f"Group {chat_id}"))
         
         return active_chats
     
@@ -378,7 +381,7 @@ async def gcast_handler(client: VzoelClient, message: Message):
     
     # Get active chats (excluding blacklist)
     active_chats = await gcast_system.get_active_chats(exclude_blacklist=True)
-    blacklist_count = len(CONFIG.blacklist.groups)
+    blacklist_count = len(gcast_blacklist)
     
     if not active_chats:
         error_msg = [
@@ -460,8 +463,9 @@ async def gcast_info_handler(client: VzoelClient, message: Message):
     """Display gcast system information"""
     
     # Get statistics
+    await gcast_blacklist.ensure_loaded()
     active_chats = await gcast_system.get_active_chats(exclude_blacklist=False)
-    blacklisted_chats = CONFIG.blacklist.groups
+    blacklisted_chats = gcast_blacklist.groups
     available_chats = len([chat for chat in active_chats if chat[0] not in blacklisted_chats])
     
     # Get emoji info
@@ -14,6 +14,7 @@ from typing import Dict, List, Any, Optional
 from pyrogram import Client, filters
 from pyrogram.types import Message, InlineKeyboardMarkup, InlineKeyboardButton, CallbackQuery
 from pyrogram.enums import ParseMode
+from pyrogram.errors import MessageNotModified
 
 # Import sistem terintegrasi premium
 from helper_client import VzoelClient
@@ -21,54 +22,50 @@ from helper_cmd_handler import CMD_HANDLER, get_command, get_arguments
 from helper_config import CONFIG
 from helper_logger import LOGGER
 from utils.assets import vzoel_assets, premium_emoji, bold, italic, monospace, vzoel_signature
+from core.loader.loader_manifest import load_manifest
+from utils.cache import LRUCache
+
+# Callback data help: "h:<page>:<user_id>" (page: m, r, a, c:<cat>:<n>, p:<plugin>, x:<cmd>)
+HELP_CALLBACK_PREFIX = "h:"
+HELP_SESSION_LIMIT = 500
+HELP_SESSION_TTL = 1800
+PLUGINS_PER_PAGE = 8
 
 class PluginDiscovery:
-    """Auto-discovery system untuk detect plugins dan commands"""
+    """
+    Plugin discovery dari plugin manifest (AST, di-cache per mtime/size):
+    file plugin hanya di-parse ulang kalau berubah, .help cukup lookup
+    """
     
     def __init__(self, plugins_dir: str = "plugins"):
         self.plugins_dir = plugins_dir
         self.discovered_plugins: Dict[str, Dict] = {}
         self.commands_map: Dict[str, Dict] = {}
+        self.manifest_generated_at: Optional[float] = None
         
     async def scan_plugins(self) -> Dict[str, Dict]:
-        """Scan semua plugins dan extract command info"""
-        LOGGER.info("🔍 Scanning plugins directory...")
-        
-        plugin_files = []
-        if os.path.exists(self.plugins_dir):
-            for file in os.listdir(self.plugins_dir):
-                if file.endswith('.py') and not file.startswith('_'):
-                    plugin_files.append(file[:-3])  # Remove .py extension
-        
-        for plugin_name in plugin_files:
-            try:
-                await self._analyze_plugin(plugin_name)
-            except Exception as e:
-                LOGGER.error(f"Error analyzing plugin {plugin_name}: {e}")
-        
-        LOGGER.info(f"✅ Discovered {len(self.discovered_plugins)} plugins with {len(self.commands_map)} commands")
-        return self.discovered_plugins
-    
-    async def _analyze_plugin(self, plugin_name: str):
-        """Analyze single plugin file untuk extract commands"""
-        try:
-            plugin_path = f"{self.plugins_dir}/{plugin_name}.py"
+        """Load metadata plugin dari manifest (rebuild hanya untuk file yang berubah)"""
+        loop = asyncio.get_running_loop()
+        manifest = await loop.run_in_executor(None, load_manifest, self.plugins_dir)
+        
+        if manifest.get("generated_at") == self.manifest_generated_at and self.discovered_plugins:
+            return self.discovered_plugins
+        
+        self.discovered_plugins = {}
+        self.commands_map = {}
+        for plugin_name, entry in sorted(manifest.get("modules", {}).items()):
+            if plugin_name.startswith('_'):
+                continue
             
-            # Read file untuk extract docstring dan commands
-            with open(plugin_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract plugin info
             plugin_info = {
                 "name": plugin_name,
-                "file": plugin_path,
-                "description": self._extract_description(content),
-                "commands": self._extract_commands(content),
-                "category": self._determine_category(plugin_name, content),
-                "requires_premium": "premium" in content.lower() or "vzoel_assets" in content,
-                "version": self._extract_version(content)
+                "file": f"{self.plugins_dir}/{plugin_name}.py",
+                "description": entry.get("description", "No description available"),
+                "commands": [dict(cmd) for cmd in entry.get("help", [])],
+                "category": self._determine_category(plugin_name, entry.get("premium", False)),
+                "requires_premium": entry.get("premium", False),
+                "version": entry.get("plugin_version", "1.0.0")
             }
-            
             self.discovered_plugins[plugin_name] = plugin_info
             
             # Map commands untuk quick lookup
@@ -77,94 +74,14 @@ class PluginDiscovery:
                     "plugin": plugin_name,
                     **cmd
                 }
-                
-        except Exception as e:
-            LOGGER.error(f"Failed to analyze {plugin_name}: {e}")
-    
-    def _extract_description(self, content: str) -> str:
-        """Extract plugin description dari docstring"""
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            if '"""' in line and i < 10:  # Look in first 10 lines
-                desc_lines = []
-                for j in range(i+1, min(i+10, len(lines))):
-                    if '"""' in lines[j]:
-                        break
-                    desc_lines.append(lines[j].strip())
-                return ' '.join(desc_lines) if desc_lines else "No description"
-        return "No description available"
-    
-    def _extract_commands(self, content: str) -> List[Dict]:
-        """Extract commands dari file content"""
-        commands = []
-        lines = content.split('\n')
-        
-        # Look for command patterns
-        command_patterns = [
-            'CMD_HANDLER',
-            '@VzoelClient.on_message',
-            'filters.command',
-            'get_command(message)'
-        ]
         
-        current_function = None
-        for i, line in enumerate(lines):
-            # Detect function definitions
-            if line.strip().startswith('async def ') and '_handler' in line:
-                current_function = line.strip().split('(')[0].replace('async def ', '')
-            
-            # Look for command registrations
-            if any(pattern in line for pattern in command_patterns):
-                # Try to extract command name
-                cmd_name = self._extract_command_name(lines, i, current_function)
-                if cmd_name:
-                    commands.append({
-                        "command": cmd_name,
-                        "function": current_function or "unknown",
-                        "description": self._extract_command_description(lines, i),
-                        "usage": f".{cmd_name} [arguments]"
-                    })
-        
-        return commands
-    
-    def _extract_command_name(self, lines: List[str], line_index: int, function_name: str) -> str:
-        """Extract actual command name dari context"""
-        # Check surrounding lines untuk command references
-        search_range = range(max(0, line_index-5), min(len(lines), line_index+5))
-        
-        for i in search_range:
-            line = lines[i].lower()
-            # Look for command == patterns
-            if 'command ==' in line and '"' in line:
-                start = line.find('"') + 1
-                end = line.find('"', start)
-                if start > 0 and end > start:
-                    return line[start:end]
-        
-        # Fallback: derive dari function name
-        if function_name and '_handler' in function_name:
-            return function_name.replace('_handler', '').replace('async ', '')
-        
-        return None
-    
-    def _extract_command_description(self, lines: List[str], line_index: int) -> str:
-        """Extract command description dari nearby comments"""
-        # Look for docstring or comments near command
-        search_range = range(max(0, line_index-3), min(len(lines), line_index+10))
-        
-        for i in search_range:
-            line = lines[i].strip()
-            if line.startswith('"""') and 'handler' in line.lower():
-                return line.replace('"""', '').strip()
-            elif line.startswith('#') and len(line) > 5:
-                return line[1:].strip()
-        
-        return "No description available"
-    
-    def _determine_category(self, plugin_name: str, content: str) -> str:
-        """Determine plugin category based on name and content"""
+        self.manifest_generated_at = manifest.get("generated_at")
+        LOGGER.info(f"✅ Discovered {len(self.discovered_plugins)} plugins with {len(self.commands_map)} commands")
+        return self.discovered_plugins
+    
+    def _determine_category(self, plugin_name: str, premium: bool) -> str:
+        """Determine plugin category based on name and premium usage"""
         name_lower = plugin_name.lower()
-        content_lower = content.lower()
         
         if any(word in name_lower for word in ['gcast', 'broadcast', 'blacklist']):
             return "broadcast"
@@ -174,21 +91,10 @@ class PluginDiscovery:
             return "system"
         elif any(word in name_lower for word in ['demo', 'test', 'example']):
             return "demo"
-        elif 'premium' in content_lower or 'vzoel_assets' in content_lower:
+        elif premium:
             return "premium"
         else:
             return "misc"
-    
-    def _extract_version(self, content: str) -> str:
-        """Extract version info dari file"""
-        lines = content.split('\n')
-        for line in lines[:20]:  # Check first 20 lines
-            if 'version' in line.lower() and ('=' in line or ':' in line):
-                # Extract version number
-                for char in line:
-                    if char.isdigit():
-                        return line[line.index(char):].split()[0]
-        return "1.0.0"
 
 class PremiumHelpSystem:
     """Premium help system dengan inline keyboard dan markdown support"""
@@ -197,7 +103,11 @@ class PremiumHelpSystem:
         self.plugin_discovery = PluginDiscovery()
         self.plugins_data: Dict[str, Dict] = {}
         self.categories: Dict[str, List] = {}
-        self.current_sessions: Dict[int, Dict] = {}  # Track user sessions
+        # Session per user dibatasi (LRU + expiry); navigasi sendiri stateless lewat callback data
+        self.current_sessions = LRUCache(maxsize=HELP_SESSION_LIMIT, ttl=HELP_SESSION_TTL)
+        # Page yang sudah di-render: (page, version) -> (text, rows)
+        self.page_cache = LRUCache(maxsize=256)
+        self.version = 0
         
     async def initialize(self):
         """Initialize help system dan discover plugins"""
@@ -209,6 +119,10 @@ class PremiumHelpSystem:
         # Load additional metadata jika ada
         await self._load_help_metadata()
         
+        # Data baru -> page lama tidak valid lagi
+        self.version += 1
+        self.page_cache.clear()
+        
         LOGGER.info(f"✅ Help system ready dengan {len(self.categories)} categories")
     
     def _categorize_plugins(self):
@@ -240,110 +154,113 @@ class PremiumHelpSystem:
             except Exception as e:
                 LOGGER.error(f"Failed to load help metadata: {e}")
     
-    def create_main_keyboard(self, user_id: int) -> InlineKeyboardMarkup:
-        """Create main help keyboard dengan categories"""
-        buttons = []
+    def _markup(self, rows: List[List[tuple]], user_id: int) -> InlineKeyboardMarkup:
+        """Rows (label, page) -> keyboard; user id ditempel di callback data"""
+        return InlineKeyboardMarkup([
+            [InlineKeyboardButton(label, callback_data=f"{HELP_CALLBACK_PREFIX}{page}:{user_id}") for label, page in row]
+            for row in rows
+        ])
+    
+    def _main_rows(self) -> List[List[tuple]]:
+        rows = []
         
         # Category buttons (2 per row)
         category_names = list(self.categories.keys())
         for i in range(0, len(category_names), 2):
             row = []
-            for j in range(2):
-                if i + j < len(category_names):
-                    cat = category_names[i + j]
-                    emoji_key = self._get_category_emoji(cat)
-                    emoji_char = vzoel_assets.get_emoji(emoji_key, premium_format=True)
-                    
-                    row.append(InlineKeyboardButton(
-                        f"{emoji_char} {cat.title()}",
-                        callback_data=f"help_cat_{cat}_{user_id}"
-                    ))
-            buttons.append(row)
+            for cat in category_names[i:i + 2]:
+                emoji_char = vzoel_assets.get_emoji(self._get_category_emoji(cat), premium_format=True)
+                row.append((f"{emoji_char} {cat.title()}", f"c:{cat}:0"))
+            rows.append(row)
         
         # Add utility buttons
-        util_row = []
         refresh_emoji = vzoel_assets.get_emoji('loading', premium_format=True)
         info_emoji = vzoel_assets.get_emoji('utama', premium_format=True)
-        
-        util_row.append(InlineKeyboardButton(
-            f"{refresh_emoji} Refresh", 
-            callback_data=f"help_refresh_{user_id}"
-        ))
-        util_row.append(InlineKeyboardButton(
-            f"{info_emoji} About",
-            callback_data=f"help_about_{user_id}"
-        ))
-        
-        buttons.append(util_row)
-        
-        return InlineKeyboardMarkup(buttons)
+        rows.append([(f"{refresh_emoji} Refresh", "r"), (f"{info_emoji} About", "a")])
+        return rows
     
-    def create_category_keyboard(self, category: str, user_id: int) -> InlineKeyboardMarkup:
-        """Create keyboard untuk specific category"""
-        buttons = []
+    def _category_rows(self, category: str, page: int = 0) -> List[List[tuple]]:
+        rows = []
         plugins = self.categories.get(category, [])
+        start = page * PLUGINS_PER_PAGE
         
         # Plugin buttons
-        for plugin in plugins[:8]:  # Max 8 plugins per page
+        for plugin in plugins[start:start + PLUGINS_PER_PAGE]:
             plugin_name = plugin["name"]
             commands_count = len(plugin.get("commands", []))
             
             premium_indicator = ""
             if plugin.get("requires_premium"):
-                premium_emoji = vzoel_assets.get_emoji('adder2', premium_format=True)
-                premium_indicator = f" {premium_emoji}"
+                premium_indicator = f" {vzoel_assets.get_emoji('adder2', premium_format=True)}"
             
-            buttons.append([InlineKeyboardButton(
+            rows.append([(
                 f"📄 {plugin_name.replace('_', ' ').title()} ({commands_count}){premium_indicator}",
-                callback_data=f"help_plugin_{plugin_name}_{user_id}"
+                f"p:{plugin_name}"
             )])
         
         # Navigation buttons
-        nav_row = []
         back_emoji = vzoel_assets.get_emoji('merah', premium_format=True)
-        nav_row.append(InlineKeyboardButton(
-            f"{back_emoji} Back to Main",
-            callback_data=f"help_main_{user_id}"
-        ))
-        
-        if len(plugins) > 8:
+        nav_row = [(f"{back_emoji} Back to Main", "m")]
+        if start + PLUGINS_PER_PAGE < len(plugins):
             next_emoji = vzoel_assets.get_emoji('aktif', premium_format=True)
-            nav_row.append(InlineKeyboardButton(
-                f"{next_emoji} More...",
-                callback_data=f"help_cat_more_{category}_{user_id}"
-            ))
-        
-        buttons.append(nav_row)
-        
-        return InlineKeyboardMarkup(buttons)
+            nav_row.append((f"{next_emoji} More...", f"c:{category}:{page + 1}"))
+        rows.append(nav_row)
+        return rows
     
-    def create_plugin_keyboard(self, plugin_name: str, user_id: int) -> InlineKeyboardMarkup:
-        """Create keyboard untuk specific plugin details"""
-        buttons = []
+    def _plugin_rows(self, plugin_name: str) -> List[List[tuple]]:
         plugin = self.plugins_data.get(plugin_name, {})
-        commands = plugin.get("commands", [])
         
         # Command buttons (1 per row for readability)
-        for cmd in commands[:6]:  # Max 6 commands shown
-            cmd_name = cmd["command"]
-            buttons.append([InlineKeyboardButton(
-                f"⚡ {cmd_name} - {cmd.get('description', 'No description')[:30]}...",
-                callback_data=f"help_cmd_{cmd_name}_{plugin_name}_{user_id}"
-            )])
+        rows = [
+            [(f"⚡ {cmd['command']} - {cmd.get('description', 'No description')[:30]}...", f"x:{cmd['command']}")]
+            for cmd in plugin.get("commands", [])[:6]  # Max 6 commands shown
+        ]
         
         # Navigation
-        nav_row = []
         back_emoji = vzoel_assets.get_emoji('merah', premium_format=True)
         category = plugin.get("category", "misc")
+        rows.append([(f"{back_emoji} Back to {category.title()}", f"c:{category}:0")])
+        return rows
+    
+    def create_main_keyboard(self, user_id: int) -> InlineKeyboardMarkup:
+        """Create main help keyboard dengan categories"""
+        return self._markup(self._main_rows(), user_id)
+    
+    def create_category_keyboard(self, category: str, user_id: int, page: int = 0) -> InlineKeyboardMarkup:
+        """Create keyboard untuk specific category"""
+        return self._markup(self._category_rows(category, page), user_id)
+    
+    def create_plugin_keyboard(self, plugin_name: str, user_id: int) -> InlineKeyboardMarkup:
+        """Create keyboard untuk specific plugin details"""
+        return self._markup(self._plugin_rows(plugin_name), user_id)
+    
+    def render_page(self, page: str, user_id: int):
+        """Text + keyboard untuk page; hasil render di-memo per (page, version)"""
+        key = (page, self.version)
+        rendered = self.page_cache.get(key)
+        if rendered is None:
+            rendered = self._render_page(page)
+            self.page_cache.set(key, rendered)
+        text, rows = rendered
+        return text, self._markup(rows, user_id)
+    
+    def _render_page(self, page: str):
+        kind, _, arg = page.partition(":")
+        back_emoji = vzoel_assets.get_emoji('merah', premium_format=True)
         
-        nav_row.append(InlineKeyboardButton(
-            f"{back_emoji} Back to {category.title()}",
-            callback_data=f"help_cat_{category}_{user_id}"
-        ))
-        
-        buttons.append(nav_row)
-        
-        return InlineKeyboardMarkup(buttons)
+        if kind == "c":
+            category, _, page_no = arg.rpartition(":")
+            page_no = int(page_no) if page_no.isdigit() else 0
+            return self.format_category_message(category), self._category_rows(category, page_no)
+        if kind == "p":
+            return self.format_plugin_message(arg), self._plugin_rows(arg)
+        if kind == "x":
+            plugin_name = self.plugin_discovery.commands_map.get(arg, {}).get("plugin")
+            back_page = f"p:{plugin_name}" if plugin_name else "m"
+            return self.format_command_message(arg), [[(f"{back_emoji} Back", back_page)]]
+        if kind == "a":
+            return self.format_about_message(), [[(f"{back_emoji} Back to Main", "m")]]
+        return self.format_main_help_message(), self._main_rows()
     
     def _get_category_emoji(self, category: str) -> str:
         """Get appropriate emoji untuk category"""
@@ -442,6 +359,35 @@ class PremiumHelpSystem:
         
         return message
 
+    def format_command_message(self, command: str) -> str:
+        """Format single command help"""
+        cmd = self.plugin_discovery.commands_map.get(command)
+        if not cmd:
+            return f"**⚡ {command}**\n└ No description available"
+        
+        plugin_name = cmd["plugin"].replace('_', ' ').title()
+        return (
+            f"**⚡ {command}**\n"
+            f"└ {cmd.get('description', 'No description')}\n"
+            f"└ Usage: `{cmd.get('usage', f'.{command}')}`\n"
+            f"└ Plugin: **{plugin_name}**"
+        )
+    
+    def format_about_message(self) -> str:
+        """Format about message"""
+        signature = vzoel_signature(premium_format=True)
+        return f"""{signature}
+
+**🎯 About VzoelV2 Help System**
+
+• **Auto-Discovery:** Automatically detects all plugins
+• **Premium Interface:** Enhanced with emoji mapping
+• **Interactive Navigation:** Easy-to-use inline keyboards
+• **Markdown Support:** Rich text formatting
+• **Real-time Updates:** Dynamic plugin refresh
+
+**💡 Created by VZLfxs @Lutpan Assistant**"""
+
 # Initialize global help system
 help_system = PremiumHelpSystem()
 
@@ -468,14 +414,9 @@ async def help_command_handler(client: VzoelClient, message: Message):
         await status_msg.delete()
     
     user_id = message.from_user.id
-    help_system.current_sessions[user_id] = {
-        "current_view": "main",
-        "last_message_id": None
-    }
     
     # Send main help message
-    text = help_system.format_main_help_message()
-    keyboard = help_system.create_main_keyboard(user_id)
+    text, keyboard = help_system.render_page("m", user_id)
     
     sent_message = await message.reply_text(
         text=text,
@@ -483,7 +424,10 @@ async def help_command_handler(client: VzoelClient, message: Message):
         parse_mode=ParseMode.MARKDOWN
     )
     
-    help_system.current_sessions[user_id]["last_message_id"] = sent_message.id
+    help_system.current_sessions.set(user_id, {
+        "current_view": "m",
+        "last_message_id": sent_message.id
+    })
 
 async def plugins_list_handler(client: VzoelClient, message: Message):
     """List all plugins dalam format sederhana"""
@@ -525,99 +469,45 @@ async def refresh_plugins_handler(client: VzoelClient, message: Message):
         f"• **Categories:** `{len(help_system.categories)}`"
     )
 
-@VzoelClient.on_callback_query()
+@VzoelClient.on_callback_query(filters.regex(f"^{HELP_CALLBACK_PREFIX}"))
 async def help_callback_handler(client: VzoelClient, callback_query: CallbackQuery):
     """Handle semua help callback queries"""
     data = callback_query.data
     user_id = callback_query.from_user.id
     
-    # Verify user session
-    if not data.endswith(f"_{user_id}"):
+    # Verify user session (owner id ada di callback data)
+    page, _, owner_id = data[len(HELP_CALLBACK_PREFIX):].rpartition(":")
+    if owner_id != str(user_id):
         warning_emoji = vzoel_assets.get_emoji('kuning', premium_format=True)
         await callback_query.answer(f"{warning_emoji} This help session is not for you!", show_alert=True)
         return
     
     try:
-        if data.startswith("help_main_"):
-            # Back to main menu
-            text = help_system.format_main_help_message()
-            keyboard = help_system.create_main_keyboard(user_id)
-            
-            await callback_query.edit_message_text(
-                text=text,
-                reply_markup=keyboard,
-                parse_mode=ParseMode.MARKDOWN
-            )
-            
-        elif data.startswith("help_cat_"):
-            # Show category
-            category = data.split("_")[2]
-            text = help_system.format_category_message(category)
-            keyboard = help_system.create_category_keyboard(category, user_id)
-            
-            await callback_query.edit_message_text(
-                text=text,
-                reply_markup=keyboard,
-                parse_mode=ParseMode.MARKDOWN
-            )
-            
-        elif data.startswith("help_plugin_"):
-            # Show plugin details
-            plugin_name = data.split("_")[2]
-            text = help_system.format_plugin_message(plugin_name)
-            keyboard = help_system.create_plugin_keyboard(plugin_name, user_id)
-            
-            await callback_query.edit_message_text(
-                text=text,
-                reply_markup=keyboard,
-                parse_mode=ParseMode.MARKDOWN
-            )
-            
-        elif data.startswith("help_refresh_"):
+        if page == "r":
             # Refresh plugins
             loading_emoji = vzoel_assets.get_emoji('loading', premium_format=True)
             await callback_query.answer(f"{loading_emoji} Refreshing plugins...")
             
             await help_system.initialize()
-            
-            text = help_system.format_main_help_message()
-            keyboard = help_system.create_main_keyboard(user_id)
-            
-            await callback_query.edit_message_text(
-                text=text,
-                reply_markup=keyboard,
-                parse_mode=ParseMode.MARKDOWN
-            )
-            
-        elif data.startswith("help_about_"):
-            # Show about info
-            signature = vzoel_signature(premium_format=True)
-            about_text = f"""{signature}
-
-**🎯 About VzoelV2 Help System**
-
-• **Auto-Discovery:** Automatically detects all plugins
-• **Premium Interface:** Enhanced with emoji mapping
-• **Interactive Navigation:** Easy-to-use inline keyboards
-• **Markdown Support:** Rich text formatting
-• **Real-time Updates:** Dynamic plugin refresh
-
-**💡 Created by VZLfxs @Lutpan Assistant**"""
-            
-            # Create back button
-            back_emoji = vzoel_assets.get_emoji('merah', premium_format=True)
-            keyboard = InlineKeyboardMarkup([[
-                InlineKeyboardButton(f"{back_emoji} Back to Main", callback_data=f"help_main_{user_id}")
-            ]])
-            
-            await callback_query.edit_message_text(
-                text=about_text,
-                reply_markup=keyboard,
-                parse_mode=ParseMode.MARKDOWN
-            )
+            page = "m"
+        elif not help_system.plugins_data:
+            await help_system.initialize()
+        
+        text, keyboard = help_system.render_page(page, user_id)
+        await callback_query.edit_message_text(
+            text=text,
+            reply_markup=keyboard,
+            parse_mode=ParseMode.MARKDOWN
+        )
+        
+        session = help_system.current_sessions.get(user_id)
+        if session is not None:
+            session["current_view"] = page
         
         await callback_query.answer()
         
+    except MessageNotModified:
+        await callback_query.answer()
     except Exception as e:
         LOGGER.error(f"Error handling help callback: {e}")
         error_emoji = vzoel_assets.get_emoji('merah', premium_format=True)
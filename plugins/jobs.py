@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+VZOEL ASSISTANT v2 - Premium Background Jobs
+Lihat dan cancel job background (autobot create / bulk create)
+Created by: VZLfxs @Lutpan
+"""
+
+from pyrogram.types import Message
+from pyrogram.enums import ParseMode
+
+# Import sistem terintegrasi premium
+from helper_client import VzoelClient
+from helper_cmd_handler import CMD_HANDLER, get_command, get_arguments
+from helper_logger import LOGGER
+from helpers.job_manager import job_manager
+from utils.assets import bold, italic, monospace, emoji
+
+# Jumlah job selesai yang ditampilkan di .jobs
+JOBS_HISTORY_SHOWN = 5
+
+STATUS_EMOJI = {
+    "done": "centang",
+    "failed": "merah",
+    "cancelled": "kuning",
+    "timeout": "kuning",
+}
+
+@VzoelClient.on_message(CMD_HANDLER)
+async def jobs_router(client: VzoelClient, message: Message):
+    """Router untuk job commands"""
+    command = get_command(message)
+
+    if command == "jobs":
+        await jobs_handler(client, message)
+    elif command == "cancel":
+        await cancel_handler(client, message)
+
+async def jobs_handler(client: VzoelClient, message: Message):
+    """
+    Daftar job yang sedang jalan + beberapa job terakhir
+    Usage: .jobs
+    """
+
+    lines = [f"{emoji('utama')} {bold('BACKGROUND JOBS')}", ""]
+
+    running = job_manager.running()
+    if running:
+        for job in running:
+            lines.append(
+                f"{emoji('loading')} **#{job.id}** {job.name} • "
+                f"{job.elapsed:.0f}/{job.budget:g}s"
+                + (f" • {job.progress}" if job.progress else "")
+            )
+    else:
+        lines.append(f"{emoji('aktif')} Tidak ada job yang berjalan")
+
+    finished = job_manager.history()[-JOBS_HISTORY_SHOWN:]
+    if finished:
+        lines.extend(["", f"{emoji('proses')} {bold('Recent:')}"])
+        for job in reversed(finished):
+            lines.append(
+                f"{emoji(STATUS_EMOJI.get(job.status, 'aktif'))} **#{job.id}** {job.name} • "
+                f"{job.status} ({job.elapsed:.0f}s)"
+            )
+
+    lines.extend([
+        "",
+        f"{emoji('kuning')} **Cancel:** {monospace('.cancel <id>')} / {monospace('.cancel all')}",
+        "",
+        f"{italic('Premium Jobs by Vzoel VZLfxs @Lutpan')}"
+    ])
+    await message.reply_text("\n".join(lines), parse_mode=ParseMode.MARKDOWN)
+
+async def cancel_handler(client: VzoelClient, message: Message):
+    """
+    Cancel job background (berhenti di await point berikutnya)
+    Usage: .cancel <id> atau .cancel all
+    """
+
+    target = get_arguments(message).strip().lower().lstrip("#")
+
+    if target == "all":
+        cancelled = job_manager.cancel_all()
+        await message.reply_text(
+            f"{emoji('centang')} {bold('Jobs Cancelled!')}\n\n"
+            f"{emoji('aktif')} **Cancelled:** {cancelled}",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+
+    if not target.isdigit():
+        await message.reply_text(
+            f"{emoji('merah')} {bold('Usage:')} {monospace('.cancel <id>')} / {monospace('.cancel all')}\n\n"
+            f"{emoji('kuning')} Lihat id job dengan {monospace('.jobs')}",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+
+    job_id = int(target)
+    if not job_manager.cancel(job_id):
+        job = job_manager.get(job_id)
+        state = f"sudah {job.status}" if job else "tidak ditemukan"
+        await message.reply_text(
+            f"{emoji('merah')} {bold(f'Job #{job_id} {state}')}",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+
+    await message.reply_text(
+        f"{emoji('centang')} {bold(f'Job #{job_id} Cancelled!')}",
+        parse_mode=ParseMode.MARKDOWN
+    )
+
+# Register plugin info
+LOGGER.info(f"{emoji('centang')} Premium Background Jobs initialized")
@@ -15,13 +15,13 @@ from logger import (
     health_check
 )
 from helpers.display_helper import DisplayHelper
-from utils.assets import VzoelAssets, vzoel_msg, bold, italic, emoji
+from utils.assets import vzoel_assets, vzoel_msg, bold, italic, emoji
 from datetime import datetime, timedelta
 import json
 
 # Initialize premium components
 display_helper = DisplayHelper()
-assets = VzoelAssets()
+assets = vzoel_assets  # shared instance, font/emoji JSON tidak di-load ulang
 
 @Client.on_message(filters.command("logs"))
 async def logger_menu_command(client: Client, message: Message):
@@ -7,16 +7,21 @@ Created by: VZLfxs @Lutpan
 from pyrogram import Client, filters
 from pyrogram.types import Message
 from helpers.logo_helper import LogoHelper
-from helpers.image_helper import ImageHelper, process_vzoel_images
+from helpers.image_helper import ImageHelper, process_vzoel_images_async
 from helpers.display_helper import DisplayHelper
-from utils.assets import VzoelAssets, vzoel_msg, bold, italic, emoji
+from helpers.file_id_cache import file_id_cache
+from utils.assets import vzoel_assets, vzoel_msg, bold, italic, emoji
 import os
+import time
 
 # Initialize premium components
 logo_helper = LogoHelper()
 image_helper = ImageHelper()
 display_helper = DisplayHelper()
-assets = VzoelAssets()
+assets = vzoel_assets  # shared instance, font/emoji JSON tidak di-load ulang
+
+# Jarak minimal antar edit progress /optimize (hindari FloodWait)
+OPTIMIZE_PROGRESS_INTERVAL = 2.0
 
 @Client.on_message(filters.command("logo"))
 async def logo_display_command(client: Client, message: Message):
@@ -166,11 +171,7 @@ async def image_gallery_command(client: Client, message: Message):
             for name, path in list(available_images.items())[:3]:  # Limit to 3 untuk avoid spam
                 try:
                     caption = f"{emoji('centang')} **{name.title()}**\n\nPart of Vzoel Premium Collection"
-                    await client.send_photo(
-                        chat_id=message.chat.id,
-                        photo=path,
-                        caption=caption
-                    )
+                    await file_id_cache.send_photo(client, message.chat.id, path, caption=caption)
                 except:
                     continue
         
@@ -282,8 +283,24 @@ async def optimize_images_command(client: Client, message: Message):
         )
         processing_message = await message.reply_text(processing_msg)
         
-        # Process all images
-        results = process_vzoel_images()
+        # Process all images (paralel di process pool, progress per file)
+        last_edit = 0.0
+        
+        async def on_progress(done: int, total: int, filename: str, ok: bool):
+            nonlocal last_edit
+            now = time.monotonic()
+            if done < total and now - last_edit < OPTIMIZE_PROGRESS_INTERVAL:
+                return
+            last_edit = now
+            try:
+                await processing_message.edit_text(
+                    f"{emoji('loading')} {bold('Optimizing Images')} {done}/{total}\n"
+                    f"{emoji('centang' if ok else 'merah')} {filename}"
+                )
+            except Exception:
+                pass
+        
+        results = await process_vzoel_images_async(on_progress=on_progress)
         
         # Create results report
         if results['total'] == 0:
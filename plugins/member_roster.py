@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+VZOEL ASSISTANT v2 - Premium Member Roster
+Roster member per chat: update incremental dari join/leave dan author message
+Created by: VZLfxs @Lutpan
+"""
+
+from pyrogram import filters
+from pyrogram.types import Message, ChatMemberUpdated
+from pyrogram.enums import ParseMode, ChatMemberStatus, ChatType
+from pyrogram.errors import ChatAdminRequired
+
+# Import sistem terintegrasi premium
+from helper_client import VzoelClient
+from helper_cmd_handler import CMD_HANDLER, get_command, get_arguments
+from helper_logger import LOGGER
+from helpers.member_roster import member_roster
+from utils.assets import bold, italic, monospace, emoji
+
+# Group handler sendiri supaya tidak bentrok dengan welcome / blacklist monitor
+ROSTER_GROUP = 2
+GROUP_CHAT_TYPES = (ChatType.GROUP, ChatType.SUPERGROUP)
+
+async def _tracked_chat(_, __, update) -> bool:
+    """Hanya chat yang sudah punya roster (cek O(1))"""
+    if member_roster._db is None:
+        await member_roster.ensure_loaded()
+    chat = update.chat
+    return chat is not None and chat.id in member_roster.refreshed_at
+
+tracked_chat_filter = filters.create(_tracked_chat)
+
+@VzoelClient.on_message(tracked_chat_filter, group=ROSTER_GROUP)
+async def roster_message_author(client: VzoelClient, message: Message):
+    """Author message = member aktif, catat ke roster"""
+    if message.from_user:
+        member_roster.observe(message.chat.id, message.from_user)
+
+@VzoelClient.on_chat_member_updated(tracked_chat_filter, group=ROSTER_GROUP)
+async def roster_member_update(client: VzoelClient, update: ChatMemberUpdated):
+    """Join / leave / ban -> update roster"""
+    member = update.new_chat_member or update.old_chat_member
+    if not member or not member.user:
+        return
+
+    if update.new_chat_member and update.new_chat_member.status not in (
+            ChatMemberStatus.LEFT, ChatMemberStatus.BANNED):
+        member_roster.observe(update.chat.id, member.user)
+    else:
+        member_roster.remove(update.chat.id, member.user.id)
+
+@VzoelClient.on_message(CMD_HANDLER)
+async def roster_router(client: VzoelClient, message: Message):
+    """Router untuk roster commands"""
+    command = get_command(message)
+
+    if command == "roster":
+        await roster_handler(client, message)
+
+async def roster_handler(client: VzoelClient, message: Message):
+    """
+    Roster status / refresh
+    Usage: .roster atau .roster refresh
+    """
+
+    if message.chat.type not in GROUP_CHAT_TYPES:
+        await message.reply_text(
+            f"{emoji('merah')} {bold('Group Only!')}",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+
+    chat_id = message.chat.id
+    if get_arguments(message).strip().lower() == "refresh":
+        status = await message.reply_text(
+            f"{emoji('loading')} {bold('Refreshing member roster...')}",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        try:
+            total = await member_roster.refresh(client, chat_id)
+        except ChatAdminRequired:
+            await status.edit_text(
+                f"{emoji('merah')} {bold('Admin Required!')}\n\n"
+                f"{emoji('kuning')} Member list is not visible for this account.",
+                parse_mode=ParseMode.MARKDOWN
+            )
+            return
+        await status.edit_text(
+            f"{emoji('centang')} {bold('Roster Refreshed!')}\n\n"
+            f"{emoji('aktif')} **Members:** {total}",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+
+    await member_roster.ensure_loaded()
+    if not member_roster.is_tracked(chat_id):
+        state = "Belum ada (dibuat saat .tagall / .roster refresh)"
+    elif member_roster.is_fresh(chat_id):
+        state = "Fresh"
+    else:
+        state = "Kadaluarsa (refresh otomatis saat dipakai)"
+
+    await message.reply_text(
+        f"{emoji('telegram')} {bold('MEMBER ROSTER')}\n\n"
+        f"{emoji('aktif')} **Members:** {await member_roster.count(chat_id)}\n"
+        f"{emoji('proses')} **Status:** {state}\n"
+        f"{emoji('loading')} **Refresh:** {monospace('.roster refresh')}\n\n"
+        f"{italic('Premium Roster by Vzoel VZLfxs @Lutpan')}",
+        parse_mode=ParseMode.MARKDOWN
+    )
+
+# Register plugin info
+LOGGER.info(f"{emoji('centang')} Premium Member Roster initialized")
@@ -8,120 +8,200 @@ Created by: VZLfxs @Lutpan Assistant
 import os
 import json
 import shutil
-import requests
 import asyncio
 import hashlib
-import importlib
+import aiohttp
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from pyrogram import Client, filters
 from pyrogram.types import Message, InlineKeyboardMarkup, InlineKeyboardButton, CallbackQuery
 from pyrogram.enums import ParseMode
 
 # Import sistem terintegrasi premium
 from helper_client import VzoelClient
+from core.loader.loader_registry import reload_plugin_module
 from helper_cmd_handler import CMD_HANDLER, get_command, get_arguments
 from helper_config import CONFIG
 from helper_logger import LOGGER
 from utils.assets import vzoel_assets, premium_emoji, bold, italic, monospace, vzoel_signature
+from utils.atomic_io import atomic_write_bytes, atomic_write_json
+
+GITHUB_REPO_API = "https://api.github.com/repos/VanZoel112/vzoelv2"
+PLUGIN_HASH_MANIFEST = os.path.join("vzoel", "plugin_hashes.json")
+
+def git_blob_sha1(content: bytes) -> str:
+    """Hash sama dengan `sha` GitHub contents API (git blob object)"""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
 
 class PluginUpdater:
     """System untuk update plugins otomatis dari GitHub"""
     
-    def __init__(self):
-        self.repo_url = "https://api.github.com/repos/VanZoel112/vzoelv2"
-        self.plugins_dir = "plugins"
-        self.backup_dir = "plugins_backup"
+    def __init__(self, repo_url: str = GITHUB_REPO_API, plugins_dir: str = "plugins",
+                 backup_dir: str = "plugins_backup", manifest_path: str = PLUGIN_HASH_MANIFEST,
+                 download_concurrency: int = 4, request_timeout: float = 30):
+        self.repo_url = repo_url.rstrip("/")
+        self.plugins_dir = plugins_dir
+        self.backup_dir = backup_dir
+        self.manifest_path = manifest_path
+        self.download_concurrency = download_concurrency
+        self.request_timeout = request_timeout
         self.update_cache = {}
         self.update_history = []
+        # file_name -> [mtime_ns, size, blob_sha]; hash hanya dihitung ulang kalau file berubah
+        self._manifest: Optional[Dict[str, List]] = None
+        self._manifest_dirty = False
+        # url -> (etag, payload) untuk conditional request (If-None-Match)
+        self._etags: Dict[str, Tuple[str, Any]] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._download_semaphore = asyncio.Semaphore(download_concurrency)
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+                headers={"Accept": "application/vnd.github+json"}
+            )
+        return self._session
+    
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+    
+    async def _get_json(self, url: str) -> Any:
+        """GET JSON dengan ETag: 304 Not Modified -> payload cache (tidak makan rate limit)"""
+        cached = self._etags.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        
+        async with self._get_session().get(url, headers=headers) as response:
+            if response.status == 304 and cached:
+                return cached[1]
+            if response.status != 200:
+                raise Exception(f"GitHub API error: {response.status}")
+            
+            payload = await response.json(content_type=None)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._etags[url] = (etag, payload)
+            return payload
         
     async def check_updates(self) -> Dict[str, Dict]:
         """Check available updates dari GitHub"""
         LOGGER.info("🔍 Checking for plugin updates...")
         
         try:
-            async with aiohttp.ClientSession() as session:
-                # Get latest commit info
-                async with session.get(f"{self.repo_url}/commits/main") as response:
-                    if response.status != 200:
-                        raise Exception(f"GitHub API error: {response.status}")
+            # Get latest commit info
+            commit_data = await self._get_json(f"{self.repo_url}/commits/main")
+            latest_sha = commit_data["sha"][:8]
+            latest_date = commit_data["commit"]["committer"]["date"]
+            
+            # Get current plugin files
+            remote_files = await self._get_json(f"{self.repo_url}/contents/plugins")
+            
+            # Compare dengan local files (blob sha penuh)
+            updates_available = {}
+            for remote_file in remote_files:
+                if remote_file["type"] == "file" and remote_file["name"].endswith(".py"):
+                    file_name = remote_file["name"]
+                    remote_sha = remote_file["sha"]
                     
-                    commit_data = await response.json()
-                    latest_sha = commit_data["sha"][:8]
-                    latest_date = commit_data["commit"]["committer"]["date"]
-                
-                # Get current plugin files
-                async with session.get(f"{self.repo_url}/contents/plugins") as response:
-                    if response.status != 200:
-                        raise Exception(f"Failed to get plugins list: {response.status}")
+                    local_file_path = os.path.join(self.plugins_dir, file_name)
+                    local_sha = await self._get_local_file_hash(local_file_path)
                     
-                    remote_files = await response.json()
-                
-                # Compare dengan local files
-                updates_available = {}
-                for remote_file in remote_files:
-                    if remote_file["type"] == "file" and remote_file["name"].endswith(".py"):
-                        file_name = remote_file["name"]
-                        remote_sha = remote_file["sha"][:8]
-                        
-                        local_file_path = os.path.join(self.plugins_dir, file_name)
-                        local_sha = await self._get_local_file_hash(local_file_path)
-                        
-                        if local_sha != remote_sha:
-                            updates_available[file_name] = {
-                                "local_sha": local_sha,
-                                "remote_sha": remote_sha,
-                                "download_url": remote_file["download_url"],
-                                "size": remote_file["size"],
-                                "is_new": not os.path.exists(local_file_path)
-                            }
-                
-                self.update_cache = {
-                    "last_check": datetime.now().isoformat(),
-                    "latest_commit": latest_sha,
-                    "latest_date": latest_date,
-                    "updates": updates_available
-                }
-                
-                LOGGER.info(f"✅ Found {len(updates_available)} plugin updates")
-                return updates_available
+                    if local_sha != remote_sha:
+                        updates_available[file_name] = {
+                            "local_sha": local_sha[:8],
+                            "remote_sha": remote_sha[:8],
+                            "blob_sha": remote_sha,
+                            "download_url": remote_file["download_url"],
+                            "size": remote_file["size"],
+                            "is_new": not os.path.exists(local_file_path)
+                        }
+            
+            self._save_manifest()
+            self.update_cache = {
+                "last_check": datetime.now().isoformat(),
+                "latest_commit": latest_sha,
+                "latest_date": latest_date,
+                "updates": updates_available
+            }
+            
+            LOGGER.info(f"✅ Found {len(updates_available)} plugin updates")
+            return updates_available
                 
         except Exception as e:
             LOGGER.error(f"Failed to check updates: {e}")
             return {}
     
+    def _load_manifest(self) -> Dict[str, List]:
+        if self._manifest is None:
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    self._manifest = json.load(f)
+            except (OSError, ValueError):
+                self._manifest = {}
+        return self._manifest
+    
+    def _save_manifest(self):
+        if not self._manifest_dirty:
+            return
+        try:
+            atomic_write_json(self.manifest_path, self._manifest, indent=None)
+            self._manifest_dirty = False
+        except Exception as e:
+            LOGGER.warning(f"Failed to save plugin hash manifest: {e}")
+    
+    def _remember_hash(self, file_name: str, stat: os.stat_result, sha: str):
+        self._load_manifest()[file_name] = [stat.st_mtime_ns, stat.st_size, sha]
+        self._manifest_dirty = True
+    
     async def _get_local_file_hash(self, file_path: str) -> str:
-        """Get hash dari local file"""
-        if not os.path.exists(file_path):
+        """Git blob hash dari local file (dari manifest kalau mtime & size sama)"""
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
             return "new_file"
+        except OSError:
+            return "error"
+        
+        file_name = os.path.basename(file_path)
+        entry = self._load_manifest().get(file_name)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
         
         try:
             with open(file_path, 'rb') as f:
-                content = f.read()
-                return hashlib.sha1(content).hexdigest()[:8]
+                sha = git_blob_sha1(f.read())
         except Exception:
             return "error"
+        self._remember_hash(file_name, stat, sha)
+        return sha
     
-    async def download_plugin(self, file_name: str, download_url: str) -> Tuple[bool, str]:
-        """Download single plugin file"""
+    async def download_plugin(self, file_name: str, download_url: str,
+                              expected_sha: Optional[str] = None) -> Tuple[bool, str]:
+        """Download single plugin file (atomic write, blob sha diverifikasi)"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(download_url) as response:
+            async with self._download_semaphore:
+                async with self._get_session().get(download_url) as response:
                     if response.status != 200:
                         return False, f"Download failed: HTTP {response.status}"
                     
-                    content = await response.text()
-                    
-                    # Create backup jika file exists
-                    local_file_path = os.path.join(self.plugins_dir, file_name)
-                    if os.path.exists(local_file_path):
-                        await self._create_backup(local_file_path)
-                    
-                    # Write new file
-                    with open(local_file_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    
-                    return True, "Downloaded successfully"
+                    content = await response.read()
+            
+            sha = git_blob_sha1(content)
+            if expected_sha and sha != expected_sha:
+                return False, f"Checksum mismatch: expected {expected_sha[:8]}, got {sha[:8]}"
+            
+            # Create backup jika file exists
+            local_file_path = os.path.join(self.plugins_dir, file_name)
+            if os.path.exists(local_file_path):
+                await self._create_backup(local_file_path)
+            
+            # Write new file (temp + rename, file lama utuh kalau gagal)
+            atomic_write_bytes(local_file_path, content)
+            self._remember_hash(file_name, os.stat(local_file_path), sha)
+            self._save_manifest()
+            
+            return True, "Downloaded successfully"
                     
         except Exception as e:
             return False, str(e)
@@ -138,15 +218,25 @@ class PluginUpdater:
         shutil.copy2(file_path, backup_path)
         LOGGER.info(f"📋 Created backup: {backup_name}")
     
-    async def update_plugin(self, file_name: str) -> Tuple[bool, str]:
-        """Update specific plugin"""
+    async def update_plugin(self, file_name: str, client: Optional[Client] = None) -> Tuple[bool, str]:
+        """Update specific plugin (reload + swap handler kalau client diberikan)"""
+        success, message = await self._download_update(file_name)
+        if not success:
+            return success, message
+        return await self._apply_update(file_name, client)
+    
+    async def _download_update(self, file_name: str) -> Tuple[bool, str]:
+        """Download plugin dari update_cache dan catat history"""
         if file_name not in self.update_cache.get("updates", {}):
             return False, "No update available for this plugin"
         
         update_info = self.update_cache["updates"][file_name]
-        success, message = await self.download_plugin(file_name, update_info["download_url"])
+        success, message = await self.download_plugin(
+            file_name, update_info["download_url"], update_info.get("blob_sha")
+        )
         
         if success:
+            self.update_cache["updates"].pop(file_name, None)
             # Record update history
             self.update_history.append({
                 "file": file_name,
@@ -155,38 +245,44 @@ class PluginUpdater:
                 "to_sha": update_info["remote_sha"],
                 "is_new": update_info["is_new"]
             })
-            
-            # Try to reload plugin
-            try:
-                await self._reload_plugin(file_name)
-                return True, f"Plugin {file_name} updated and reloaded successfully"
-            except Exception as e:
-                return True, f"Plugin updated but reload failed: {e}"
         
         return success, message
     
-    async def _reload_plugin(self, file_name: str):
-        """Reload plugin module"""
-        module_name = f"plugins.{file_name[:-3]}"  # Remove .py extension
+    async def _apply_update(self, file_name: str, client: Optional[Client]) -> Tuple[bool, str]:
+        """Try to reload plugin yang sudah di-download"""
+        if client is None:
+            return True, f"Plugin {file_name} updated, restart to apply"
+        try:
+            self._reload_plugin(file_name, client)
+            return True, f"Plugin {file_name} updated, reload scheduled"
+        except Exception as e:
+            return True, f"Plugin updated but reload failed: {e}"
+    
+    def _reload_plugin(self, file_name: str, client: Client):
+        """
+        Reload plugin module; swap handler lama -> baru dijadwalkan di task
+        terpisah (berlaku setelah handler callback ini selesai, tidak dobel)
+        """
+        module_name = f"{self.plugins_dir}.{file_name[:-3]}"  # Remove .py extension
         
-        if module_name in sys.modules:
-            importlib.reload(sys.modules[module_name])
-        else:
-            importlib.import_module(module_name)
+        handler_count = reload_plugin_module(client, module_name)
         
-        LOGGER.info(f"🔄 Reloaded plugin: {file_name}")
+        LOGGER.info(f"🔄 Reloaded plugin: {file_name} ({handler_count} handlers, swap scheduled)")
     
-    async def update_all_plugins(self) -> Dict[str, Tuple[bool, str]]:
-        """Update semua available plugins"""
-        results = {}
-        
+    async def update_all_plugins(self, client: Optional[Client] = None) -> Dict[str, Tuple[bool, str]]:
+        """
+        Update semua available plugins: download paralel (dibatasi semaphore),
+        reload berurutan; swap handler dijadwalkan per plugin (urut, FIFO lock)
+        """
         if not self.update_cache.get("updates"):
             await self.check_updates()
         
-        for file_name in self.update_cache.get("updates", {}):
-            results[file_name] = await self.update_plugin(file_name)
-            await asyncio.sleep(1)  # Rate limiting
+        file_names = list(self.update_cache.get("updates", {}))
+        downloads = await asyncio.gather(*(self._download_update(file_name) for file_name in file_names))
         
+        results = {}
+        for file_name, (success, message) in zip(file_names, downloads):
+            results[file_name] = await self._apply_update(file_name, client) if success else (success, message)
         return results
     
     def create_update_keyboard(self, user_id: int) -> InlineKeyboardMarkup:
@@ -379,7 +475,7 @@ async def update_callback_handler(client: VzoelClient, callback_query: CallbackQ
             loading_emoji = vzoel_assets.get_emoji('loading', premium_format=True)
             await callback_query.answer(f"{loading_emoji} Updating {file_name}...")
             
-            success, message = await plugin_updater.update_plugin(file_name)
+            success, message = await plugin_updater.update_plugin(file_name, client)
             
             if success:
                 centang_emoji = vzoel_assets.get_emoji('centang', premium_format=True)
@@ -404,7 +500,7 @@ async def update_callback_handler(client: VzoelClient, callback_query: CallbackQ
             loading_emoji = vzoel_assets.get_emoji('loading', premium_format=True)
             await callback_query.answer(f"{loading_emoji} Updating all plugins...")
             
-            results = await plugin_updater.update_all_plugins()
+            results = await plugin_updater.update_all_plugins(client)
             
             success_count = sum(1 for success, _ in results.values() if success)
             total_count = len(results)
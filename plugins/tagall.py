@@ -6,17 +6,79 @@ Created by: VZLfxs @Lutpan
 """
 
 import asyncio
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator, Set
 from pyrogram.types import Message, User
-from pyrogram.enums import ParseMode, ChatMemberStatus
+from pyrogram.enums import ParseMode, ChatMemberStatus, ChatType
 from pyrogram.errors import MessageNotModified, FloodWait, ChatAdminRequired
 
 # Import sistem terintegrasi premium
 from helper_client import VzoelClient, is_user_mode, get_client_type
 from helper_cmd_handler import CMD_HANDLER, get_command, get_arguments
 from helper_logger import LOGGER
+from helpers.member_roster import RosterMember, member_roster
+from helpers.session_table import SessionRecord, session_table
+from utils.cache import LRUCache
 from utils.assets import vzoel_assets, premium_emoji, bold, italic, monospace, emoji, vzoel_signature
 
+GROUP_CHAT_TYPES = (ChatType.GROUP, ChatType.SUPERGROUP)
+
+class TagallFrameCache:
+    """
+    Cache frame tagall yang sudah di-render:
+    - Frame = (base message, isi batch, frame index) -> teks final
+    - Batch dengan isi sama memakai frame yang sama
+    - `max_frames` = budget memori; frame yang terbuang di-render ulang dari
+      komponen (base message ter-style & blok mention per style)
+    """
+    
+    def __init__(self, system: "PremiumTagAllSystem", max_frames: int = 4000):
+        self.system = system
+        self.frames = LRUCache(maxsize=max_frames)
+        self._styled_base = LRUCache(maxsize=64)
+        self._mention_blocks = LRUCache(maxsize=max_frames // 4 or 1)
+    
+    @property
+    def cycle_length(self) -> int:
+        return len(self.system.tagall_emoji_frames) * len(self.system.font_styles)
+    
+    @staticmethod
+    def batch_key(members: List[RosterMember]) -> tuple:
+        return tuple((member.id, member.first_name, member.username) for member in members)
+    
+    def frame(self, base_message: str, batch_key: tuple, frame_index: int) -> str:
+        """Frame ke-N (emoji berganti tiap frame, font style tiap satu putaran emoji)"""
+        frame_index %= self.cycle_length
+        cache_key = (base_message, batch_key, frame_index)
+        text = self.frames.get(cache_key)
+        if text is None:
+            emoji_count = len(self.system.tagall_emoji_frames)
+            style_index = frame_index // emoji_count
+            text = self.system.assemble_tagall_message(
+                self._styled(base_message, style_index),
+                self._mentions(batch_key, style_index),
+                self.system.tagall_emoji_frames[frame_index % emoji_count],
+                self.system.font_styles[style_index]
+            )
+            self.frames.set(cache_key, text)
+        return text
+    
+    def _styled(self, base_message: str, style_index: int) -> str:
+        key = (base_message, style_index)
+        styled = self._styled_base.get(key)
+        if styled is None:
+            styled = self.system.font_styles[style_index]["func"](base_message)
+            self._styled_base.set(key, styled)
+        return styled
+    
+    def _mentions(self, batch_key: tuple, style_index: int) -> List[str]:
+        key = (batch_key, style_index)
+        mentions = self._mention_blocks.get(key)
+        if mentions is None:
+            members = [RosterMember(user_id, first_name, username) for user_id, first_name, username in batch_key]
+            mentions = self.system.format_mentions(members, self.system.font_styles[style_index])
+            self._mention_blocks.set(key, mentions)
+        return mentions
+
 class PremiumTagAllSystem:
     """Premium TagAll System dengan emoji rotation dan batched mentions"""
     
@@ -43,70 +105,79 @@ class PremiumTagAllSystem:
             {"name": "normal", "func": lambda x: x}
         ]
         
-        # Active tagall sessions
+        # Active tagall sessions (fase kirim batch); rotasi batch ada di session_table
         self.active_sessions = {}
+        # Task rotasi yang sedang jalan (event loop hanya simpan weakref)
+        self.rotation_tasks: Set[asyncio.Task] = set()
         
         # Member collection settings
         self.batch_size = 5  # 5 mentions per message
         self.edit_interval = 4.0  # 4 seconds between edits
+        self.batch_interval = 2.0  # 2 seconds between batch messages
+        self.queue_batches = 4  # Batch siap kirim yang boleh antri (memori konstan)
         
-    async def collect_group_members(self, client: VzoelClient, chat_id: int) -> List[User]:
-        """Collect all group members yang bisa ditag - works for both user and bot mode"""
-        members = []
+        # Frame rotation di-render sekali lalu di-cache (10 emoji x 4 font style)
+        self.frame_cache = TagallFrameCache(self)
+        
+    async def iter_taggable_members(self, client: VzoelClient, chat_id: int) -> AsyncIterator[RosterMember]:
+        """Stream member yang bisa ditag (roster -> filter) - works for both user and bot mode"""
+        client_type = get_client_type(client)
+        LOGGER.info(f"Streaming members for chat {chat_id} using {client_type} mode")
+        count = 0
         
         try:
-            client_type = get_client_type(client)
-            LOGGER.info(f"Collecting members for chat {chat_id} using {client_type} mode")
-            
-            # Get chat members - works without admin for user mode
-            async for member in client.get_chat_members(chat_id):
-                # Skip bots, deleted accounts, dan restricted users
-                if (member.user and 
-                    not member.user.is_bot and 
-                    not member.user.is_deleted and
-                    member.status not in [ChatMemberStatus.BANNED, ChatMemberStatus.LEFT]):
-                    
-                    members.append(member.user)
-            
-            LOGGER.info(f"Collected {len(members)} taggable members with {client_type} mode")
-            return members
+            # Roster lokal kalau masih fresh, selain itu get_chat_members (sekalian isi roster)
+            async for member in member_roster.stream_members(client, chat_id):
+                # Skip bots dan deleted accounts (banned / left tidak masuk roster)
+                if not member.is_bot and not member.is_deleted:
+                    count += 1
+                    yield member
             
         except ChatAdminRequired:
-            # User mode can still work in many cases without admin
+            # User mode: member yang sudah di-stream tetap ditag
             if is_user_mode(client):
                 LOGGER.info("Continuing with user mode - admin not required")
-                try:
-                    # Alternative method for user accounts
-                    chat = await client.get_chat(chat_id)
-                    # Use basic member list if available
-                    return members  # Return what we have so far
-                except:
-                    pass
             else:
                 LOGGER.warning("Admin privileges required for bot mode")
-            return []
         except Exception as e:
             LOGGER.error(f"Error collecting members: {e}")
-            return []
-    
-    def create_member_batches(self, members: List[User]) -> List[List[User]]:
-        """Split members into batches of 5"""
-        batches = []
-        
-        for i in range(0, len(members), self.batch_size):
-            batch = members[i:i + self.batch_size]
-            batches.append(batch)
         
-        return batches
+        LOGGER.info(f"Streamed {count} taggable members with {client_type} mode")
+    
+    async def iter_member_batches(self, members: AsyncIterator[RosterMember]) -> AsyncIterator[List[RosterMember]]:
+        """Kelompokkan stream member jadi batch berisi `batch_size`"""
+        batch = []
+        async for member in members:
+            batch.append(member)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    async def produce_batches(self, client: VzoelClient, chat_id: int,
+                              queue: asyncio.Queue) -> None:
+        """Producer: isi queue (bounded) dengan batch; None = stream selesai"""
+        try:
+            async for batch in self.iter_member_batches(self.iter_taggable_members(client, chat_id)):
+                await queue.put(batch)
+        except Exception as e:
+            LOGGER.error(f"Error streaming member batches: {e}")
+        await queue.put(None)
     
-    def format_tagall_message(self, base_message: str, members: List[User], 
+    def format_tagall_message(self, base_message: str, members: List[RosterMember], 
                             emoji_frame: str, font_style: Dict[str, Any]) -> str:
-        """Format tagall message dengan premium styling"""
+        """Format tagall message dengan premium styling (tanpa cache)"""
         
         # Apply font style to base message
         styled_message = font_style["func"](base_message)
         
-        # Create member mentions
+        return self.assemble_tagall_message(
+            styled_message, self.format_mentions(members, font_style), emoji_frame, font_style
+        )
+    
+    def format_mentions(self, members: List[RosterMember], font_style: Dict[str, Any]) -> List[str]:
+        """Create member mentions dengan premium styling"""
         mentions = []
         for member in members:
             # Create mention dengan premium styling
@@ -114,6 +185,11 @@ class PremiumTagAllSystem:
             mention_text = f"@{member.username}" if member.username else mention_name
             styled_mention = font_style["func"](mention_text)
             mentions.append(f"[{styled_mention}](tg://user?id={member.id})")
+        return mentions
+    
+    def assemble_tagall_message(self, styled_message: str, mentions: List[str],
+                                emoji_frame: str, font_style: Dict[str, Any]) -> str:
+        """Gabungkan komponen yang sudah di-style jadi teks tagall"""
         
         # Format complete message
         tagall_lines = [
@@ -139,70 +215,82 @@ class PremiumTagAllSystem:
         return "\n".join(tagall_lines)
     
     async def start_tagall_session(self, client: VzoelClient, message: Message, 
-                                 base_message: str, members: List[User]) -> None:
-        """Start premium tagall session dengan emoji rotation"""
+                                 base_message: str) -> int:
+        """
+        Start premium tagall session dengan emoji rotation.
+        Member di-stream: batch pertama terkirim sebelum fetch member selesai.
+        Return jumlah member yang ditag
+        """
         
         # Create session ID
         session_id = f"tagall_{message.chat.id}_{message.id}"
         
-        # Create member batches
-        member_batches = self.create_member_batches(members)
-        
-        if not member_batches:
-            await message.reply_text(
-                f"{emoji('merah')} {bold('No members to tag!')}\\n\\n"
-                f"{emoji('kuning')} Possible reasons:\\n"
-                f"• Group has no active members\\n"
-                f"• Bot lacks permission to view members\\n"
-                f"• All members are bots or deleted accounts",
-                parse_mode=ParseMode.MARKDOWN
-            )
-            return
-        
         # Mark session as active
         self.active_sessions[session_id] = True
         
+        # Pipeline: producer (fetch -> filter -> batch) -> queue bounded -> kirim
+        queue = asyncio.Queue(maxsize=self.queue_batches)
+        producer = asyncio.create_task(self.produce_batches(client, message.chat.id, queue))
+        batch_count = 0
+        member_count = 0
+        
         try:
-            # Process each batch
-            for batch_index, member_batch in enumerate(member_batches):
+            while True:
+                member_batch = await queue.get()
+                if member_batch is None:
+                    break
                 
                 # Check if session is still active
                 if not self.active_sessions.get(session_id, False):
                     break
                 
-                # Send initial message untuk batch ini
-                initial_emoji = self.tagall_emoji_frames[0]
-                initial_style = self.font_styles[0]
+                # Wait before next batch (bukan sebelum batch pertama)
+                if batch_count:
+                    await asyncio.sleep(self.batch_interval)
+                    if not self.active_sessions.get(session_id, False):
+                        break
                 
-                initial_message = self.format_tagall_message(
-                    base_message, member_batch, initial_emoji, initial_style
-                )
+                # Send initial message untuk batch ini (frame 0)
+                batch_key = self.frame_cache.batch_key(member_batch)
+                initial_message = self.frame_cache.frame(base_message, batch_key, 0)
                 
                 batch_msg = await message.reply_text(
                     initial_message,
                     parse_mode=ParseMode.MARKDOWN
                 )
                 
-                # Start emoji rotation untuk batch ini
-                asyncio.create_task(
-                    self.rotate_batch_message(
-                        batch_msg, base_message, member_batch, session_id
-                    )
+                # Start emoji rotation untuk batch ini (record ringkas, bukan Message/User)
+                record = session_table.open(
+                    "tagall", (session_id, batch_msg.id), batch_msg.chat.id, batch_msg.id,
+                    (base_message, batch_key)
                 )
-                
-                # Wait before next batch (if not last batch)
-                if batch_index < len(member_batches) - 1:
-                    await asyncio.sleep(2.0)
+                rotation = asyncio.create_task(self.rotate_batch_message(client, record))
+                self.rotation_tasks.add(rotation)
+                rotation.add_done_callback(self.rotation_tasks.discard)
+                batch_count += 1
+                member_count += len(member_batch)
+            
+            if not batch_count:
+                self.active_sessions.pop(session_id, None)
+                await message.reply_text(
+                    f"{emoji('merah')} {bold('No members to tag!')}\\n\\n"
+                    f"{emoji('kuning')} Possible reasons:\\n"
+                    f"• Group has no active members\\n"
+                    f"• Bot lacks permission to view members\\n"
+                    f"• All members are bots or deleted accounts",
+                    parse_mode=ParseMode.MARKDOWN
+                )
+                return 0
             
             # Log completion
-            LOGGER.info(f"TagAll session started: {len(member_batches)} batches, {len(members)} total members")
+            LOGGER.info(f"TagAll session started: {batch_count} batches, {member_count} total members")
             
             # Send completion notification
             completion_msg = [
                 f"{emoji('centang')} {bold('TagAll Session Active!')}",
                 "",
-                f"{emoji('utama')} **Total Batches:** {len(member_batches)}",
-                f"{emoji('aktif')} **Total Members:** {len(members)}",
+                f"{emoji('utama')} **Total Batches:** {batch_count}",
+                f"{emoji('aktif')} **Total Members:** {member_count}",
                 f"{emoji('loading')} **Update Interval:** {self.edit_interval}s",
                 "",
                 f"{emoji('merah')} **Stop:** Use {monospace('.stop')} command",
@@ -218,62 +306,54 @@ class PremiumTagAllSystem:
         except Exception as e:
             LOGGER.error(f"Error in tagall session: {e}")
             self.active_sessions[session_id] = False
+        finally:
+            producer.cancel()
+            self.active_sessions.pop(session_id, None)
+        
+        return member_count
     
-    async def rotate_batch_message(self, message: Message, base_message: str, 
-                                 members: List[User], session_id: str) -> None:
+    async def rotate_batch_message(self, client: VzoelClient, record: SessionRecord) -> None:
         """Rotate emoji dan font style untuk satu batch message"""
         
-        emoji_index = 0
-        style_index = 0
+        # Frame 0 sudah terkirim; frame berikutnya diambil dari cache
+        base_message, batch_key = record.data
+        frame_index = 0
         
         try:
-            while self.active_sessions.get(session_id, False):
+            while record.active:
                 
-                # Get current emoji dan style
-                current_emoji = self.tagall_emoji_frames[emoji_index % len(self.tagall_emoji_frames)]
-                current_style = self.font_styles[style_index % len(self.font_styles)]
+                # Wait for next rotation
+                await asyncio.sleep(self.edit_interval)
+                if not record.active:
+                    break
                 
-                # Format message dengan current styling
-                rotated_message = self.format_tagall_message(
-                    base_message, members, current_emoji, current_style
-                )
+                frame_index += 1
+                rotated_message = self.frame_cache.frame(base_message, batch_key, frame_index)
                 
                 try:
-                    await message.edit_text(
-                        rotated_message,
-                        parse_mode=ParseMode.MARKDOWN
-                    )
-                except MessageNotModified:
-                    pass
+                    await record.edit(client, rotated_message, parse_mode=ParseMode.MARKDOWN)
                 except Exception as e:
                     LOGGER.warning(f"Error editing tagall message: {e}")
                     break
-                
-                # Wait for next rotation
-                await asyncio.sleep(self.edit_interval)
-                
-                # Advance indices
-                emoji_index += 1
-                if emoji_index % len(self.tagall_emoji_frames) == 0:
-                    style_index += 1
                     
         except Exception as e:
             LOGGER.error(f"Error in message rotation: {e}")
         finally:
             # Ensure session cleanup
-            if session_id in self.active_sessions:
-                del self.active_sessions[session_id]
+            session_table.close(record)
     
     def stop_all_sessions(self) -> int:
         """Stop all active tagall sessions"""
-        stopped_count = len(self.active_sessions)
+        session_ids = set(self.active_sessions)
+        session_ids.update(record.key[0] for record in session_table.sessions("tagall"))
         
-        # Stop all sessions
+        # Stop all sessions (fase kirim + semua rotasi batch)
         for session_id in list(self.active_sessions.keys()):
             self.active_sessions[session_id] = False
             del self.active_sessions[session_id]
+        session_table.stop_kind("tagall")
         
-        return stopped_count
+        return len(session_ids)
 
 # Initialize premium tagall system
 tagall_system = PremiumTagAllSystem()
@@ -296,7 +376,7 @@ async def tagall_handler(client: VzoelClient, message: Message):
     """
     
     # Check if in group
-    if message.chat.type not in ["group", "supergroup"]:
+    if message.chat.type not in GROUP_CHAT_TYPES:
         await message.reply_text(
             f"{emoji('merah')} {bold('Group Only!')}\\n\\n"
             f"{emoji('kuning')} TagAll only works in groups and supergroups.",
@@ -352,33 +432,13 @@ async def tagall_handler(client: VzoelClient, message: Message):
     
     # Show collection progress
     collection_msg = await message.reply_text(
-        f"{emoji('loading')} {bold('Collecting group members...')}\\n"
-        f"{emoji('proses')} Please wait...",
-        parse_mode=ParseMode.MARKDOWN
-    )
-    
-    # Collect group members
-    members = await tagall_system.collect_group_members(client, message.chat.id)
-    
-    if not members:
-        await collection_msg.edit_text(
-            f"{emoji('merah')} {bold('Member Collection Failed!')}\\n\\n"
-            f"{emoji('kuning')} Unable to collect group members.\\n"
-            f"Make sure bot has admin permissions.",
-            parse_mode=ParseMode.MARKDOWN
-        )
-        return
-    
-    # Update collection status
-    await collection_msg.edit_text(
-        f"{emoji('centang')} {bold('Members Collected!')}\\n"
-        f"{emoji('aktif')} Found {bold(str(len(members)))} taggable members\\n"
-        f"{emoji('loading')} Starting TagAll session...",
+        f"{emoji('loading')} {bold('Starting TagAll session...')}\\n"
+        f"{emoji('proses')} Members are tagged while they are collected",
         parse_mode=ParseMode.MARKDOWN
     )
     
-    # Start tagall session
-    await tagall_system.start_tagall_session(client, message, base_message, members)
+    # Start tagall session (member di-stream, tidak dikumpulkan dulu)
+    await tagall_system.start_tagall_session(client, message, base_message)
     
     # Clean up collection message
     await collection_msg.delete()
@@ -10,7 +10,7 @@ import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from pyrogram.types import Message
-from pyrogram.enums import ParseMode
+from pyrogram.enums import ParseMode, ChatType
 from pyrogram.errors import MessageNotModified, FloodWait
 from pyrogram.raw import functions, types
 
@@ -18,15 +18,16 @@ from pyrogram.raw import functions, types
 from helper_client import VzoelClient, is_user_mode, get_client_type
 from helper_cmd_handler import CMD_HANDLER, get_command, get_arguments
 from helper_logger import LOGGER
+from helpers.session_table import SessionRecord, session_table
 from utils.assets import vzoel_assets, premium_emoji, bold, italic, monospace, emoji, vzoel_signature
 
+GROUP_CHAT_TYPES = (ChatType.GROUP, ChatType.SUPERGROUP)
+
 class PremiumVoiceChatSystem:
     """Premium Voice Chat System dengan duration monitoring"""
     
     def __init__(self):
-        # VC monitoring sessions
-        self.active_vc_sessions = {}
-        self.vc_start_times = {}
+        # VC monitoring sessions ada di session_table (kind "vc", key chat_id)
         
         # Duration update interval (30 seconds)
         self.update_interval = 30.0
@@ -166,24 +167,22 @@ class PremiumVoiceChatSystem:
         
         return "\n".join(status_lines)
     
-    async def start_vc_monitoring(self, client: VzoelClient, chat_id: int, 
-                                status_message: Message) -> None:
+    def open_vc_session(self, chat_id: int, status_message: Message, chat_title: str) -> SessionRecord:
+        """Daftarkan monitor: cukup chat_id, message_id dan judul chat"""
+        return session_table.open(
+            "vc", chat_id, status_message.chat.id, status_message.id, chat_title or "Unknown Chat"
+        )
+    
+    async def start_vc_monitoring(self, client: VzoelClient, record: SessionRecord) -> None:
         """Start VC duration monitoring"""
         
-        session_id = f"vc_monitor_{chat_id}"
-        self.active_vc_sessions[session_id] = True
-        self.vc_start_times[session_id] = time.time()
+        chat_title = record.data
         
         try:
-            # Get chat info
-            chat = await client.get_chat(chat_id)
-            chat_title = chat.title or "Unknown Chat"
-            
-            while self.active_vc_sessions.get(session_id, False):
+            while record.active:
                 
                 # Calculate duration
-                current_time = time.time()
-                duration = int(current_time - self.vc_start_times[session_id])
+                duration = int(record.age)
                 
                 # Update status message
                 updated_message = self.create_vc_status_message(
@@ -191,12 +190,7 @@ class PremiumVoiceChatSystem:
                 )
                 
                 try:
-                    await status_message.edit_text(
-                        updated_message,
-                        parse_mode=ParseMode.MARKDOWN
-                    )
-                except MessageNotModified:
-                    pass
+                    await record.edit(client, updated_message, parse_mode=ParseMode.MARKDOWN)
                 except Exception as e:
                     LOGGER.warning(f"Error updating VC status: {e}")
                 
@@ -207,20 +201,11 @@ class PremiumVoiceChatSystem:
             LOGGER.error(f"Error in VC monitoring: {e}")
         finally:
             # Cleanup session
-            if session_id in self.active_vc_sessions:
-                del self.active_vc_sessions[session_id]
-            if session_id in self.vc_start_times:
-                del self.vc_start_times[session_id]
+            session_table.close(record)
     
     def stop_vc_monitoring(self, chat_id: int) -> bool:
         """Stop VC monitoring untuk specific chat"""
-        session_id = f"vc_monitor_{chat_id}"
-        
-        if session_id in self.active_vc_sessions:
-            self.active_vc_sessions[session_id] = False
-            return True
-        
-        return False
+        return session_table.stop("vc", chat_id)
 
 # Initialize premium VC system
 vc_system = PremiumVoiceChatSystem()
@@ -247,7 +232,7 @@ async def joinvc_handler(client: VzoelClient, message: Message):
     """
     
     # Check if in group
-    if message.chat.type not in ["group", "supergroup"]:
+    if message.chat.type not in GROUP_CHAT_TYPES:
         await message.reply_text(
             f"{emoji('merah')} {bold('Group Only!')}\\n\\n"
             f"{emoji('kuning')} Voice chat commands only work in groups.",
@@ -276,9 +261,8 @@ async def joinvc_handler(client: VzoelClient, message: Message):
         )
         
         # Start monitoring
-        asyncio.create_task(
-            vc_system.start_vc_monitoring(client, message.chat.id, joining_msg)
-        )
+        record = vc_system.open_vc_session(message.chat.id, joining_msg, message.chat.title)
+        asyncio.create_task(vc_system.start_vc_monitoring(client, record))
         
         LOGGER.info(f"Joined VC in chat {message.chat.id}")
         
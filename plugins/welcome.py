@@ -5,27 +5,64 @@ Advanced welcome and leave message management with premium emoji mapping
 Created by: VZLfxs @Lutpan
 """
 
-import json
+import asyncio
+import glob
 import os
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, List, Set, Tuple
 from pyrogram.types import Message, ChatMemberUpdated
-from pyrogram.enums import ParseMode, ChatMemberStatus
+from pyrogram.enums import ParseMode, ChatMemberStatus, ChatType
 from pyrogram.errors import MessageNotModified
 
 # Import sistem terintegrasi premium
 from helper_client import VzoelClient, is_user_mode, get_client_type
 from helper_cmd_handler import CMD_HANDLER, get_command, get_arguments
 from helper_logger import LOGGER
+from helpers.chat_store import chat_store
+from helpers.file_id_cache import STALE_FILE_ID_ERRORS, file_id_cache
+from helpers.image_cache import image_cache
+from helpers.logo_helper import LogoHelper
 from utils.assets import vzoel_assets, premium_emoji, bold, italic, monospace, emoji, vzoel_signature
 
+# Welcome card butuh PIL; tanpa PIL tetap kirim text
+try:
+    from helpers.image_ops import render_welcome_card, run_image_op
+    CARD_AVAILABLE = True
+except ImportError:
+    CARD_AVAILABLE = False
+
+# Namespace di chat store: welcome/leave per chat = satu row per pesan
+WELCOME_NS = "welcome"
+SETTINGS_NS = "welcome_settings"
+WELCOME_KEY = "welcome_message"
+LEAVE_KEY = "leave_message"
+CARD_KEY = "card"
+# file_id welcome card per chat (bukan di file_ids.json global: card unik per user,
+# jadi tiap join menambah entry); per chat dibatasi, yang paling lama dibuang
+CARD_IDS_NS = "welcome_card_ids"
+CARD_IDS_PER_CHAT = 200
+
+# Naikkan kalau layout render_welcome_card berubah -> card lama tidak dipakai lagi
+WELCOME_CARD_TEMPLATE_VERSION = 1
+CHAT_PHOTO_DIR = "vzoel/cache/chat_photos"
+# Batas caption foto Telegram; welcome lebih panjang dikirim sebagai text terpisah
+CAPTION_LIMIT = 1024
+
+GROUP_TYPES = (ChatType.GROUP, ChatType.SUPERGROUP)
+
+# Join/leave storm: event per chat digabung dalam window adaptif
+MEMBER_EVENT_MIN_WINDOW = 1.0    # detik, chat tenang
+MEMBER_EVENT_MAX_WINDOW = 30.0   # detik, saat raid / mass import
+MEMBER_EVENT_MAX_MENTIONS = 5    # sisanya jadi "+K more"
+
 class PremiumWelcomeSystem:
     """Premium Welcome/Leave System dengan custom message management"""
     
     def __init__(self):
+        # File lama, dimigrasi sekali ke chat store (SQLite) saat pertama dipakai
         self.welcome_file = "welcome_data.json"
-        
-        # Load existing welcome data
-        self.welcome_data = self.load_welcome_data()
+        self._ready = False
+        self._ready_lock = asyncio.Lock()
         
         # Premium emoji hanya dari mapping
         self.welcome_emoji = {
@@ -46,67 +83,76 @@ class PremiumWelcomeSystem:
         # Default leave message template  
         self.default_leave = f"{self.welcome_emoji['leave']} {bold('{user_name} has left the group')}\\n\\n{emoji('kuning')} Goodbye and take care!"
     
-    def load_welcome_data(self) -> Dict:
-        """Load welcome data dari file"""
-        try:
-            if os.path.exists(self.welcome_file):
-                with open(self.welcome_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return {"welcome_messages": {}, "leave_messages": {}, "settings": {}}
-        except Exception as e:
-            LOGGER.error(f"Error loading welcome data: {e}")
-            return {"welcome_messages": {}, "leave_messages": {}, "settings": {}}
-    
-    def save_welcome_data(self) -> bool:
-        """Save welcome data ke file"""
-        try:
-            with open(self.welcome_file, 'w', encoding='utf-8') as f:
-                json.dump(self.welcome_data, f, indent=2, ensure_ascii=False)
-            return True
-        except Exception as e:
-            LOGGER.error(f"Error saving welcome data: {e}")
-            return False
-    
-    def set_welcome_message(self, chat_id: int, message: str) -> bool:
+    async def ensure_ready(self) -> None:
+        """Migrasi satu kali dari welcome_data.json ke chat store"""
+        if self._ready:
+            return
+        async with self._ready_lock:
+            if not self._ready:
+                await chat_store.migrate_json("welcome", self.welcome_file, self._convert_legacy)
+                self._ready = True
+    
+    @staticmethod
+    def _convert_legacy(data: Dict):
+        """welcome_data.json lama -> row (namespace, chat_id, key, value)"""
+        for chat_key, message in data.get("welcome_messages", {}).items():
+            yield WELCOME_NS, chat_key, WELCOME_KEY, message
+        for chat_key, message in data.get("leave_messages", {}).items():
+            yield WELCOME_NS, chat_key, LEAVE_KEY, message
+        for chat_key, settings in data.get("settings", {}).items():
+            if isinstance(settings, dict):
+                for key, value in settings.items():
+                    yield SETTINGS_NS, chat_key, key, value
+    
+    async def set_welcome_message(self, chat_id: int, message: str) -> bool:
         """Set custom welcome message untuk chat"""
-        chat_key = str(chat_id)
-        self.welcome_data["welcome_messages"][chat_key] = message
-        return self.save_welcome_data()
+        await self.ensure_ready()
+        await chat_store.set(WELCOME_NS, chat_id, WELCOME_KEY, message)
+        return True
     
-    def set_leave_message(self, chat_id: int, message: str) -> bool:
+    async def set_leave_message(self, chat_id: int, message: str) -> bool:
         """Set custom leave message untuk chat"""
-        chat_key = str(chat_id)
-        self.welcome_data["leave_messages"][chat_key] = message
-        return self.save_welcome_data()
+        await self.ensure_ready()
+        await chat_store.set(WELCOME_NS, chat_id, LEAVE_KEY, message)
+        return True
     
-    def get_welcome_message(self, chat_id: int) -> str:
+    async def get_welcome_message(self, chat_id: int) -> str:
         """Get welcome message untuk chat"""
-        chat_key = str(chat_id)
-        return self.welcome_data["welcome_messages"].get(chat_key, self.default_welcome)
+        await self.ensure_ready()
+        return await chat_store.get(WELCOME_NS, chat_id, WELCOME_KEY, self.default_welcome)
     
-    def get_leave_message(self, chat_id: int) -> str:
+    async def get_leave_message(self, chat_id: int) -> str:
         """Get leave message untuk chat"""
-        chat_key = str(chat_id)
-        return self.welcome_data["leave_messages"].get(chat_key, self.default_leave)
+        await self.ensure_ready()
+        return await chat_store.get(WELCOME_NS, chat_id, LEAVE_KEY, self.default_leave)
+    
+    async def has_custom_messages(self, chat_id: int) -> Dict[str, bool]:
+        """Cek apakah chat punya welcome/leave custom"""
+        await self.ensure_ready()
+        messages = await chat_store.get_chat(WELCOME_NS, chat_id)
+        return {"welcome": WELCOME_KEY in messages, "leave": LEAVE_KEY in messages}
+    
+    async def card_enabled(self, chat_id: int) -> bool:
+        """Welcome card (gambar) aktif untuk chat ini?"""
+        await self.ensure_ready()
+        return bool(await chat_store.get(SETTINGS_NS, chat_id, CARD_KEY, False))
     
-    def remove_welcome_message(self, chat_id: int) -> bool:
+    async def set_card_enabled(self, chat_id: int, enabled: bool) -> None:
+        await self.ensure_ready()
+        await chat_store.set(SETTINGS_NS, chat_id, CARD_KEY, enabled)
+    
+    async def remove_welcome_message(self, chat_id: int) -> bool:
         """Remove custom welcome message (reset to default)"""
-        chat_key = str(chat_id)
-        if chat_key in self.welcome_data["welcome_messages"]:
-            del self.welcome_data["welcome_messages"][chat_key]
-            return self.save_welcome_data()
-        return False
+        await self.ensure_ready()
+        return await chat_store.delete(WELCOME_NS, chat_id, WELCOME_KEY)
     
-    def remove_leave_message(self, chat_id: int) -> bool:
+    async def remove_leave_message(self, chat_id: int) -> bool:
         """Remove custom leave message (reset to default)"""
-        chat_key = str(chat_id)
-        if chat_key in self.welcome_data["leave_messages"]:
-            del self.welcome_data["leave_messages"][chat_key]
-            return self.save_welcome_data()
-        return False
+        await self.ensure_ready()
+        return await chat_store.delete(WELCOME_NS, chat_id, LEAVE_KEY)
     
     def format_welcome_message(self, message_template: str, user_name: str, 
-                             user_mention: str, user_id: int) -> str:
+                             user_mention: str, user_id) -> str:
         """Format welcome message dengan placeholders"""
         try:
             formatted_message = message_template
@@ -129,8 +175,101 @@ class PremiumWelcomeSystem:
             LOGGER.error(f"Error checking admin permissions: {e}")
             return False
 
+class _PendingMembers:
+    """Join/leave yang belum dikirim untuk satu (chat, kind)"""
+    
+    __slots__ = ("client", "chat", "users", "seen", "extra")
+    
+    def __init__(self, client: VzoelClient, chat):
+        self.client = client
+        self.chat = chat
+        self.users: List[Any] = []
+        self.seen: Set[int] = set()
+        self.extra = 0
+
+class MemberEventCoalescer:
+    """
+    Gabung join/leave per chat supaya raid 500 member tidak jadi 500 pesan:
+    - Event pertama membuka window; semua event dalam window = satu pesan
+      (maks `max_mentions` user disebut, sisanya "+K more")
+    - Window adaptif: flush berisi >1 user -> window x2 (maks `max_window`),
+      flush satu user -> window /2 sampai kembali `min_window`
+    - Per chat paling banyak satu pesan per kind per window
+    """
+    
+    def __init__(self, min_window: float = MEMBER_EVENT_MIN_WINDOW,
+                 max_window: float = MEMBER_EVENT_MAX_WINDOW,
+                 max_mentions: int = MEMBER_EVENT_MAX_MENTIONS):
+        self.min_window = min_window
+        self.max_window = max_window
+        self.max_mentions = max_mentions
+        self._pending: Dict[Tuple[int, str], _PendingMembers] = {}
+        # Hanya chat yang window-nya sedang membesar yang disimpan
+        self._windows: Dict[Tuple[int, str], float] = {}
+        # Referensi task flush yang sedang jalan (event loop hanya simpan weakref)
+        self._tasks: Set[asyncio.Task] = set()
+    
+    def window(self, chat_id: int, kind: str) -> float:
+        return self._windows.get((chat_id, kind), self.min_window)
+    
+    def add(self, client: VzoelClient, chat, user, kind: str) -> None:
+        """Queue satu join/leave; flush dijadwalkan saat window dibuka"""
+        key = (chat.id, kind)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _PendingMembers(client, chat)
+            loop = asyncio.get_running_loop()
+            loop.call_later(self.window(*key), self._start_flush, key)
+        
+        if user.id in pending.seen:
+            return
+        pending.seen.add(user.id)
+        if len(pending.users) < self.max_mentions:
+            pending.users.append(user)
+        else:
+            pending.extra += 1
+    
+    def _start_flush(self, key: Tuple[int, str]) -> None:
+        task = asyncio.get_running_loop().create_task(self._flush(key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    def _adapt(self, key: Tuple[int, str], count: int) -> None:
+        window = self._windows.get(key, self.min_window)
+        if count > 1:
+            self._windows[key] = min(self.max_window, window * 2)
+        elif window / 2 > self.min_window:
+            self._windows[key] = window / 2
+        else:
+            self._windows.pop(key, None)
+    
+    async def _flush(self, key: Tuple[int, str]) -> None:
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        self._adapt(key, len(pending.seen))
+        
+        kind = key[1]
+        if kind == "welcome":
+            await send_welcome_message(pending.client, pending.chat, pending.users, pending.extra)
+        else:
+            await send_leave_message(pending.client, pending.chat, pending.users, pending.extra)
+
+def format_members(users: List[Any], extra: int, mention: bool) -> Tuple[str, str, str]:
+    """(user_name, user_mention, user_id) untuk satu atau banyak member"""
+    names = [user.first_name or "User" for user in users]
+    mentions = [f"[{name}](tg://user?id={user.id})" for name, user in zip(names, users)] if mention else names
+    more = f" +{extra} more" if extra else ""
+    return (
+        ", ".join(names) + more,
+        ", ".join(mentions) + more,
+        ", ".join(str(user.id) for user in users)
+    )
+
 # Initialize premium welcome system
 welcome_system = PremiumWelcomeSystem()
+logo_helper = LogoHelper()
+member_events = MemberEventCoalescer()
 
 @VzoelClient.on_message(CMD_HANDLER)
 async def welcome_router(client: VzoelClient, message: Message):
@@ -147,13 +286,15 @@ async def welcome_router(client: VzoelClient, message: Message):
         await rmwelcome_handler(client, message)
     elif command == "rmleave":
         await rmleave_handler(client, message)
+    elif command == "welcomecard":
+        await welcomecard_handler(client, message)
 
 @VzoelClient.on_chat_member_updated()
 async def handle_member_updates(client: VzoelClient, update: ChatMemberUpdated):
     """Handle member join/leave events"""
     
     # Skip if not in group or supergroup
-    if update.chat.type not in ["group", "supergroup"]:
+    if update.chat.type not in GROUP_TYPES:
         return
     
     # Skip if no user info
@@ -173,59 +314,157 @@ async def handle_member_updates(client: VzoelClient, update: ChatMemberUpdated):
         if (old_status in [None, ChatMemberStatus.LEFT, ChatMemberStatus.BANNED] and
             new_status in [ChatMemberStatus.MEMBER, ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER]):
             
-            # Send welcome message
-            await send_welcome_message(client, update.chat, user)
+            # Queue welcome (digabung kalau banyak yang join bersamaan)
+            member_events.add(client, update.chat, user, "welcome")
             
         # User left (was member/admin, now left/banned)
         elif (old_status in [ChatMemberStatus.MEMBER, ChatMemberStatus.ADMINISTRATOR] and
               new_status in [ChatMemberStatus.LEFT, ChatMemberStatus.BANNED]):
             
-            # Send leave message
-            await send_leave_message(client, update.chat, user)
+            # Queue leave message
+            member_events.add(client, update.chat, user, "leave")
             
     except Exception as e:
         LOGGER.error(f"Error handling member update: {e}")
 
-async def send_welcome_message(client: VzoelClient, chat, user):
-    """Send welcome message untuk new member"""
+async def group_logo_path(client: VzoelClient, chat) -> Optional[str]:
+    """Foto grup (download sekali per foto), fallback logo vzoel"""
+    photo = getattr(chat, "photo", None)
+    if photo is None:
+        return logo_helper.get_logo_path()
+    
+    path = os.path.join(CHAT_PHOTO_DIR, f"{chat.id}_{photo.big_photo_unique_id}.jpg")
+    if not os.path.exists(path):
+        # Foto grup lama tidak dipakai lagi
+        for stale in glob.glob(os.path.join(CHAT_PHOTO_DIR, f"{chat.id}_*.jpg")):
+            os.remove(stale)
+        try:
+            os.makedirs(CHAT_PHOTO_DIR, exist_ok=True)
+            await client.download_media(photo.big_file_id, file_name=path)
+        except Exception as e:
+            LOGGER.warning(f"Gagal download foto grup {chat.id}: {e}")
+            return logo_helper.get_logo_path()
+    return path
+
+async def build_welcome_card(client: VzoelClient, chat, user) -> Optional[str]:
+    """
+    Welcome card per (chat, user, template version) dari image cache;
+    render di process pool hanya kalau belum ada (member count diambil saat render).
+    Entry cache di-pin: caller wajib image_cache.unpin(path) setelah selesai kirim
+    """
+    user_name = " ".join(filter(None, [user.first_name, user.last_name])) or "User"
+    logo_path = await group_logo_path(client, chat)
+    params = {"chat": chat.id, "user": user.id, "name": user_name,
+              "title": chat.title or "", "template": WELCOME_CARD_TEMPLATE_VERSION}
+    
+    loop = asyncio.get_running_loop()
+    key = await loop.run_in_executor(None, image_cache.key, logo_path, "welcome_card", params)
+    cached = image_cache.get(key, ".jpg", pin=True) if key else None
+    if cached:
+        return cached
+    
+    try:
+        member_count = await client.get_chat_members_count(chat.id)
+    except Exception:
+        member_count = None
+    
+    temp_path = image_cache.temp_path(".jpg")
+    try:
+        await run_image_op(render_welcome_card, logo_path, temp_path, user_name,
+                           chat.title or "", member_count)
+    except BaseException:
+        image_cache.discard(temp_path)
+        raise
+    return image_cache.commit(key, ".jpg", temp_path, pin=True) if key else temp_path
+
+async def send_card_photo(client: VzoelClient, chat_id: int, user_id: int, card_path: str, **kwargs) -> Message:
+    """
+    Kirim welcome card; user yang rejoin (card sama) dikirim lewat file_id tersimpan.
+    Satu row chat store per (akun, user), tanpa rewrite file JSON global per join
+    """
+    key = f"{file_id_cache.account(client)}:{user_id}"
+    card = os.path.basename(card_path)
+    entry = await chat_store.get(CARD_IDS_NS, chat_id, key)
+    if entry and entry.get("card") == card:
+        try:
+            return await client.send_photo(chat_id=chat_id, photo=entry["file_id"], **kwargs)
+        except STALE_FILE_ID_ERRORS:
+            pass
+    
+    sent = await client.send_photo(chat_id=chat_id, photo=card_path, **kwargs)
+    if sent and sent.photo:
+        cards = await chat_store.get_chat(CARD_IDS_NS, chat_id)
+        if key not in cards and len(cards) >= CARD_IDS_PER_CHAT:
+            oldest = min(cards, key=lambda k: cards[k].get("at", 0))
+            await chat_store.delete(CARD_IDS_NS, chat_id, oldest)
+        await chat_store.set(CARD_IDS_NS, chat_id, key,
+                             {"card": card, "file_id": sent.photo.file_id, "at": int(time.time())})
+    return sent
+
+async def send_welcome_card(client: VzoelClient, chat, user, text: str) -> bool:
+    """Kirim welcome card + text sebagai caption; False kalau harus fallback ke text"""
+    if not CARD_AVAILABLE or not await welcome_system.card_enabled(chat.id):
+        return False
+    
+    try:
+        card_path = await build_welcome_card(client, chat, user)
+        fits = len(text) <= CAPTION_LIMIT
+        # Upload sekali, user yang rejoin dapat file_id tersimpan
+        try:
+            await send_card_photo(
+                client, chat.id, user.id, card_path,
+                caption=text if fits else None,
+                parse_mode=ParseMode.MARKDOWN
+            )
+        finally:
+            image_cache.unpin(card_path)
+        if not fits:
+            await client.send_message(chat_id=chat.id, text=text, parse_mode=ParseMode.MARKDOWN)
+        return True
+    except Exception as e:
+        LOGGER.error(f"Error sending welcome card: {e}")
+        return False
+
+async def send_welcome_message(client: VzoelClient, chat, users: List[Any], extra: int = 0):
+    """Send satu welcome message untuk satu atau sekelompok member baru"""
     try:
         # Get welcome message template
-        welcome_template = welcome_system.get_welcome_message(chat.id)
+        welcome_template = await welcome_system.get_welcome_message(chat.id)
         
-        # Create user mention
-        user_name = user.first_name or "User"
-        user_mention = f"[{user_name}](tg://user?id={user.id})"
+        # Create user mention(s)
+        user_name, user_mention, user_id = format_members(users, extra, mention=True)
         
         # Format message
         formatted_message = welcome_system.format_welcome_message(
-            welcome_template, user_name, user_mention, user.id
+            welcome_template, user_name, user_mention, user_id
         )
         
-        # Send welcome message
-        await client.send_message(
-            chat_id=chat.id,
-            text=formatted_message,
-            parse_mode=ParseMode.MARKDOWN
-        )
+        # Welcome card hanya untuk satu member; grup join cukup satu text
+        single = len(users) == 1 and not extra
+        if not single or not await send_welcome_card(client, chat, users[0], formatted_message):
+            await client.send_message(
+                chat_id=chat.id,
+                text=formatted_message,
+                parse_mode=ParseMode.MARKDOWN
+            )
         
-        LOGGER.info(f"Sent welcome message for {user.id} in {chat.id}")
+        LOGGER.info(f"Sent welcome message for {len(users) + extra} member(s) in {chat.id}")
         
     except Exception as e:
         LOGGER.error(f"Error sending welcome message: {e}")
 
-async def send_leave_message(client: VzoelClient, chat, user):
-    """Send leave message untuk member yang keluar"""
+async def send_leave_message(client: VzoelClient, chat, users: List[Any], extra: int = 0):
+    """Send satu leave message untuk satu atau sekelompok member yang keluar"""
     try:
         # Get leave message template
-        leave_template = welcome_system.get_leave_message(chat.id)
+        leave_template = await welcome_system.get_leave_message(chat.id)
         
         # Create user info (no mention for left users)
-        user_name = user.first_name or "User"
-        user_mention = user_name  # Plain name for left users
+        user_name, user_mention, user_id = format_members(users, extra, mention=False)
         
         # Format message
         formatted_message = welcome_system.format_welcome_message(
-            leave_template, user_name, user_mention, user.id
+            leave_template, user_name, user_mention, user_id
         )
         
         # Send leave message
@@ -235,7 +474,7 @@ async def send_leave_message(client: VzoelClient, chat, user):
             parse_mode=ParseMode.MARKDOWN
         )
         
-        LOGGER.info(f"Sent leave message for {user.id} in {chat.id}")
+        LOGGER.info(f"Sent leave message for {len(users) + extra} member(s) in {chat.id}")
         
     except Exception as e:
         LOGGER.error(f"Error sending leave message: {e}")
@@ -248,7 +487,7 @@ async def setwelcome_handler(client: VzoelClient, message: Message):
     """
     
     # Check if in group
-    if message.chat.type not in ["group", "supergroup"]:
+    if message.chat.type not in GROUP_TYPES:
         await message.reply_text(
             f"{welcome_system.welcome_emoji['error']} {bold('Group Only!')}\\n\\n"
             f"{emoji('kuning')} Welcome commands only work in groups.",
@@ -306,7 +545,7 @@ async def setwelcome_handler(client: VzoelClient, message: Message):
         return
     
     # Set welcome message
-    success = welcome_system.set_welcome_message(message.chat.id, welcome_text)
+    success = await welcome_system.set_welcome_message(message.chat.id, welcome_text)
     
     if success:
         # Preview dengan dummy user
@@ -393,7 +632,7 @@ async def setleave_handler(client: VzoelClient, message: Message):
         return
     
     # Set leave message
-    success = welcome_system.set_leave_message(message.chat.id, leave_text)
+    success = await welcome_system.set_leave_message(message.chat.id, leave_text)
     
     if success:
         # Preview dengan dummy user
@@ -429,21 +668,24 @@ async def setleave_handler(client: VzoelClient, message: Message):
 async def welcome_info_handler(client: VzoelClient, message: Message):
     """Show current welcome and leave message settings"""
     
-    chat_key = str(message.chat.id)
-    has_custom_welcome = chat_key in welcome_system.welcome_data["welcome_messages"]
-    has_custom_leave = chat_key in welcome_system.welcome_data["leave_messages"]
+    custom = await welcome_system.has_custom_messages(message.chat.id)
+    has_custom_welcome = custom["welcome"]
+    has_custom_leave = custom["leave"]
+    card_on = await welcome_system.card_enabled(message.chat.id)
     
     info_lines = [
         f"{welcome_system.welcome_emoji['list']} {bold('WELCOME SETTINGS')}",
         "",
         f"{welcome_system.welcome_emoji['welcome']} **Welcome:** {'Custom' if has_custom_welcome else 'Default'}",
         f"{welcome_system.welcome_emoji['leave']} **Leave:** {'Custom' if has_custom_leave else 'Default'}",
+        f"{welcome_system.welcome_emoji['greeting']} **Card:** {'On' if card_on else 'Off'}",
         "",
         f"{emoji('utama')} **Commands:**",
         f"  • {monospace('.setwelcome message')} - Set welcome",
         f"  • {monospace('.setleave message')} - Set leave",
         f"  • {monospace('.rmwelcome')} - Reset welcome",
         f"  • {monospace('.rmleave')} - Reset leave",
+        f"  • {monospace('.welcomecard on/off')} - Welcome card gambar",
         "",
         f"{italic('Premium Welcome by Vzoel VZLfxs @Lutpan')}"
     ]
@@ -457,7 +699,7 @@ async def rmwelcome_handler(client: VzoelClient, message: Message):
     """Remove custom welcome message (reset to default)"""
     
     if await welcome_system.check_admin_permissions(client, message.chat.id, message.from_user.id):
-        if welcome_system.remove_welcome_message(message.chat.id):
+        if await welcome_system.remove_welcome_message(message.chat.id):
             await message.reply_text(
                 f"{welcome_system.welcome_emoji['remove']} {bold('Welcome Reset!')}\\n\\n"
                 f"{emoji('centang')} Using default welcome message now.",
@@ -478,7 +720,7 @@ async def rmleave_handler(client: VzoelClient, message: Message):
     """Remove custom leave message (reset to default)"""
     
     if await welcome_system.check_admin_permissions(client, message.chat.id, message.from_user.id):
-        if welcome_system.remove_leave_message(message.chat.id):
+        if await welcome_system.remove_leave_message(message.chat.id):
             await message.reply_text(
                 f"{welcome_system.welcome_emoji['remove']} {bold('Leave Message Reset!')}\\n\\n"
                 f"{emoji('centang')} Using default leave message now.",
@@ -495,5 +737,51 @@ async def rmleave_handler(client: VzoelClient, message: Message):
             parse_mode=ParseMode.MARKDOWN
         )
 
+async def welcomecard_handler(client: VzoelClient, message: Message):
+    """
+    Aktifkan / matikan welcome card gambar (logo grup, nama user, nomor member)
+    Usage: .welcomecard on|off
+    Requires: Admin privileges
+    """
+    
+    if message.chat.type not in GROUP_TYPES:
+        await message.reply_text(
+            f"{welcome_system.welcome_emoji['error']} {bold('Group Only!')}",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+    
+    if not await welcome_system.check_admin_permissions(client, message.chat.id, message.from_user.id):
+        await message.reply_text(
+            f"{welcome_system.welcome_emoji['error']} {bold('Admin Required!')}",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+    
+    state = get_arguments(message).strip().lower()
+    if state not in ("on", "off"):
+        card_on = await welcome_system.card_enabled(message.chat.id)
+        await message.reply_text(
+            f"{welcome_system.welcome_emoji['list']} {bold('WELCOME CARD')}\n\n"
+            f"{emoji('centang')} **Status:** {'On' if card_on else 'Off'}\n"
+            f"{emoji('utama')} **Usage:** {monospace('.welcomecard on')} / {monospace('.welcomecard off')}",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+    
+    if state == "on" and not CARD_AVAILABLE:
+        await message.reply_text(
+            f"{welcome_system.welcome_emoji['error']} {bold('PIL not available!')}\n\n"
+            f"{emoji('kuning')} Install Pillow untuk welcome card.",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+    
+    await welcome_system.set_card_enabled(message.chat.id, state == "on")
+    await message.reply_text(
+        f"{welcome_system.welcome_emoji['set']} {bold(f'Welcome Card {state.upper()}!')}",
+        parse_mode=ParseMode.MARKDOWN
+    )
+
 # Register plugin info
 LOGGER.info(f"{emoji('centang')} Premium Welcome/Leave System initialized")
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""
+Pytest setup: root repo di sys.path supaya `helpers`, `plugins`, `utils` bisa di-import
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
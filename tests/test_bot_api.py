@@ -0,0 +1,150 @@
+"""
+BotApiClient terhadap stand-in Bot API server lokal (aiohttp)
+"""
+
+import asyncio
+import socket
+from collections import Counter
+
+from aiohttp import web
+
+from helpers.bot_api import BotApiClient
+
+
+class StandInBotApi:
+    """getMe palsu: perilaku ditentukan prefix token"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.runner = None
+        self.base_url = None
+
+    async def get_me(self, request: web.Request) -> web.Response:
+        token = request.match_info["token"]
+        self.calls[token] += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            if token.startswith("ok"):
+                return web.json_response({"ok": True, "result": {
+                    "id": len(token), "username": f"{token}_bot", "first_name": token}})
+            if token.startswith("bad"):
+                return web.json_response({"ok": False, "error_code": 401,
+                                          "description": "Unauthorized"}, status=401)
+            if token.startswith("limited"):
+                return web.json_response({"ok": False, "error_code": 429,
+                                          "description": "Too Many Requests"}, status=429)
+            return web.json_response({"ok": False, "error_code": 502,
+                                      "description": "Bad Gateway"}, status=502)
+        finally:
+            self.in_flight -= 1
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_get("/bot{token}/getMe", self.get_me)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.runner.cleanup()
+
+
+def _unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_concurrency_is_bounded():
+    async def scenario():
+        async with StandInBotApi(delay=0.05) as server:
+            client = BotApiClient(server.base_url, concurrency=3)
+            try:
+                results = await client.validate_many([f"ok{i}" for i in range(12)])
+            finally:
+                await client.close()
+        assert all(result["valid"] for result in results.values())
+        assert len(results) == 12
+        assert server.max_in_flight == 3
+
+    asyncio.run(scenario())
+
+
+def test_valid_result_cached_until_ttl():
+    async def scenario():
+        async with StandInBotApi() as server:
+            client = BotApiClient(server.base_url, cache_ttl=0.2)
+            try:
+                first = await client.get_me("ok-token")
+                second = await client.get_me("ok-token")
+                assert server.calls["ok-token"] == 1
+                assert first == second == {"valid": True, "bot_id": 8,
+                                           "bot_username": "ok-token_bot", "bot_name": "ok-token"}
+                await asyncio.sleep(0.25)
+                await client.get_me("ok-token")
+                assert server.calls["ok-token"] == 2
+            finally:
+                await client.close()
+
+    asyncio.run(scenario())
+
+
+def test_rejected_token_is_cached():
+    async def scenario():
+        async with StandInBotApi() as server:
+            client = BotApiClient(server.base_url)
+            try:
+                first = await client.get_me("bad-token")
+                second = await client.get_me("bad-token")
+            finally:
+                await client.close()
+        assert first == second
+        assert first["valid"] is False and first["error_code"] == 401
+        assert server.calls["bad-token"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_server_errors_and_rate_limits_not_cached():
+    async def scenario():
+        async with StandInBotApi() as server:
+            client = BotApiClient(server.base_url)
+            try:
+                for token in ("down-token", "limited-token"):
+                    for _ in range(2):
+                        result = await client.get_me(token)
+                        assert result["valid"] is False
+            finally:
+                await client.close()
+        assert server.calls["down-token"] == 2
+        assert server.calls["limited-token"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_network_error_not_cached():
+    async def scenario():
+        client = BotApiClient(f"http://127.0.0.1:{_unused_port()}", timeout=2)
+        try:
+            result = await client.get_me("ok-token")
+            assert result["valid"] is False and result["error"]
+            assert client._cache.get("ok-token") is None
+
+            # Server hidup lagi -> token langsung divalidasi ulang
+            async with StandInBotApi() as server:
+                client.base_url = server.base_url
+                assert (await client.get_me("ok-token"))["valid"] is True
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
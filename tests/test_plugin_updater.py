@@ -0,0 +1,212 @@
+"""
+PluginUpdater terhadap stand-in GitHub API lokal (aiohttp)
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+
+import pytest
+from aiohttp import web
+
+from plugins.plugin_updater import PluginUpdater, git_blob_sha1
+
+REMOTE_PLUGINS = {
+    "alpha.py": b"print('alpha v2')\n",
+    "beta.py": b"print('beta v2')\n",
+    "gamma.py": b"print('gamma v1')\n",
+    "delta.py": b"print('delta v1')\n",
+}
+
+
+class StandInGitHub:
+    """commits/main + contents/plugins (dengan ETag) + raw download"""
+
+    def __init__(self, files=REMOTE_PLUGINS, download_delay: float = 0.0):
+        self.files = dict(files)
+        self.download_delay = download_delay
+        self.statuses = []
+        self.downloads = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.runner = None
+        self.base_url = None
+
+    def _listing(self):
+        return [{
+            "type": "file",
+            "name": name,
+            "sha": git_blob_sha1(content),
+            "size": len(content),
+            "download_url": f"{self.base_url}/raw/{name}",
+        } for name, content in self.files.items()]
+
+    async def commits(self, request: web.Request) -> web.Response:
+        return self._conditional(request, {"sha": "0123456789abcdef",
+                                           "commit": {"committer": {"date": "2026-01-01T00:00:00Z"}}})
+
+    async def contents(self, request: web.Request) -> web.Response:
+        return self._conditional(request, self._listing())
+
+    def _conditional(self, request: web.Request, payload) -> web.Response:
+        etag = f'"{git_blob_sha1(json.dumps(payload, sort_keys=True).encode())}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.statuses.append(304)
+            return web.Response(status=304, headers={"ETag": etag})
+        self.statuses.append(200)
+        return web.json_response(payload, headers={"ETag": etag})
+
+    async def raw(self, request: web.Request) -> web.Response:
+        self.downloads += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.download_delay:
+                await asyncio.sleep(self.download_delay)
+            return web.Response(body=self.files[request.match_info["name"]])
+        finally:
+            self.in_flight -= 1
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_get("/commits/main", self.commits)
+        app.router.add_get("/contents/plugins", self.contents)
+        app.router.add_get("/raw/{name}", self.raw)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.runner.cleanup()
+
+
+def _make_updater(tmp_path, base_url="http://127.0.0.1:9", **kwargs) -> PluginUpdater:
+    plugins_dir = tmp_path / "plugins"
+    plugins_dir.mkdir(exist_ok=True)
+    return PluginUpdater(base_url, plugins_dir=str(plugins_dir), backup_dir=str(tmp_path / "backup"),
+                         manifest_path=str(tmp_path / "vzoel" / "plugin_hashes.json"), **kwargs)
+
+
+@pytest.mark.parametrize("content", [b"", b"hello\n", "print('halo dunia')\n".encode() * 500, bytes(range(256))])
+def test_git_blob_sha1_matches_git_hash_object(content):
+    expected = subprocess.run(["git", "hash-object", "--stdin"], input=content,
+                              capture_output=True, check=True).stdout.decode().strip()
+    assert git_blob_sha1(content) == expected
+
+
+def test_local_hash_reused_while_mtime_and_size_unchanged(tmp_path):
+    updater = _make_updater(tmp_path)
+    plugin = tmp_path / "plugins" / "alpha.py"
+    plugin.write_bytes(b"print('alpha v1')\n")
+
+    async def scenario():
+        sha = await updater._get_local_file_hash(str(plugin))
+        assert sha == git_blob_sha1(plugin.read_bytes())
+        updater._save_manifest()
+
+        # Updater baru membaca manifest dari disk; hash tidak dihitung ulang
+        reloaded = _make_updater(tmp_path)
+        reloaded._load_manifest()["alpha.py"][2] = "from-manifest"
+        assert await reloaded._get_local_file_hash(str(plugin)) == "from-manifest"
+
+        # File berubah (size + mtime) -> hash dihitung ulang
+        plugin.write_bytes(b"print('alpha v1, diedit')\n")
+        assert await reloaded._get_local_file_hash(str(plugin)) == git_blob_sha1(plugin.read_bytes())
+        assert await reloaded._get_local_file_hash(str(tmp_path / "plugins" / "none.py")) == "new_file"
+
+    asyncio.run(scenario())
+    assert os.path.exists(tmp_path / "vzoel" / "plugin_hashes.json")
+
+
+def test_check_updates_uses_etag_and_304(tmp_path):
+    (tmp_path / "plugins").mkdir()
+    (tmp_path / "plugins" / "gamma.py").write_bytes(REMOTE_PLUGINS["gamma.py"])
+    (tmp_path / "plugins" / "alpha.py").write_bytes(b"print('alpha v1')\n")
+
+    async def scenario():
+        async with StandInGitHub() as server:
+            updater = _make_updater(tmp_path, server.base_url)
+            try:
+                first = await updater.check_updates()
+                second = await updater.check_updates()
+            finally:
+                await updater.close()
+        assert server.statuses == [200, 200, 304, 304]
+        assert first == second
+        assert set(first) == {"alpha.py", "beta.py", "delta.py"}
+        assert first["beta.py"]["is_new"] and not first["alpha.py"]["is_new"]
+
+    asyncio.run(scenario())
+
+
+def test_update_all_downloads_in_parallel_with_bound(tmp_path):
+    async def scenario():
+        async with StandInGitHub(download_delay=0.05) as server:
+            updater = _make_updater(tmp_path, server.base_url, download_concurrency=2)
+            try:
+                results = await updater.update_all_plugins()
+            finally:
+                await updater.close()
+        assert server.downloads == len(REMOTE_PLUGINS)
+        assert server.max_in_flight == 2
+        assert all(success for success, _ in results.values())
+        for name, content in REMOTE_PLUGINS.items():
+            assert (tmp_path / "plugins" / name).read_bytes() == content
+
+    asyncio.run(scenario())
+
+
+def test_checksum_mismatch_keeps_local_file(tmp_path):
+    updater = _make_updater(tmp_path)
+    plugin = tmp_path / "plugins" / "alpha.py"
+    plugin.write_bytes(b"print('alpha v1')\n")
+
+    async def scenario():
+        async with StandInGitHub() as server:
+            try:
+                return await updater.download_plugin("alpha.py", f"{server.base_url}/raw/alpha.py", "0" * 40)
+            finally:
+                await updater.close()
+
+    success, message = asyncio.run(scenario())
+    assert not success and "Checksum mismatch" in message
+    assert plugin.read_bytes() == b"print('alpha v1')\n"
+    assert not (tmp_path / "backup").exists()
+
+
+def test_download_write_is_atomic(tmp_path, monkeypatch):
+    updater = _make_updater(tmp_path)
+    plugins_dir = tmp_path / "plugins"
+    plugin = plugins_dir / "alpha.py"
+    plugin.write_bytes(b"print('alpha v1')\n")
+    content = REMOTE_PLUGINS["alpha.py"]
+
+    async def download():
+        async with StandInGitHub() as server:
+            try:
+                return await updater.download_plugin("alpha.py", f"{server.base_url}/raw/alpha.py",
+                                                     git_blob_sha1(content))
+            finally:
+                await updater.close()
+
+    # Rename gagal di tengah jalan -> file lama utuh, temp file dibersihkan
+    def failing_replace(src, dst):
+        raise OSError("disk penuh")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    success, message = asyncio.run(download())
+    assert not success and "disk penuh" in message
+    assert plugin.read_bytes() == b"print('alpha v1')\n"
+    assert sorted(os.listdir(plugins_dir)) == ["alpha.py"]
+
+    monkeypatch.undo()
+    success, _ = asyncio.run(download())
+    assert success
+    assert plugin.read_bytes() == content
+    assert sorted(os.listdir(plugins_dir)) == ["alpha.py"]
+    assert os.listdir(tmp_path / "backup")
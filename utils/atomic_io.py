@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+VZOEL ASSISTANT v2 - Atomic File I/O
+Crash-safe JSON writes (temp file + fsync + rename) dan debounced write-behind
+Created by: VZLfxs @Lutpan
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+def atomic_write_bytes(path: str, data: bytes) -> None:
+    """Write bytes atomically: file lama utuh sampai rename berhasil"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_json(path: str, data: Any, indent: Optional[int] = 2) -> None:
+    """Serialize ke JSON lalu tulis atomik"""
+    payload = json.dumps(data, indent=indent, ensure_ascii=False)
+    atomic_write_bytes(path, payload.encode("utf-8"))
+
+
+class DebouncedJsonWriter:
+    """
+    Write-behind untuk file JSON yang diedit sebagian (mis. config.json):
+    - schedule(key, mutator): mutator(dict) dijalankan saat flush; mutator
+      dengan key sama digabung (yang terakhir menang)
+    - Flush otomatis `delay` detik setelah schedule terakhir
+    - Flush = baca file sekali, jalankan semua mutator, tulis atomik sekali
+    """
+
+    def __init__(self, path: str, delay: float = 2.0, indent: Optional[int] = 2):
+        self.path = path
+        self.delay = delay
+        self.indent = indent
+        self._pending: Dict[str, Callable[[Dict[str, Any]], None]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._lock = asyncio.Lock()
+        # Referensi task flush otomatis (event loop hanya simpan weakref)
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._pending)
+
+    def schedule(self, key: str, mutator: Callable[[Dict[str, Any]], None]) -> None:
+        """Queue mutator dan (re)start debounce timer"""
+        self._pending[key] = mutator
+        loop = asyncio.get_running_loop()
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = loop.call_later(self.delay, self._start_flush)
+
+    def _start_flush(self) -> None:
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush(self) -> bool:
+        """Tulis semua perubahan tertunda sekarang. Return False kalau gagal"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        async with self._lock:
+            if not self._pending:
+                return True
+            pending, self._pending = self._pending, {}
+            try:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self._write, list(pending.values()))
+                return True
+            except Exception as e:
+                logger.error(f"Gagal menulis {self.path}: {e}")
+                # Kembalikan mutator yang belum tersimpan (yang lebih baru tetap menang)
+                for key, mutator in pending.items():
+                    self._pending.setdefault(key, mutator)
+                return False
+
+    def _write(self, mutators) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {}
+        for mutator in mutators:
+            mutator(data)
+        atomic_write_json(self.path, data, indent=self.indent)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+VZOEL ASSISTANT v2 - Cache Utilities
+Bounded LRU cache dengan TTL opsional untuk data per chat / per user
+Created by: VZLfxs @Lutpan
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterator, Optional
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    LRU cache sederhana:
+    - maxsize: jumlah entry maksimal, entry paling lama tidak dipakai dibuang
+    - ttl: umur entry (detik), None = tidak pernah expired
+    - on_evict: callback(key, value) saat entry dibuang karena penuh/expired
+    """
+
+    __slots__ = ("maxsize", "ttl", "on_evict", "_data", "hits", "misses")
+
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = None,
+                 on_evict: Optional[Callable[[Hashable, Any], None]] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self._data: "OrderedDict[Hashable, tuple[Any, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._data))
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        value, expires_at = entry
+        if expires_at and expires_at <= time.monotonic():
+            del self._data[key]
+            self._evicted(key, value)
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        self._data[key] = (value, time.monotonic() + ttl if ttl else 0.0)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            old_key, (old_value, _) = self._data.popitem(last=False)
+            self._evicted(old_key, old_value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def purge_expired(self) -> int:
+        """Buang semua entry expired, return jumlahnya"""
+        now = time.monotonic()
+        expired = [key for key, (_, expires_at) in self._data.items() if expires_at and expires_at <= now]
+        for key in expired:
+            value, _ = self._data.pop(key)
+            self._evicted(key, value)
+        return len(expired)
+
+    def _evicted(self, key: Hashable, value: Any) -> None:
+        if self.on_evict is not None:
+            self.on_evict(key, value)
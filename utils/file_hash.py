@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+VZOEL ASSISTANT v2 - File Hash
+sha256 isi file, di-memo per (path, mtime_ns, size) supaya file besar tidak di-hash ulang
+Created by: VZLfxs @Lutpan
+"""
+
+import hashlib
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+_CHUNK_SIZE = 1 << 16
+
+_hashes: Dict[str, Tuple[int, int, str]] = {}
+_lock = threading.Lock()
+
+
+def file_sha256(path: str) -> Optional[str]:
+    """sha256 hex isi file, None kalau file tidak ada / tidak terbaca"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    with _lock:
+        cached = _hashes.get(path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+
+    sha = digest.hexdigest()
+    with _lock:
+        _hashes[path] = (stat.st_mtime_ns, stat.st_size, sha)
+    return sha
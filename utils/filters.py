@@ -9,6 +9,7 @@ import os
 from pyrogram import filters
 from pyrogram.types import Message
 from dotenv import load_dotenv
+from helper_config import get_config_service
 
 # Load environment variables
 load_dotenv()
@@ -48,16 +49,9 @@ def vzoel_command(commands):
 
 def is_sudo_user(user_id: int) -> bool:
     """Check if user is sudo/admin"""
-    sudo_users = os.getenv("SUDO_USER_IDS", "").split(",")
-    developer_ids = os.getenv("DEVELOPER_IDS", "").split(",")
-    founder_id = os.getenv("FOUNDER_ID", "0")
-    
-    # Clean and convert to int
-    sudo_users = [int(uid.strip()) for uid in sudo_users if uid.strip().isdigit()]
-    developer_ids = [int(uid.strip()) for uid in developer_ids if uid.strip().isdigit()]
-    founder_id = int(founder_id) if founder_id.isdigit() else 0
-    
-    return user_id in sudo_users or user_id in developer_ids or user_id == founder_id
+    # FOUNDER_ID + DEVELOPER_IDS + SUDO_USER_IDS dari env (config.json hanya
+    # kalau SUDO_FROM_CONFIG=1) sudah jadi frozenset di snapshot - lookup O(1)
+    return user_id in get_config_service().snapshot.sudo_ids
 
 def sudo_only():
     """Filter for sudo users only"""
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+VZOEL ASSISTANT v2 - Startup Profiler
+Per-phase timing and per-module import time breakdown for --startup-report
+Created by: VZLfxs @Lutpan
+"""
+
+import sys
+import time
+import importlib.abc
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wrap a module loader and time exec_module (inclusive + self time)"""
+
+    def __init__(self, loader, profiler: "StartupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter_import()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit_import(module.__name__, time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Meta path finder that wraps every found spec with _TimedLoader"""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+        self._resolving = set()
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname in self._resolving:
+            return None
+        self._resolving.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self._profiler)
+                    return spec
+            return None
+        finally:
+            self._resolving.discard(fullname)
+
+
+class StartupProfiler:
+    """
+    Startup profiler:
+    - phase(name): context manager untuk timing tiap fase startup
+    - enable(): pasang import timer di sys.meta_path
+    - report(): breakdown fase + module import paling lambat
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self.imports: Dict[str, Tuple[float, float]] = {}
+        self._child_time: List[float] = []
+        self._timer: Optional[_ImportTimer] = None
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+        self.enabled = True
+        self._timer = _ImportTimer(self)
+        sys.meta_path.insert(0, self._timer)
+
+    def disable(self) -> None:
+        if self._timer in sys.meta_path:
+            sys.meta_path.remove(self._timer)
+        self._timer = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a startup phase (no-op overhead when profiler disabled)"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def _enter_import(self) -> None:
+        self._child_time.append(0.0)
+
+    def _exit_import(self, name: str, elapsed: float) -> None:
+        children = self._child_time.pop()
+        self.imports[name] = (elapsed, max(elapsed - children, 0.0))
+        if self._child_time:
+            self._child_time[-1] += elapsed
+
+    def report(self, top: int = 25) -> str:
+        """Format startup report (phases + top modules by self import time)"""
+        total = time.perf_counter() - self.origin
+        lines = [
+            "",
+            "📊 **STARTUP REPORT**",
+            f"  • Total sejak proses mulai: {total * 1000:.1f}ms",
+            f"  • Module di-import: {len(self.imports)}",
+            "",
+            "⏱️ Phases:",
+        ]
+        for name, elapsed in self.phases:
+            lines.append(f"  {elapsed * 1000:9.1f}ms  {name}")
+
+        lines += ["", f"📦 Top {top} imports (self / inclusive):"]
+        slowest = sorted(self.imports.items(), key=lambda item: item[1][1], reverse=True)[:top]
+        for name, (inclusive, self_time) in slowest:
+            lines.append(f"  {self_time * 1000:9.1f}ms / {inclusive * 1000:9.1f}ms  {name}")
+
+        # Ringkasan per top-level package (pyrogram, PIL, aiohttp, plugins, ...)
+        packages: Dict[str, float] = {}
+        for name, (_, self_time) in self.imports.items():
+            root = name.split(".", 1)[0]
+            packages[root] = packages.get(root, 0.0) + self_time
+        lines += ["", "🗂️ Per package (self time):"]
+        for root, elapsed in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+            lines.append(f"  {elapsed * 1000:9.1f}ms  {root}")
+
+        return "\n".join(lines)
+
+
+# Global profiler instance (disabled sampai --startup-report)
+startup_profiler = StartupProfiler()